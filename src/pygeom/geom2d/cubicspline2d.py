@@ -1,7 +1,8 @@
 from typing import TYPE_CHECKING
 
-from numpy import asarray, cumsum, full, logical_and, zeros
+from numpy import asarray, cumsum, full, linspace, logical_and, zeros
 
+from ..tools.arclength import ArcLengthCurve
 from ..tools.basis import knot_linspace
 from ..tools.solvers import cubic_pspline_fit_solver
 from .vector2d import Vector2D
@@ -13,7 +14,7 @@ if TYPE_CHECKING:
 BCSTR1 = ('quadratic', 'not-a-knot', 'natural', 'clamped', 'periodic')
 BCSTR2 = ('quadratic', 'not-a-knot', 'natural', 'clamped')
 
-class CubicSpline2D():
+class CubicSpline2D(ArcLengthCurve):
     u"""This class stores a 2D parametric cubic spline."""
     points: Vector2D = None
     bctype: 'BCLike' = None
@@ -242,6 +243,10 @@ class CubicSpline2D():
         normals = Vector2D(-tangents.y, tangents.x)
         return normals
 
+    @property
+    def arclength_breaks(self) -> 'NDArray':
+        return self.s
+
     def evaluate_t(self, num: int) -> 'NDArray':
         return knot_linspace(num, self.s)
 
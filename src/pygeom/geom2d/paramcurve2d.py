@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 
 from numpy import linspace
 
+from ..tools.arclength import ArcLengthCurve
+from ..tools.tessellate import tessellate_curve
 from .vector2d import Vector2D
 
 if TYPE_CHECKING:
@@ -10,10 +12,11 @@ if TYPE_CHECKING:
     ParamCallable = Callable[['NDArray'], Vector2D]
 
 
-class ParamCurve2D():
+class ParamCurve2D(ArcLengthCurve):
     ru: 'ParamCallable' = None
     drdu: 'ParamCallable' = None
     d2rdu2: 'ParamCallable' = None
+    arclength_num: int = 16
 
     def __init__(self, ru: 'ParamCallable',
                  drdu: 'ParamCallable | None' = None,
@@ -47,6 +50,7 @@ class ParamCurve2D():
         d2rdu2 = self.evaluate_second_derivatives_at_t(u)
         return drdu.cross(d2rdu2)/drdu.return_magnitude()**3
 
+
     def evaluate_t(self, num: int) -> 'NDArray':
         return linspace(0.0, 1.0, num + 1)
 
@@ -75,5 +79,21 @@ class ParamCurve2D():
         u = self.evaluate_t(num)
         return self.evaluate_curvatures_at_t(u)
 
+    def evaluate_t_adaptive(self, tol: float, angtol: float | None = None,
+                            num: int = 8, maxiter: int = 16) -> 'NDArray':
+        """Returns parameters refined until every segment is within tol of
+        the curve and turns by no more than angtol radians."""
+        u = self.evaluate_t(num)
+        u, _ = tessellate_curve(self.evaluate_points_at_t, u, tol,
+                                angtol=angtol, maxiter=maxiter)
+        return u
+
+    def evaluate_points_adaptive(self, tol: float, angtol: float | None = None,
+                                 num: int = 8, maxiter: int = 16) -> Vector2D:
+        u = self.evaluate_t(num)
+        _, pnts = tessellate_curve(self.evaluate_points_at_t, u, tol,
+                                   angtol=angtol, maxiter=maxiter)
+        return pnts
+
     def __repr__(self) -> str:
         return f'<ParamCurve2D>'
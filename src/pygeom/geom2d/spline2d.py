@@ -2,9 +2,10 @@ from typing import TYPE_CHECKING
 
 from matplotlib.axes import Axes
 from matplotlib.pyplot import figure
-from numpy import asarray, concatenate, linspace, zeros
+from numpy import asarray, concatenate, linspace, logical_and, zeros
 
 from ..geom2d import Vector2D
+from ..tools.arclength import ArcLengthCurve
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -376,7 +377,7 @@ class SplinePanel2D():
     def __repr__(self) -> str:
         return '<SplinePanel2D>'
 
-class Spline2D():
+class Spline2D(ArcLengthCurve):
     u"""This class stores a 3D parametric spline."""
     pnts: list[SplinePoint2D] = None
     closed: bool = False
@@ -787,5 +788,37 @@ class Spline2D():
         #         spline2.pnls[i].set_straight_edge()
         return spline1, spline2
 
+    def evaluate_points_at_t(self, s: 'NDArray') -> Vector2D:
+        u"""This function evaluates the spline at the spline lengths s."""
+        s = asarray(s, dtype=float)
+        pnts = Vector2D.zeros(s.shape)
+        sa = 0.0
+        for pnl in self.pnls:
+            sb = sa + pnl.length
+            s_check = logical_and(s >= sa, s <= sb)
+            pnts[s_check] = pnl.ratio_point_interpolate((s[s_check] - sa)/pnl.length)
+            sa = sb
+        return pnts
+
+    def evaluate_first_derivatives_at_t(self, s: 'NDArray') -> Vector2D:
+        u"""This function evaluates the gradient of the spline at the spline lengths s."""
+        s = asarray(s, dtype=float)
+        grds = Vector2D.zeros(s.shape)
+        sa = 0.0
+        for pnl in self.pnls:
+            sb = sa + pnl.length
+            s_check = logical_and(s >= sa, s <= sb)
+            grds[s_check] = pnl.ratio_gradient_interpolate((s[s_check] - sa)/pnl.length)
+            sa = sb
+        return grds
+
+    def evaluate_tangents_at_t(self, s: 'NDArray') -> Vector2D:
+        u"""This function evaluates the unit tangent of the spline at the spline lengths s."""
+        return self.evaluate_first_derivatives_at_t(s).to_unit()
+
+    @property
+    def arclength_breaks(self) -> 'NDArray':
+        return self.s
+
     def __repr__(self) -> str:
         return '<Spline2D>'
@@ -1,13 +1,22 @@
 from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
-from numpy import (allclose, bool_, copy, cos, full, isclose, logical_and,
-                   logical_or, ndim, ravel, repeat, reshape, result_type,
-                   shape, sin, size, split, sum, transpose, zeros)
+from numpy import (allclose, asarray, bool_, copy, cos, divide, full, isclose,
+                   logical_and, logical_or, ndim, ravel, repeat, reshape,
+                   result_type, shape, sin, size, split, stack, sum, transpose,
+                   zeros)
+from numpy import load as load_npy
+from numpy import save as save_npy
+
+from ..tools.precision import get_float_dtype
 
 if TYPE_CHECKING:
+    from os import PathLike
+
     from numpy.typing import DTypeLike, NDArray
 
+    from .vector2d import Vector2D
+
 
 class Tensor2D():
     """Tensor2D Class"""
@@ -84,6 +93,42 @@ class Tensor2D():
             err = 'Vector2D object can only be subtracted from Vector2D object.'
             raise TypeError(err)
 
+    def __iadd__(self, obj: 'Tensor2D') -> 'Tensor2D':
+        try:
+            self.xx += obj.xx
+            self.xy += obj.xy
+            self.yx += obj.yx
+            self.yy += obj.yy
+            return self
+        except AttributeError:
+            err = 'Tensor2D object can only be added to Tensor2D object.'
+            raise TypeError(err)
+
+    def __isub__(self, obj: 'Tensor2D') -> 'Tensor2D':
+        try:
+            self.xx -= obj.xx
+            self.xy -= obj.xy
+            self.yx -= obj.yx
+            self.yy -= obj.yy
+            return self
+        except AttributeError:
+            err = 'Tensor2D object can only be subtracted from Tensor2D object.'
+            raise TypeError(err)
+
+    def __imul__(self, obj: Any) -> 'Tensor2D':
+        self.xx *= obj
+        self.xy *= obj
+        self.yx *= obj
+        self.yy *= obj
+        return self
+
+    def __itruediv__(self, obj: Any) -> 'Tensor2D':
+        self.xx /= obj
+        self.xy /= obj
+        self.yx /= obj
+        self.yy /= obj
+        return self
+
     def __pos__(self) -> 'Tensor2D':
         return self
 
@@ -289,15 +334,60 @@ class Tensor2D():
         syy = c2*tyy + cs*(txy + tyx) + s2*txx
         return Tensor2D(sxx, sxy, syx, syy)
 
+    def det(self) -> 'NDArray':
+        """Returns the determinants of the tensors."""
+        return self.xx*self.yy - self.xy*self.yx
+
+    def inverse(self) -> 'Tensor2D':
+        """Returns the inverses of the tensors, which are zero where the
+        tensor is singular."""
+        det = asarray(self.det())
+        rdet = divide(1.0, det, out=zeros(det.shape, dtype=result_type(det, 1.0)),
+                      where=det != 0.0)
+        return Tensor2D(self.yy*rdet, -self.xy*rdet, -self.yx*rdet, self.xx*rdet)
+
+    def solve(self, vector: 'Vector2D') -> 'Vector2D':
+        """Returns the solutions of the tensors times x equal to vector,
+        which are zero where the tensor is singular."""
+        inv = self.inverse()
+        x = inv.xx*vector.x + inv.xy*vector.y
+        y = inv.yx*vector.x + inv.yy*vector.y
+        return vector.__class__(x, y)
+
     @classmethod
     def zeros(cls, shape: tuple[int, ...] = (),
               **kwargs: dict[str, Any]) -> 'Tensor2D':
+        kwargs.setdefault('dtype', get_float_dtype())
         xx = zeros(shape, **kwargs)
         xy = zeros(shape, **kwargs)
         yx = zeros(shape, **kwargs)
         yy = zeros(shape, **kwargs)
         return cls(xx, xy, yx, yy)
 
+    @classmethod
+    def from_array(cls, arr: 'NDArray') -> 'Tensor2D':
+        """Returns a tensor whose components are views of a (..., 2, 2) array."""
+        arr = asarray(arr)
+        if arr.ndim < 2 or arr.shape[-2:] != (2, 2):
+            raise ValueError('Tensor2D array must have last axes of size (2, 2).')
+        return cls(arr[..., 0, 0], arr[..., 0, 1], arr[..., 1, 0], arr[..., 1, 1])
+
+    def as_array(self) -> 'NDArray':
+        """Returns the tensor as a (..., 2, 2) array."""
+        row0 = stack((self.xx, self.xy), axis=-1)
+        row1 = stack((self.yx, self.yy), axis=-1)
+        return stack((row0, row1), axis=-2)
+
+    def save(self, file: 'str | PathLike') -> None:
+        """Saves the tensor to a .npy file as a (..., 2, 2) array."""
+        save_npy(file, self.as_array())
+
+    @classmethod
+    def load(cls, file: 'str | PathLike', mmap_mode: str | None = None) -> 'Tensor2D':
+        """Loads a tensor saved with save, memory mapping the file if mmap_mode
+        is given so that only the parts indexed are read."""
+        return cls.from_array(load_npy(file, mmap_mode=mmap_mode))
+
     @classmethod
     def fromiter(cls, tens: Iterable['Tensor2D'],
                  **kwargs: dict[str, Any]) -> 'Tensor2D':
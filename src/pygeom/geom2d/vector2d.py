@@ -1,17 +1,50 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from types import NotImplementedType
 from typing import TYPE_CHECKING, Any
 
-from numpy import (allclose, arctan2, asarray, concatenate, copy, cos, divide,
-                   full, hstack, isclose, logical_and, logical_or, matmul,
-                   multiply, ndim, ravel, repeat, reshape, result_type, shape,
-                   sin, size, split, sqrt, stack, sum, transpose, zeros)
-from numpy.linalg import solve
+from numpy import (allclose, arctan2, asarray, ascontiguousarray, concatenate,
+                   copy, copyto, cos, divide, full, hstack, isclose,
+                   logical_and, logical_not, logical_or, multiply, ndarray,
+                   ndim, ravel, repeat, reshape, result_type, shape,
+                   shares_memory, sin, size, split, sqrt, stack, sum,
+                   transpose, zeros)
+from numpy import load as load_npy
+from numpy import save as save_npy
+from numpy.lib.stride_tricks import as_strided
+
+from ..tools.componentwise import componentwise_function, componentwise_ufunc
+from ..tools.linsolve import linear_solve
+from ..tools.precision import get_float_dtype
 
 if TYPE_CHECKING:
+    from os import PathLike
+
     from numpy import bool_, complex128, ufunc
     from numpy.typing import DTypeLike, NDArray
 
+    from ..tools.linsolve import VectorSolver
+
+
+def _shape_tuple(shape: 'int | Iterable[int]') -> tuple[int, ...]:
+    if isinstance(shape, Iterable):
+        return tuple(shape)
+    return (shape, )
+
+def _leading_key(key: Any) -> bool:
+    """Returns True if key only indexes the leading axes of an array."""
+    if not isinstance(key, tuple):
+        key = (key, )
+    return all(k is not Ellipsis and k is not None for k in key)
+
+def _rebuild_vector2d(cls: type['Vector2D'], xyarr: 'NDArray',
+                      state: dict[str, Any] | None) -> 'Vector2D':
+    vector = cls.__new__(cls)
+    vector.x = xyarr[..., 0]
+    vector.y = xyarr[..., 1]
+    if state:
+        vector.__dict__.update(state)
+    return vector
+
 
 class Vector2D:
     """Vector2D Class"""
@@ -24,30 +57,44 @@ class Vector2D:
         self.x = x
         self.y = y
 
-    def return_magnitude(self) -> 'NDArray':
+    def return_magnitude(self, out: 'NDArray | None' = None) -> 'NDArray':
         """Returns the magnitude of this vector"""
-        return sqrt(self.dot(self))
-
-    def to_unit(self, return_magnitude: bool = False) -> 'Vector2D | tuple[Vector2D, NDArray]':
-        """Returns the unit vector of this vector"""
+        if out is None:
+            return sqrt(self.dot(self))
+        self.dot(self, out=out)
+        return sqrt(out, out=out)
+
+    def to_unit(self, return_magnitude: bool = False,
+                out: 'Vector2D | None' = None) -> 'Vector2D | tuple[Vector2D, NDArray]':
+        """Returns the unit vector of this vector, written to out if given"""
         mag = self.return_magnitude()
-        x = zeros(shape(mag))
-        y = zeros(shape(mag))
         magnot0 = mag != 0.0
-        divide(self.x, mag, out=x, where=magnot0)
-        divide(self.y, mag, out=y, where=magnot0)
+        if out is None:
+            dtyp = result_type(mag)
+            out = Vector2D(zeros(shape(mag), dtype=dtyp),
+                           zeros(shape(mag), dtype=dtyp))
+        elif not magnot0.all():
+            magis0 = logical_not(magnot0)
+            copyto(out.x, 0.0, where=magis0)
+            copyto(out.y, 0.0, where=magis0)
+        divide(self.x, mag, out=out.x, where=magnot0)
+        divide(self.y, mag, out=out.y, where=magnot0)
         if return_magnitude:
-            return Vector2D(x, y), mag
+            return out, mag
         else:
-            return Vector2D(x, y)
+            return out
 
     def to_xy(self) -> tuple['NDArray', 'NDArray']:
         """Returns the x and y values of this vector"""
         return self.x, self.y
 
-    def dot(self, vector: 'Vector2D') -> 'NDArray':
+    def dot(self, vector: 'Vector2D', out: 'NDArray | None' = None) -> 'NDArray':
         try:
-            return self.x*vector.x + self.y*vector.y
+            if out is None:
+                return self.x*vector.x + self.y*vector.y
+            multiply(self.x, vector.x, out=out)
+            out += self.y*vector.y
+            return out
         except AttributeError:
             err = 'Vector2D dot product must be with Vector2D object.'
             raise TypeError(err)
@@ -59,9 +106,17 @@ class Vector2D:
             err = 'Vector2D dot product must be with Vector2D object.'
             raise TypeError(err)
 
-    def cross(self, vector: 'Vector2D') -> 'NDArray':
+    def cross(self, vector: 'Vector2D', out: 'NDArray | None' = None) -> 'NDArray':
         try:
-            return self.x*vector.y - self.y*vector.x
+            if out is None:
+                return self.x*vector.y - self.y*vector.x
+            comps = (self.x, self.y, vector.x, vector.y)
+            if any(shares_memory(out, comp) for comp in comps):
+                out[...] = self.x*vector.y - self.y*vector.x
+                return out
+            multiply(self.x, vector.y, out=out)
+            out -= self.y*vector.x
+            return out
         except AttributeError:
             err = 'Vector2D cross product must be with Vector2D object.'
             raise TypeError(err)
@@ -119,6 +174,34 @@ class Vector2D:
             err = f'{self.__class__.__qualname__:s} object can only be subtracted from Vector2D object.'
             raise TypeError(err)
 
+    def __iadd__(self, obj: 'Vector2D') -> 'Vector2D':
+        try:
+            self.x += obj.x
+            self.y += obj.y
+            return self
+        except AttributeError:
+            err = 'Vector2D object can only be added to Vector2D object.'
+            raise TypeError(err)
+
+    def __isub__(self, obj: 'Vector2D') -> 'Vector2D':
+        try:
+            self.x -= obj.x
+            self.y -= obj.y
+            return self
+        except AttributeError:
+            err = 'Vector2D object can only be subtracted from Vector2D object.'
+            raise TypeError(err)
+
+    def __imul__(self, obj: Any) -> 'Vector2D':
+        self.x *= obj
+        self.y *= obj
+        return self
+
+    def __itruediv__(self, obj: Any) -> 'Vector2D':
+        self.x /= obj
+        self.y /= obj
+        return self
+
     def __pos__(self) -> 'Vector2D':
         return self
 
@@ -165,7 +248,17 @@ class Vector2D:
             err = 'Vector2D object can only be matrix multiplied by a numpy ndarray.'
             raise TypeError(err)
 
+    def rmatmul(self, mat: Any) -> 'Vector2D':
+        """Returns the matrix product of mat with this vector, which also
+        works for sparse matrices that do not defer their @ operator."""
+        return Vector2D(mat@self.x, mat@self.y)
+
     def __getitem__(self, key) -> 'Vector2D':
+        xyarr = self._xy_array()
+        if xyarr is not None and _leading_key(key):
+            xyarr = xyarr[key]
+            if xyarr.ndim > 1:
+                return Vector2D.from_xy_array(xyarr)
         x = self.x[key]
         y = self.y[key]
         return Vector2D(x, y)
@@ -181,6 +274,48 @@ class Vector2D:
     def stack_xy(self) -> 'NDArray':
         return stack((self.x, self.y), axis=-1)
 
+    def _xy_array(self) -> 'NDArray | None':
+        """Returns the (..., 2) array the x and y arrays are views of
+        or None if they are not interleaved in a single buffer."""
+        x, y = self.x, self.y
+        if not isinstance(x, ndarray) or not isinstance(y, ndarray):
+            return None
+        if y.dtype != x.dtype or y.shape != x.shape or y.strides != x.strides:
+            return None
+        step = x.itemsize
+        addr = x.__array_interface__['data'][0]
+        if y.__array_interface__['data'][0] != addr + step:
+            return None
+        for size, stride in zip(x.shape, x.strides):
+            if size > 1 and abs(stride) < 2*step:
+                return None
+        return as_strided(x, shape=x.shape + (2,), strides=x.strides + (step,),
+                          writeable=x.flags.writeable)
+
+    def as_xy_array(self) -> 'NDArray':
+        """Returns the vector as a (..., 2) array without copying when it is
+        stored interleaved, otherwise the components are stacked."""
+        xyarr = self._xy_array()
+        if xyarr is None:
+            xyarr = self.stack_xy()
+        return xyarr
+
+    @property
+    def interleaved(self) -> bool:
+        return self._xy_array() is not None
+
+    def __reduce_ex__(self, protocol: int) -> tuple[Any, ...]:
+        """Pickles array vectors as a single contiguous (..., 2) array, which
+        pickle protocol 5 can pass out of band."""
+        x, y = self.x, self.y
+        if not all(isinstance(comp, ndarray) for comp in (x, y)):
+            return super().__reduce_ex__(protocol)
+        if x.dtype != y.dtype or x.shape != y.shape:
+            return super().__reduce_ex__(protocol)
+        xyarr = ascontiguousarray(self.as_xy_array())
+        state = getattr(self, '__dict__', None)
+        return _rebuild_vector2d, (self.__class__, xyarr, state)
+
     @property
     def shape(self) -> tuple[int, ...]:
         shape_x = shape(self.x)
@@ -228,20 +363,37 @@ class Vector2D:
         return Vector2D(x, y)
 
     def reshape(self, shape, order='C') -> 'Vector2D':
+        xyarr = self._xy_array()
+        if xyarr is not None and order == 'C':
+            return Vector2D.from_xy_array(xyarr.reshape(_shape_tuple(shape) + (2,)))
         x = reshape(self.x, shape, order=order)
         y = reshape(self.y, shape, order=order)
         return Vector2D(x, y)
 
     def ravel(self, order='C') -> 'Vector2D':
+        xyarr = self._xy_array()
+        if xyarr is not None and order == 'C':
+            return Vector2D.from_xy_array(xyarr.reshape((-1, 2)))
         x = ravel(self.x, order=order)
         y = ravel(self.y, order=order)
         return Vector2D(x, y)
 
     def copy(self, order='C') -> 'Vector2D':
+        xyarr = self._xy_array()
+        if xyarr is not None:
+            return Vector2D.from_xy_array(copy(xyarr, order=order))
         x = copy(self.x, order=order)
         y = copy(self.y, order=order)
         return Vector2D(x, y)
 
+    def astype(self, dtype: 'DTypeLike', copy: bool = True) -> 'Vector2D':
+        xyarr = self._xy_array()
+        if xyarr is not None:
+            return Vector2D.from_xy_array(xyarr.astype(dtype, copy=copy))
+        x = asarray(self.x).astype(dtype, copy=copy)
+        y = asarray(self.y).astype(dtype, copy=copy)
+        return Vector2D(x, y)
+
     def split(self, numsect: int, axis: int=-1) -> Iterable['Vector2D']:
         xlst = split(self.x, numsect, axis=axis)
         ylst = split(self.y, numsect, axis=axis)
@@ -300,10 +452,31 @@ class Vector2D:
     @classmethod
     def zeros(cls, shape: tuple[int, ...] = (),
               **kwargs: dict[str, Any]) -> 'Vector2D':
+        kwargs.setdefault('dtype', get_float_dtype())
         x = zeros(shape, **kwargs)
         y = zeros(shape, **kwargs)
         return cls(x, y)
 
+    @classmethod
+    def from_xy_array(cls, xyarr: 'NDArray') -> 'Vector2D':
+        """Returns a vector whose x and y are views of a (..., 2) array."""
+        xyarr = asarray(xyarr)
+        if xyarr.ndim == 0 or xyarr.shape[-1] != 2:
+            raise ValueError('Vector2D xy array must have a last axis of size 2.')
+        x = xyarr[..., 0]
+        y = xyarr[..., 1]
+        return cls(x, y)
+
+    def save(self, file: 'str | PathLike') -> None:
+        """Saves the vector to a .npy file as a (..., 2) array."""
+        save_npy(file, self.as_xy_array())
+
+    @classmethod
+    def load(cls, file: 'str | PathLike', mmap_mode: str | None = None) -> 'Vector2D':
+        """Loads a vector saved with save, memory mapping the file if mmap_mode
+        is given so that only the parts indexed are read."""
+        return cls.from_xy_array(load_npy(file, mmap_mode=mmap_mode))
+
     @classmethod
     def from_iter(cls, vecs: Iterable['Vector2D'],
                  **kwargs: dict[str, Any]) -> 'Vector2D':
@@ -387,34 +560,24 @@ class Vector2D:
         yclose = allclose(self.y, obj.y, rtol=rtol, atol=atol)
         return xclose and yclose
 
-    def solve(self, amat: 'NDArray') -> 'Vector2D':
+    def solve(self, amat: 'NDArray | VectorSolver') -> 'Vector2D':
+        """Returns the solution of amat x = self along the first axis. Any
+        trailing axes are solved as a batch of right hand sides."""
         shp = self.shape
         if self.ndim == 0:
             bvec = self.reshape((1, 1))
-        elif self.ndim == 1:
-            bvec = self.reshape((self.size, 1))
-        elif self.ndim == 2:
-            bvec = self
         else:
-            raise ValueError('Vector2D cannot be solved.')
+            bvec = self.reshape((shp[0], -1))
         bmat = hstack(bvec.to_xy())
-        cmat = solve(amat, bmat)
+        cmat = linear_solve(amat, bmat)
         cvec = Vector2D(*split(cmat, 2, axis=1)).reshape(shp)
         return cvec
 
     def __array_ufunc__(self, ufunc: 'ufunc', method: str,
                         *inputs: tuple['NDArray | Vector2D', ...],
                         **kwargs: dict[str, Any]) -> 'Vector2D | NotImplementedType':
-        if method == '__call__':
-            if ufunc is multiply:
-                if inputs[1] is self:
-                    return self.__rmul__(inputs[0], **kwargs)
-                else:
-                    return NotImplemented
-            elif ufunc is matmul:
-                if inputs[1] is self:
-                    return self.__rmatmul__(inputs[0], **kwargs)
-                else:
-                    return NotImplemented
-        else:
-            return NotImplemented
+        return componentwise_ufunc(Vector2D, 'xy', ufunc, method, inputs, kwargs)
+
+    def __array_function__(self, func: 'Callable[..., Any]', types: tuple[type, ...],
+                           args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        return componentwise_function(Vector2D, 'xy', func, args, kwargs)
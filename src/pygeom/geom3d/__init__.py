@@ -17,6 +17,7 @@ from .paramcurve import ParamCurve as ParamCurve
 from .paramsurface import ParamSurface as ParamSurface
 from .plane import Plane as Plane
 from .point import Point as Point
+from .tensor import Tensor as Tensor
 from .transform import Transform as Transform
 from .vector import Vector as Vector
 
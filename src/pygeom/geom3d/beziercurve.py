@@ -4,6 +4,8 @@ from numpy import linspace
 
 from ..tools.bernstein import (bernstein_first_derivatives,
                                     bernstein_polynomials)
+from ..tools.precision import get_float_dtype
+from ..tools.tessellate import tessellate_curve
 
 from .vector import Vector
 
@@ -41,13 +43,29 @@ class BezierCurve():
         return tangents
 
     def evaluate_points(self, num: int) -> Vector:
-        t = linspace(0.0, 1.0, num)
+        t = linspace(0.0, 1.0, num, dtype=get_float_dtype())
         return self.evaluate_points_at_t(t)
 
     def evaluate_tangents(self, num: int) -> Vector:
-        t = linspace(0.0, 1.0, num)
+        t = linspace(0.0, 1.0, num, dtype=get_float_dtype())
         return self.evaluate_tangents_at_t(t)
 
+    def evaluate_t_adaptive(self, tol: float, angtol: float | None = None,
+                            num: int = 4, maxiter: int = 16) -> 'NDArray':
+        """Returns parameters refined until every segment is within tol of
+        the curve and turns by no more than angtol radians."""
+        t = linspace(0.0, 1.0, num, dtype=get_float_dtype())
+        t, _ = tessellate_curve(self.evaluate_points_at_t, t, tol,
+                                angtol=angtol, maxiter=maxiter)
+        return t
+
+    def evaluate_points_adaptive(self, tol: float, angtol: float | None = None,
+                                 num: int = 4, maxiter: int = 16) -> Vector:
+        t = linspace(0.0, 1.0, num, dtype=get_float_dtype())
+        _, pnts = tessellate_curve(self.evaluate_points_at_t, t, tol,
+                                   angtol=angtol, maxiter=maxiter)
+        return pnts
+
 
 class RationalBezierCurve():
     ctlpnts: Vector = None
@@ -103,9 +121,25 @@ class RationalBezierCurve():
         return tangents
 
     def evaluate_points(self, num: int) -> Vector:
-        t = linspace(0.0, 1.0, num)
+        t = linspace(0.0, 1.0, num, dtype=get_float_dtype())
         return self.evaluate_points_at_t(t)
 
     def evaluate_tangents(self, num: int) -> Vector:
-        t = linspace(0.0, 1.0, num)
+        t = linspace(0.0, 1.0, num, dtype=get_float_dtype())
         return self.evaluate_tangents_at_t(t)
+
+    def evaluate_t_adaptive(self, tol: float, angtol: float | None = None,
+                            num: int = 4, maxiter: int = 16) -> 'NDArray':
+        """Returns parameters refined until every segment is within tol of
+        the curve and turns by no more than angtol radians."""
+        t = linspace(0.0, 1.0, num, dtype=get_float_dtype())
+        t, _ = tessellate_curve(self.evaluate_points_at_t, t, tol,
+                                angtol=angtol, maxiter=maxiter)
+        return t
+
+    def evaluate_points_adaptive(self, tol: float, angtol: float | None = None,
+                                 num: int = 4, maxiter: int = 16) -> Vector:
+        t = linspace(0.0, 1.0, num, dtype=get_float_dtype())
+        _, pnts = tessellate_curve(self.evaluate_points_at_t, t, tol,
+                                   angtol=angtol, maxiter=maxiter)
+        return pnts
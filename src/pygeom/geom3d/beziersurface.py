@@ -1,15 +1,28 @@
 from typing import TYPE_CHECKING
 
-from numpy import linspace
+from numpy import linspace, ravel, shape
 
 from ..tools.bernstein import (bernstein_first_derivatives,
                                     bernstein_polynomials)
+from ..tools.precision import get_float_dtype
+from ..tools.tessellate import tessellate_surface
 
 from .vector import Vector
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+    from ..tools.mesh import Mesh
+
+
+def _mesh_product(ctl: 'Vector | NDArray', Bu: 'NDArray',
+                  Bv: 'NDArray') -> 'Vector | NDArray':
+    """Returns the tensor product of ctl with the polynomials of paired
+    u and v values."""
+    Bu = Bu.reshape(Bu.shape[0], -1)
+    Bv = Bv.reshape(Bv.shape[0], -1)
+    return ((ctl.transpose()@Bu)*Bv).sum(axis=0)
+
 
 class BezierSurface():
     ctlpnts: Vector = None
@@ -55,6 +68,14 @@ class BezierSurface():
             points = points[0]
         return points
 
+    def evaluate_points_at_uv_mesh(self, um: 'NDArray', vm: 'NDArray') -> Vector:
+        shp = shape(um)
+        if shp != shape(vm):
+            raise ValueError('The shapes of um and vm must be the same.')
+        Bu, Bv = self.bernstein_polynomials(ravel(um), ravel(vm))
+        points = _mesh_product(self.ctlpnts, Bu, Bv)
+        return points.reshape(shp)
+
     def evaluate_tangents_at_uv(self, u: 'NDArray', v: 'NDArray') -> tuple[Vector,
                                                                            Vector]:
         Bu, Bv = self.bernstein_polynomials(u, v)
@@ -68,16 +89,27 @@ class BezierSurface():
         return tangents_u, tangents_v
 
     def evaluate_points(self, numu: int, numv: int) -> Vector:
-        u = linspace(0.0, 1.0, numu)
-        v = linspace(0.0, 1.0, numv)
+        u = linspace(0.0, 1.0, numu, dtype=get_float_dtype())
+        v = linspace(0.0, 1.0, numv, dtype=get_float_dtype())
         return self.evaluate_points_at_uv(u, v)
 
     def evaluate_tangents(self, numu: int, numv: int) -> tuple[Vector,
                                                                Vector]:
-        u = linspace(0.0, 1.0, numu)
-        v = linspace(0.0, 1.0, numv)
+        u = linspace(0.0, 1.0, numu, dtype=get_float_dtype())
+        v = linspace(0.0, 1.0, numv, dtype=get_float_dtype())
         return self.evaluate_tangents_at_uv(u, v)
 
+    def evaluate_mesh_adaptive(self, tol: float, angtol: float | None = None,
+                               numu: int = 2, numv: int = 2,
+                               maxlevel: int = 8) -> 'Mesh':
+        """Returns a mesh of quads and triangles refined until every cell is
+        within tol of the surface and turns by no more than angtol radians."""
+        u = linspace(0.0, 1.0, numu, dtype=get_float_dtype())
+        v = linspace(0.0, 1.0, numv, dtype=get_float_dtype())
+        mesh, _, _ = tessellate_surface(self.evaluate_points_at_uv_mesh, u, v,
+                                        tol, angtol=angtol, maxlevel=maxlevel)
+        return mesh
+
 
 class RationalBezierSurface():
     ctlpnts: Vector = None
@@ -136,6 +168,16 @@ class RationalBezierSurface():
             points = points[0]
         return points
 
+    def evaluate_points_at_uv_mesh(self, um: 'NDArray', vm: 'NDArray') -> Vector:
+        shp = shape(um)
+        if shp != shape(vm):
+            raise ValueError('The shapes of um and vm must be the same.')
+        Bu, Bv = self.bernstein_polynomials(ravel(um), ravel(vm))
+        numer = _mesh_product(self.wpoints, Bu, Bv)
+        denom = _mesh_product(self.weights, Bu, Bv)
+        points = numer/denom
+        return points.reshape(shp)
+
     def evaluate_tangents_at_uv(self, u: 'NDArray', v: 'NDArray') -> tuple[Vector,
                                                                            Vector]:
         Bu, Bv = self.bernstein_polynomials(u, v)
@@ -155,12 +197,23 @@ class RationalBezierSurface():
         return tangents_u, tangents_v
 
     def evaluate_points(self, numu: int, numv: int) -> Vector:
-        u = linspace(0.0, 1.0, numu)
-        v = linspace(0.0, 1.0, numv)
+        u = linspace(0.0, 1.0, numu, dtype=get_float_dtype())
+        v = linspace(0.0, 1.0, numv, dtype=get_float_dtype())
         return self.evaluate_points_at_uv(u, v)
 
     def evaluate_tangents(self, numu: int, numv: int) -> tuple[Vector,
                                                                Vector]:
-        u = linspace(0.0, 1.0, numu)
-        v = linspace(0.0, 1.0, numv)
+        u = linspace(0.0, 1.0, numu, dtype=get_float_dtype())
+        v = linspace(0.0, 1.0, numv, dtype=get_float_dtype())
         return self.evaluate_tangents_at_uv(u, v)
+
+    def evaluate_mesh_adaptive(self, tol: float, angtol: float | None = None,
+                               numu: int = 2, numv: int = 2,
+                               maxlevel: int = 8) -> 'Mesh':
+        """Returns a mesh of quads and triangles refined until every cell is
+        within tol of the surface and turns by no more than angtol radians."""
+        u = linspace(0.0, 1.0, numu, dtype=get_float_dtype())
+        v = linspace(0.0, 1.0, numv, dtype=get_float_dtype())
+        mesh, _, _ = tessellate_surface(self.evaluate_points_at_uv_mesh, u, v,
+                                        tol, angtol=angtol, maxlevel=maxlevel)
+        return mesh
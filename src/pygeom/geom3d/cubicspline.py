@@ -1,7 +1,8 @@
 from typing import TYPE_CHECKING
 
-from numpy import asarray, cumsum, full, logical_and, zeros
+from numpy import asarray, cumsum, full, linspace, logical_and, zeros
 
+from ..tools.arclength import ArcLengthCurve
 from ..tools.basis import knot_linspace
 from ..tools.solvers import cubic_pspline_fit_solver
 from .vector import Vector
@@ -13,7 +14,7 @@ if TYPE_CHECKING:
 BCSTR1 = ('quadratic', 'not-a-knot', 'natural', 'clamped', 'periodic')
 BCSTR2 = ('quadratic', 'not-a-knot', 'natural', 'clamped')
 
-class CubicSpline():
+class CubicSpline(ArcLengthCurve):
     u"""This class stores a 3D parametric cubic spline."""
     points: Vector = None
     bctype: 'BCLike' = None
@@ -251,6 +252,10 @@ class CubicSpline():
         binormal = curvature.to_unit()
         return binormal
 
+    @property
+    def arclength_breaks(self) -> 'NDArray':
+        return self.s
+
     def evaluate_t(self, num: int) -> 'NDArray':
         return knot_linspace(num, self.s)
 
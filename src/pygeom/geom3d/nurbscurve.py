@@ -1,32 +1,47 @@
 from typing import TYPE_CHECKING, Any
 
-from numpy import concatenate, divide, full, ones
-
-from ..tools.basis import (basis_first_derivatives, basis_functions,
-                           basis_second_derivatives, default_knots,
-                           knot_linspace)
+from numpy import (asarray, column_stack, concatenate, divide, full, linspace,
+                   ones, ravel, sort)
+
+from ..tools.arclength import ArcLengthCurve
+from ..tools.basis import (basis_cache, basis_first_derivatives,
+                           basis_functions, basis_second_derivatives,
+                           basis_sparse_product, default_knots, knot_linspace,
+                           rational_derivatives)
+from ..tools.inversion import SampleGrid, project_points_on_curve
+from ..tools.knots import (bezier_knots, elevate_degree,
+                           knot_refinement_matrix, refine_knot_vector,
+                           split_knot_vector)
+from ..tools.precision import as_float_array, float_type
+from ..tools.segments import PowerSegments
+from ..tools.tessellate import tessellate_curve
 from .vector import Vector
 
 if TYPE_CHECKING:
-    from numpy.typing import NDArray
+    from numpy.typing import DTypeLike, NDArray
 
 
-class NurbsCurve():
+class NurbsCurve(ArcLengthCurve):
     ctlpnts: Vector = None
     weights: 'NDArray' = None
     degree: int = None
     knots: 'NDArray' = None
     endpoint: bool = None
+    segmented: bool = None
     _wpoints: Vector = None
     _cknots: 'NDArray' = None
+    _segments: PowerSegments = None
+    _sample_grid: SampleGrid = None
 
     def __init__(self, ctlpnts: Vector, **kwargs: dict[str, Any]) -> None:
         self.ctlpnts = ctlpnts.ravel()
-        self.weights = kwargs.get('weights', ones(ctlpnts.size)).ravel()
+        weights = ones(ctlpnts.size, dtype=float_type(ctlpnts.dtype))
+        self.weights = kwargs.get('weights', weights).ravel()
         self.degree = kwargs.get('degree', self.ctlpnts.size - 1)
         self.knots = kwargs.get('knots', default_knots(self.ctlpnts.size,
                                                        self.degree))
         self.endpoint = kwargs.get('endpoint', True)
+        self.segmented = kwargs.get('segmented', False)
 
     def reset(self) -> None:
         for attr in self.__dict__:
@@ -39,8 +54,9 @@ class NurbsCurve():
         degree = self.degree
         knots = self.knots.copy()
         endpoint = self.endpoint
+        segmented = self.segmented
         return NurbsCurve(ctlpnts, weights=weights, degree=degree,
-                          knots=knots, endpoint=endpoint)
+                          knots=knots, endpoint=endpoint, segmented=segmented)
 
     @property
     def wpoints(self) -> Vector:
@@ -59,6 +75,18 @@ class NurbsCurve():
                 self._cknots = self.knots
         return self._cknots
 
+    @property
+    def segments(self) -> PowerSegments:
+        if self._segments is None:
+            hpoints = column_stack((self.wpoints.stack_xyz(), self.weights))
+            self._segments = PowerSegments.from_bspline(self.degree,
+                                                        self.cknots, hpoints)
+        return self._segments
+
+    @property
+    def dtype(self) -> 'DTypeLike':
+        return float_type(self.ctlpnts.dtype)
+
     @property
     def rational(self) -> bool:
         check: 'NDArray' = self.weights == 1.0
@@ -67,66 +95,76 @@ class NurbsCurve():
     def basis_functions(self, u: 'NDArray') -> 'NDArray':
         return basis_functions(self.degree, self.cknots, u)
 
+    def basis_functions_sparse(self, u: 'NDArray') -> tuple['NDArray', 'NDArray']:
+        u = as_float_array(u, self.dtype)
+        return basis_cache.basis_functions_sparse(self.degree, self.cknots, u)
+
     def basis_first_derivatives(self, u: 'NDArray') -> 'NDArray':
         return basis_first_derivatives(self.degree, self.cknots, u)
 
     def basis_second_derivatives(self, u: 'NDArray') -> 'NDArray':
         return basis_second_derivatives(self.degree, self.cknots, u)
 
+    def basis_derivatives_sparse(self, u: 'NDArray',
+                                 order: int) -> tuple['NDArray', 'NDArray']:
+        u = as_float_array(u, self.dtype)
+        return basis_cache.basis_derivatives_sparse(self.degree, self.cknots, u, order)
+
     def evaluate_points_at_t(self, u: 'NDArray') -> Vector:
-        Nu = self.basis_functions(u)
-        numer = self.wpoints@Nu
-        if self.rational:
-            denom = self.weights@Nu
-            points = numer/denom
+        if self.segmented:
+            points, = self.evaluate_derivatives_at_t(u, 0)
         else:
-            points = numer
-        if points.size == 1:
+            Nu, span = self.basis_functions_sparse(u)
+            numer = basis_sparse_product(self.wpoints, Nu, span)
+            if self.rational:
+                denom = basis_sparse_product(self.weights, Nu, span)
+                points = numer/denom
+            else:
+                points = numer
+        if points.ndim > 0 and points.size == 1:
             points = points[0]
         return points
 
-    def evaluate_first_derivatives_at_t(self, u: 'NDArray') -> Vector:
-        Nu = self.basis_functions(u)
-        dNu = self.basis_first_derivatives(u)
-        numer = self.wpoints@Nu
-        dnumer = self.wpoints@dNu
+    def evaluate_derivatives_at_t(self, u: 'NDArray', order: int) -> list[Vector]:
+        if self.segmented:
+            u = as_float_array(u, self.dtype)
+            hders = self.segments.evaluate(u, order)
+            ders = [Vector(hder[..., 0], hder[..., 1], hder[..., 2]) for hder in hders]
+            if self.rational:
+                wders = [hder[..., 3] for hder in hders]
+                ders = rational_derivatives(ders, wders)
+            return ders
+        dNu, span = self.basis_derivatives_sparse(u, order)
+        ders = [basis_sparse_product(self.wpoints, dNu[k], span)
+                for k in range(order + 1)]
         if self.rational:
-            denom = self.weights@Nu
-            ddenom = self.weights@dNu
-            deriv1 = (dnumer*denom - numer*ddenom)/denom**2
-        else:
-            deriv1 = dnumer
-        if deriv1.size == 1:
+            wders = [basis_sparse_product(self.weights, dNu[k], span)
+                     for k in range(order + 1)]
+            ders = rational_derivatives(ders, wders)
+        return ders
+
+    def evaluate_first_derivatives_at_t(self, u: 'NDArray') -> Vector:
+        _, deriv1 = self.evaluate_derivatives_at_t(u, 1)
+        if deriv1.ndim > 0 and deriv1.size == 1:
             deriv1 = deriv1[0]
         return deriv1
 
     def evaluate_second_derivatives_at_t(self, u: 'NDArray') -> Vector:
-        Nu = self.basis_functions(u)
-        dNu = self.basis_first_derivatives(u)
-        d2Nu = self.basis_second_derivatives(u)
-        numer = self.wpoints@Nu
-        dnumer = self.wpoints@dNu
-        d2numer = self.wpoints@d2Nu
-        if self.rational:
-            denom = self.weights@Nu
-            ddenom = self.weights@dNu
-            d2denom = self.weights@d2Nu
-            deriv2 = (d2numer*denom**2 - dnumer*2*ddenom*denom + numer*2*ddenom**2 - numer*d2denom*denom)/denom**3
-        else:
-            deriv2 = d2numer
-        if deriv2.size == 1:
+        _, _, deriv2 = self.evaluate_derivatives_at_t(u, 2)
+        if deriv2.ndim > 0 and deriv2.size == 1:
             deriv2 = deriv2[0]
         return deriv2
 
     def evaluate_curvatures_at_t(self, u: 'NDArray') -> Vector:
-        deriv1 = self.evaluate_first_derivatives_at_t(u)
-        deriv2 = self.evaluate_second_derivatives_at_t(u)
+        _, deriv1, deriv2 = self.evaluate_derivatives_at_t(u, 2)
         deriv1mag = deriv1.return_magnitude()
         deriv1magnot0 = deriv1mag != 0.0
         deriv1mag3 = deriv1mag**3
         deriv1xderiv2 = deriv1.cross(deriv2)
         curvature = Vector.zeros(deriv1mag.shape)
-        divide(deriv1xderiv2, deriv1mag3, where=deriv1magnot0, out=curvature)
+        divide(deriv1xderiv2.x, deriv1mag3, where=deriv1magnot0, out=curvature.x)
+        divide(deriv1xderiv2.y, deriv1mag3, where=deriv1magnot0, out=curvature.y)
+        divide(deriv1xderiv2.z, deriv1mag3, where=deriv1magnot0, out=curvature.z)
         # curvature = deriv1.cross(deriv2)/deriv1.return_magnitude()**3
         return curvature
 
@@ -139,11 +177,14 @@ class NurbsCurve():
         return deriv2.to_unit()
 
     def evaluate_binormals_at_t(self, u: 'NDArray') -> Vector:
-        deriv1 = self.evaluate_first_derivatives_at_t(u)
-        deriv2 = self.evaluate_second_derivatives_at_t(u)
+        _, deriv1, deriv2 = self.evaluate_derivatives_at_t(u, 2)
         binormal = deriv1.cross(deriv2).to_unit()
         return binormal
 
+    @property
+    def arclength_breaks(self) -> 'NDArray':
+        return self.cknots[self.degree:self.cknots.size - self.degree]
+
     def evaluate_t(self, num: int) -> 'NDArray':
         return knot_linspace(num, self.knots)
 
@@ -175,6 +216,91 @@ class NurbsCurve():
         u = self.evaluate_t(num)
         return self.evaluate_binormals_at_t(u)
 
+    def evaluate_t_adaptive(self, tol: float, angtol: float | None = None,
+                            num: int = 4, maxiter: int = 16) -> 'NDArray':
+        """Returns parameters refined until every segment is within tol of
+        the curve and turns by no more than angtol radians."""
+        u = self.evaluate_t(num)
+        u, _ = tessellate_curve(self.evaluate_points_at_t, u, tol,
+                                angtol=angtol, maxiter=maxiter)
+        return u
+
+    def evaluate_points_adaptive(self, tol: float, angtol: float | None = None,
+                                 num: int = 4, maxiter: int = 16) -> Vector:
+        u = self.evaluate_t(num)
+        _, pnts = tessellate_curve(self.evaluate_points_at_t, u, tol,
+                                   angtol=angtol, maxiter=maxiter)
+        return pnts
+
+    def project_points(self, pnts: Vector, num: int = 8, tol: float = 1e-12,
+                       maxiter: int = 20) -> tuple['NDArray', Vector, 'NDArray']:
+        """Returns the parameters, foot points and distances of the closest
+        points on the curve to pnts."""
+        return project_points_on_curve(self, pnts, num=num, tol=tol,
+                                       maxiter=maxiter)
+
+    def control_array(self) -> 'NDArray':
+        """Returns the (homogeneous if rational) control points as an array."""
+        if self.rational:
+            return column_stack((self.wpoints.stack_xyz(), self.weights))
+        return self.ctlpnts.stack_xyz()
+
+    def _from_control_array(self, degree: int, cknots: 'NDArray',
+                            ctlarr: 'NDArray') -> 'NurbsCurve':
+        if self.rational:
+            weights = ctlarr[:, 3]
+            ctlarr = ctlarr[:, :3]/weights[:, None]
+        else:
+            weights = ones(ctlarr.shape[0], dtype=ctlarr.dtype)
+        ctlpnts = Vector(ctlarr[:, 0], ctlarr[:, 1], ctlarr[:, 2])
+        if self.endpoint:
+            knots = cknots[degree:cknots.size - degree]
+        else:
+            knots = cknots
+        return self.__class__(ctlpnts, weights=weights, degree=degree,
+                              knots=knots, endpoint=self.endpoint,
+                              segmented=self.segmented)
+
+    def insert_knots(self, x: 'NDArray') -> 'NurbsCurve':
+        """Returns the same curve with the knots x inserted."""
+        x = sort(ravel(asarray(x, dtype=float)))
+        cknots, ctlarr = refine_knot_vector(self.degree, self.cknots,
+                                            self.control_array(), x)
+        return self._from_control_array(self.degree, cknots, ctlarr)
+
+    def knot_refinement_matrix(self, x: 'NDArray') -> 'NDArray':
+        """Returns the matrix mapping the control points to those of the curve
+        with the knots x inserted."""
+        x = sort(ravel(asarray(x, dtype=float)))
+        return knot_refinement_matrix(self.degree, self.cknots, x)
+
+    def to_bezier(self) -> 'NurbsCurve':
+        """Returns the same curve with all interior knots of multiplicity
+        degree, so that each span is a Bezier segment."""
+        if not self.endpoint:
+            raise ValueError('Curve must have endpoint set to True.')
+        return self.insert_knots(bezier_knots(self.degree, self.cknots))
+
+    def elevate_degree(self, t: int = 1) -> 'NurbsCurve':
+        """Returns the same curve with the degree elevated by t."""
+        if not self.endpoint:
+            raise ValueError('Curve must have endpoint set to True.')
+        cknots, ctlarr = elevate_degree(self.degree, self.cknots,
+                                        self.control_array(), t=t)
+        return self._from_control_array(self.degree + t, cknots, ctlarr)
+
+    def split_at_t(self, u: float) -> tuple['NurbsCurve', 'NurbsCurve']:
+        """Returns the two curves either side of the parameter u."""
+        if not self.endpoint:
+            raise ValueError('Curve must have endpoint set to True.')
+        if u <= self.knots[0] or u >= self.knots[-1]:
+            raise ValueError('Split parameter must be inside the knot domain.')
+        (kone, Qone), (ktwo, Qtwo) = split_knot_vector(self.degree, self.cknots,
+                                                       self.control_array(), u)
+        curveone = self._from_control_array(self.degree, kone, Qone)
+        curvetwo = self._from_control_array(self.degree, ktwo, Qtwo)
+        return curveone, curvetwo
+
     def __repr__(self) -> str:
         return f'<NurbsCurve: degree={self.degree:d}>'
 
@@ -192,7 +318,7 @@ class NurbsCurve():
 class BSplineCurve(NurbsCurve):
 
     def __init__(self, ctlpnts: Vector, **kwargs: dict[str, Any]) -> None:
-        kwargs['weights'] = ones(ctlpnts.shape)
+        kwargs['weights'] = ones(ctlpnts.shape, dtype=float_type(ctlpnts.dtype))
         kwargs['rational'] = False
         super().__init__(ctlpnts, **kwargs)
 
@@ -1,13 +1,23 @@
 from typing import TYPE_CHECKING, Any
 
-from numpy import concatenate, full, ones, shape, zeros
-
-from ..tools.basis import (basis_first_derivatives, basis_functions,
-                           default_knots, knot_linspace)
+from numpy import asarray, concatenate, full, ones, ravel, shape, sort
+
+from ..tools.basis import (basis_cache, basis_first_derivatives,
+                           basis_functions, basis_sparse_grid_product,
+                           basis_sparse_mesh_derivatives,
+                           basis_sparse_mesh_product, default_knots,
+                           knot_linspace, rational_surface_derivatives)
+from ..tools.inversion import SampleGrid, project_points_on_surface
+from ..tools.knots import (elevate_degree, refine_knot_vector,
+                           split_knot_vector)
+from ..tools.precision import as_float_array, float_type
+from ..tools.tessellate import tessellate_surface
 from .vector import Vector
 
 if TYPE_CHECKING:
-    from numpy.typing import NDArray
+    from numpy.typing import DTypeLike, NDArray
+
+    from ..tools.mesh import Mesh
 
 
 class NurbsSurface():
@@ -23,11 +33,14 @@ class NurbsSurface():
     _wpoints: Vector = None
     _ucknots: 'NDArray' = None
     _vcknots: 'NDArray' = None
+    _sample_grid: SampleGrid = None
 
     def __init__(self, ctlpnts: Vector, **kwargs: dict[str, Any]) -> None:
         self.ctlpnts = ctlpnts
 
-        self.weights = kwargs.get('weights', ones(ctlpnts.shape))
+        self.weights = kwargs.get('weights',
+                                  ones(ctlpnts.shape,
+                                       dtype=float_type(ctlpnts.dtype)))
         if self.ctlpnts.shape != self.weights.shape:
             raise ValueError('Control points and weights must have the same shape.')
 
@@ -87,6 +100,10 @@ class NurbsSurface():
                 self._vcknots = self.vknots
         return self._vcknots
 
+    @property
+    def dtype(self) -> 'DTypeLike':
+        return float_type(self.ctlpnts.dtype)
+
     @property
     def rational(self) -> bool:
         check: 'NDArray' = self.weights == 1.0
@@ -98,17 +115,35 @@ class NurbsSurface():
         Nv = basis_functions(self.vdegree, self.vcknots, v)
         return Nu, Nv
 
+    def basis_functions_sparse(self, u: 'NDArray',
+                               v: 'NDArray') -> tuple[tuple['NDArray', 'NDArray'],
+                                                      tuple['NDArray', 'NDArray']]:
+        u = as_float_array(u, self.dtype)
+        v = as_float_array(v, self.dtype)
+        Nu = basis_cache.basis_functions_sparse(self.udegree, self.ucknots, u)
+        Nv = basis_cache.basis_functions_sparse(self.vdegree, self.vcknots, v)
+        return Nu, Nv
+
     def basis_first_derivatives(self, u: 'NDArray', v: 'NDArray') -> tuple['NDArray',
                                                                      'NDArray']:
         dNu = basis_first_derivatives(self.udegree, self.ucknots, u)
         dNv = basis_first_derivatives(self.vdegree, self.vcknots, v)
         return dNu, dNv
 
+    def basis_derivatives_sparse(self, u: 'NDArray', v: 'NDArray',
+                                 order: int) -> tuple[tuple['NDArray', 'NDArray'],
+                                                      tuple['NDArray', 'NDArray']]:
+        u = as_float_array(u, self.dtype)
+        v = as_float_array(v, self.dtype)
+        dNu = basis_cache.basis_derivatives_sparse(self.udegree, self.ucknots, u, order)
+        dNv = basis_cache.basis_derivatives_sparse(self.vdegree, self.vcknots, v, order)
+        return dNu, dNv
+
     def evaluate_points_at_uv(self, u: 'NDArray', v: 'NDArray') -> Vector:
-        Nu, Nv = self.basis_functions(u, v)
-        numer = Nu.transpose()@self.wpoints@Nv
+        (Nu, spanu), (Nv, spanv) = self.basis_functions_sparse(u, v)
+        numer = basis_sparse_grid_product(self.wpoints, Nu, spanu, Nv, spanv)
         if self.rational:
-            denom = Nu.transpose()@self.weights@Nv
+            denom = basis_sparse_grid_product(self.weights, Nu, spanu, Nv, spanv)
             points = numer/denom
         else:
             points = numer
@@ -118,18 +153,10 @@ class NurbsSurface():
         shp = shape(um)
         if shp != shape(vm):
             raise ValueError('The shapes of um and vm must be the same.')
-        Nu, Nv = self.basis_functions(um, vm)
-        numu = Nu.shape[0]
-        numv = Nv.shape[0]
-        numer = Vector.zeros(shp)
-        for i in range(numu):
-            for j in range(numv):
-                numer += self.wpoints[i, j]*Nu[i]*Nv[j]
+        (Nu, spanu), (Nv, spanv) = self.basis_functions_sparse(um, vm)
+        numer = basis_sparse_mesh_product(self.wpoints, Nu, spanu, Nv, spanv)
         if self.rational:
-            denom = zeros(shp)
-            for i in range(numu):
-                for j in range(numv):
-                    denom += self.weights[i, j]*Nu[i]*Nv[j]
+            denom = basis_sparse_mesh_product(self.weights, Nu, spanu, Nv, spanv)
             points = numer/denom
         else:
             points = numer
@@ -137,15 +164,14 @@ class NurbsSurface():
 
     def evaluate_tangents_at_uv(self, u: 'NDArray',
                                 v: 'NDArray') -> tuple[Vector, Vector]:
-        Nu, Nv = self.basis_functions(u, v)
-        dNu, dNv = self.basis_first_derivatives(u, v)
-        dnumer_u = dNu.transpose()@self.wpoints@Nv
-        dnumer_v = Nu.transpose()@self.wpoints@dNv
+        (dNu, spanu), (dNv, spanv) = self.basis_derivatives_sparse(u, v, 1)
+        dnumer_u = basis_sparse_grid_product(self.wpoints, dNu[1], spanu, dNv[0], spanv)
+        dnumer_v = basis_sparse_grid_product(self.wpoints, dNu[0], spanu, dNv[1], spanv)
         if self.rational:
-            numer = Nu.transpose()@self.wpoints@Nv
-            denom = Nu.transpose()@self.weights@Nv
-            ddenom_u = dNu.transpose()@self.weights@Nv
-            ddenom_v = Nu.transpose()@self.weights@dNv
+            numer = basis_sparse_grid_product(self.wpoints, dNu[0], spanu, dNv[0], spanv)
+            denom = basis_sparse_grid_product(self.weights, dNu[0], spanu, dNv[0], spanv)
+            ddenom_u = basis_sparse_grid_product(self.weights, dNu[1], spanu, dNv[0], spanv)
+            ddenom_v = basis_sparse_grid_product(self.weights, dNu[0], spanu, dNv[1], spanv)
             tangent_u = (dnumer_u*denom - numer*ddenom_u)/denom**2
             tangent_v = (dnumer_v*denom - numer*ddenom_v)/denom**2
         else:
@@ -163,27 +189,14 @@ class NurbsSurface():
         shp = shape(um)
         if shp != shape(vm):
             raise ValueError('The shapes of um and vm must be the same.')
-        Nu, Nv = self.basis_functions(um, vm)
-        dNu, dNv = self.basis_first_derivatives(um, vm)
-        numu = Nu.shape[0]
-        numv = Nv.shape[0]
-        dnumer_u = Vector.zeros(shp)
-        dnumer_v = Vector.zeros(shp)
-        for i in range(numu):
-            for j in range(numv):
-                dnumer_u += self.wpoints[i, j]*dNu[i]*Nv[j]
-                dnumer_v += self.wpoints[i, j]*Nu[i]*dNv[j]
+        (dNu, spanu), (dNv, spanv) = self.basis_derivatives_sparse(um, vm, 1)
+        dnumer_u = basis_sparse_mesh_product(self.wpoints, dNu[1], spanu, dNv[0], spanv)
+        dnumer_v = basis_sparse_mesh_product(self.wpoints, dNu[0], spanu, dNv[1], spanv)
         if self.rational:
-            numer = Vector.zeros(shp)
-            denom = zeros(shp)
-            ddenom_u = zeros(shp)
-            ddenom_v = zeros(shp)
-            for i in range(numu):
-                for j in range(numv):
-                    numer += self.wpoints[i, j]*Nu[i]*Nv[j]
-                    denom += self.weights[i, j]*Nu[i]*Nv[j]
-                    ddenom_u += self.weights[i, j]*dNu[i]*Nv[j]
-                    ddenom_v += self.weights[i, j]*Nu[i]*dNv[j]
+            numer = basis_sparse_mesh_product(self.wpoints, dNu[0], spanu, dNv[0], spanv)
+            denom = basis_sparse_mesh_product(self.weights, dNu[0], spanu, dNv[0], spanv)
+            ddenom_u = basis_sparse_mesh_product(self.weights, dNu[1], spanu, dNv[0], spanv)
+            ddenom_v = basis_sparse_mesh_product(self.weights, dNu[0], spanu, dNv[1], spanv)
             tangent_u = (dnumer_u*denom - numer*ddenom_u)/denom**2
             tangent_v = (dnumer_v*denom - numer*ddenom_v)/denom**2
         else:
@@ -191,6 +204,22 @@ class NurbsSurface():
             tangent_v = dnumer_v
         return tangent_u, tangent_v
 
+    def evaluate_derivatives_at_uv_mesh(self, um: 'NDArray', vm: 'NDArray',
+                                        order: int) -> list[list[Vector]]:
+        """Returns the derivatives ders[k][l] for k + l <= order, with k
+        derivatives in u and l in v."""
+        shp = shape(um)
+        if shp != shape(vm):
+            raise ValueError('The shapes of um and vm must be the same.')
+        (dNu, spanu), (dNv, spanv) = self.basis_derivatives_sparse(um, vm, order)
+        ders = basis_sparse_mesh_derivatives(self.wpoints, dNu, spanu,
+                                             dNv, spanv, order)
+        if self.rational:
+            wders = basis_sparse_mesh_derivatives(self.weights, dNu, spanu,
+                                                  dNv, spanv, order)
+            ders = rational_surface_derivatives(ders, wders)
+        return ders
+
     def evaluate_uv(self, numu: int, numv: int) -> tuple['NDArray',
                                                          'NDArray']:
         u = knot_linspace(numu, self.uknots)
@@ -210,6 +239,117 @@ class NurbsSurface():
         u, v = self.evaluate_uv(numu, numv)
         return self.evaluate_normals_at_uv(u, v)
 
+    def evaluate_mesh_adaptive(self, tol: float, angtol: float | None = None,
+                               numu: int = 2, numv: int = 2,
+                               maxlevel: int = 8) -> 'Mesh':
+        """Returns a mesh of quads and triangles refined until every cell is
+        within tol of the surface and turns by no more than angtol radians."""
+        u, v = self.evaluate_uv(numu, numv)
+        mesh, _, _ = tessellate_surface(self.evaluate_points_at_uv_mesh, u, v,
+                                        tol, angtol=angtol, maxlevel=maxlevel)
+        return mesh
+
+    def project_points(self, pnts: Vector, num: int = 8, tol: float = 1e-12,
+                       maxiter: int = 20) -> tuple['NDArray', 'NDArray', Vector,
+                                                   'NDArray']:
+        """Returns the parameters, foot points and distances of the closest
+        points on the surface to pnts."""
+        return project_points_on_surface(self, pnts, num=num, tol=tol,
+                                         maxiter=maxiter)
+
+    def control_array(self) -> 'NDArray':
+        """Returns the (homogeneous if rational) control net as an array."""
+        if self.rational:
+            return concatenate((self.wpoints.stack_xyz(),
+                                self.weights[..., None]), axis=-1)
+        return self.ctlpnts.stack_xyz()
+
+    def _from_control_array(self, udegree: int, ucknots: 'NDArray',
+                            vdegree: int, vcknots: 'NDArray',
+                            ctlarr: 'NDArray') -> 'NurbsSurface':
+        if self.rational:
+            weights = ctlarr[..., 3]
+            ctlarr = ctlarr[..., :3]/weights[..., None]
+        else:
+            weights = ones(ctlarr.shape[:2], dtype=ctlarr.dtype)
+        ctlpnts = Vector(ctlarr[..., 0], ctlarr[..., 1], ctlarr[..., 2])
+        if self.uendpoint:
+            uknots = ucknots[udegree:ucknots.size - udegree]
+        else:
+            uknots = ucknots
+        if self.vendpoint:
+            vknots = vcknots[vdegree:vcknots.size - vdegree]
+        else:
+            vknots = vcknots
+        return self.__class__(ctlpnts, weights=weights, udegree=udegree,
+                              vdegree=vdegree, uknots=uknots, vknots=vknots,
+                              uendpoint=self.uendpoint,
+                              vendpoint=self.vendpoint)
+
+    def insert_uknots(self, x: 'NDArray') -> 'NurbsSurface':
+        """Returns the same surface with the u knots x inserted."""
+        x = sort(ravel(asarray(x, dtype=float)))
+        ucknots, ctlarr = refine_knot_vector(self.udegree, self.ucknots,
+                                             self.control_array(), x, axis=0)
+        return self._from_control_array(self.udegree, ucknots,
+                                        self.vdegree, self.vcknots, ctlarr)
+
+    def insert_vknots(self, x: 'NDArray') -> 'NurbsSurface':
+        """Returns the same surface with the v knots x inserted."""
+        x = sort(ravel(asarray(x, dtype=float)))
+        vcknots, ctlarr = refine_knot_vector(self.vdegree, self.vcknots,
+                                             self.control_array(), x, axis=1)
+        return self._from_control_array(self.udegree, self.ucknots,
+                                        self.vdegree, vcknots, ctlarr)
+
+    def elevate_udegree(self, t: int = 1) -> 'NurbsSurface':
+        """Returns the same surface with the u degree elevated by t."""
+        if not self.uendpoint:
+            raise ValueError('Surface must have uendpoint set to True.')
+        ucknots, ctlarr = elevate_degree(self.udegree, self.ucknots,
+                                         self.control_array(), t=t, axis=0)
+        return self._from_control_array(self.udegree + t, ucknots,
+                                        self.vdegree, self.vcknots, ctlarr)
+
+    def elevate_vdegree(self, t: int = 1) -> 'NurbsSurface':
+        """Returns the same surface with the v degree elevated by t."""
+        if not self.vendpoint:
+            raise ValueError('Surface must have vendpoint set to True.')
+        vcknots, ctlarr = elevate_degree(self.vdegree, self.vcknots,
+                                         self.control_array(), t=t, axis=1)
+        return self._from_control_array(self.udegree, self.ucknots,
+                                        self.vdegree + t, vcknots, ctlarr)
+
+    def split_at_u(self, u: float) -> tuple['NurbsSurface', 'NurbsSurface']:
+        """Returns the two surfaces either side of the parameter u."""
+        if not self.uendpoint:
+            raise ValueError('Surface must have uendpoint set to True.')
+        if u <= self.uknots[0] or u >= self.uknots[-1]:
+            raise ValueError('Split parameter must be inside the knot domain.')
+        (kone, Qone), (ktwo, Qtwo) = split_knot_vector(self.udegree, self.ucknots,
+                                                       self.control_array(), u,
+                                                       axis=0)
+        surfone = self._from_control_array(self.udegree, kone,
+                                           self.vdegree, self.vcknots, Qone)
+        surftwo = self._from_control_array(self.udegree, ktwo,
+                                           self.vdegree, self.vcknots, Qtwo)
+        return surfone, surftwo
+
+    def split_at_v(self, v: float) -> tuple['NurbsSurface', 'NurbsSurface']:
+        """Returns the two surfaces either side of the parameter v."""
+        if not self.vendpoint:
+            raise ValueError('Surface must have vendpoint set to True.')
+        if v <= self.vknots[0] or v >= self.vknots[-1]:
+            raise ValueError('Split parameter must be inside the knot domain.')
+        (kone, Qone), (ktwo, Qtwo) = split_knot_vector(self.vdegree, self.vcknots,
+                                                       self.control_array(), v,
+                                                       axis=1)
+        surfone = self._from_control_array(self.udegree, self.ucknots,
+                                           self.vdegree, kone, Qone)
+        surftwo = self._from_control_array(self.udegree, self.ucknots,
+                                           self.vdegree, ktwo, Qtwo)
+        return surfone, surftwo
+
     def __repr__(self) -> str:
         return f'<NurbsSurface: udegree={self.udegree:d}, vdegree={self.vdegree:d}>'
 
@@ -231,7 +371,7 @@ class NurbsSurface():
 class BSplineSurface(NurbsSurface):
 
     def __init__(self, ctlpnts: Vector, **kwargs: dict[str, Any]) -> None:
-        kwargs['weights'] = ones(ctlpnts.shape)
+        kwargs['weights'] = ones(ctlpnts.shape, dtype=float_type(ctlpnts.dtype))
         kwargs['rational'] = False
         super().__init__(ctlpnts, **kwargs)
 
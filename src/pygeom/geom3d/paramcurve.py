@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 
 from numpy import linspace
 
+from ..tools.arclength import ArcLengthCurve
+from ..tools.tessellate import tessellate_curve
 from .vector import Vector
 
 if TYPE_CHECKING:
@@ -10,11 +12,12 @@ if TYPE_CHECKING:
     ParamCallable = Callable[['NDArray'], Vector]
 
 
-class ParamCurve():
+class ParamCurve(ArcLengthCurve):
     rt: 'ParamCallable' = None
     drdt: 'ParamCallable' = None
     d2rdt2: 'ParamCallable' = None
     scale: float = None
+    arclength_num: int = 16
 
     def __init__(self, ru: 'ParamCallable',
                  drdu: 'ParamCallable | None' = None,
@@ -82,6 +85,22 @@ class ParamCurve():
         u = self.evaluate_t(num)
         return self.evaluate_binormals_at_t(u)
 
+    def evaluate_t_adaptive(self, tol: float, angtol: float | None = None,
+                            num: int = 8, maxiter: int = 16) -> 'NDArray':
+        """Returns parameters refined until every segment is within tol of
+        the curve and turns by no more than angtol radians."""
+        u = self.evaluate_t(num)
+        u, _ = tessellate_curve(self.evaluate_points_at_t, u, tol,
+                                angtol=angtol, maxiter=maxiter)
+        return u
+
+    def evaluate_points_adaptive(self, tol: float, angtol: float | None = None,
+                                 num: int = 8, maxiter: int = 16) -> Vector:
+        u = self.evaluate_t(num)
+        _, pnts = tessellate_curve(self.evaluate_points_at_t, u, tol,
+                                   angtol=angtol, maxiter=maxiter)
+        return pnts
+
     def __mul__(self, scale: float) -> 'ParamCurve':
         scale = self.scale*scale
         return ParamCurve(self.ru, self.drdu, self.d2rdu2, scale)
@@ -3,10 +3,13 @@ from typing import TYPE_CHECKING
 
 from numpy import linspace, meshgrid, shape
 
+from ..tools.tessellate import tessellate_surface
 from .vector import Vector
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
+
+    from ..tools.mesh import Mesh
     ParamCallable = Callable[['NDArray', 'NDArray'], Vector]
 
 
@@ -75,5 +78,15 @@ class ParamSurface():
         u, v = self.evaluate_uv(numu, numv)
         return self.evaluate_normals_at_uv(u, v)
 
+    def evaluate_mesh_adaptive(self, tol: float, angtol: float | None = None,
+                               numu: int = 5, numv: int = 5,
+                               maxlevel: int = 8) -> 'Mesh':
+        """Returns a mesh of quads and triangles refined until every cell is
+        within tol of the surface and turns by no more than angtol radians."""
+        u, v = self.evaluate_uv(numu, numv)
+        mesh, _, _ = tessellate_surface(self.evaluate_points_at_uv_mesh, u, v,
+                                        tol, angtol=angtol, maxlevel=maxlevel)
+        return mesh
+
     def __repr__(self) -> str:
         return f'<ParamSurface>'
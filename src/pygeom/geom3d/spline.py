@@ -4,6 +4,7 @@ from matplotlib.axes import Axes
 from matplotlib.pyplot import figure
 from numpy import argwhere, asarray, concatenate, linspace, logical_and, zeros
 
+from ..tools.arclength import ArcLengthCurve
 from .vector import Vector
 
 if TYPE_CHECKING:
@@ -381,7 +382,7 @@ class SplinePanel():
     def __repr__(self) -> str:
         return '<SplinePanel>'
 
-class Spline():
+class Spline(ArcLengthCurve):
     u"""This class stores a 3D parametric spline."""
     pnts: list[SplinePoint] = None
     closed: bool = False
@@ -908,5 +909,37 @@ class Spline():
 
         return spline1, spline2
 
+    def evaluate_points_at_t(self, s: 'NDArray') -> Vector:
+        u"""This function evaluates the spline at the spline lengths s."""
+        s = asarray(s, dtype=float)
+        pnts = Vector.zeros(s.shape)
+        sa = 0.0
+        for pnl in self.pnls:
+            sb = sa + pnl.length
+            s_check = logical_and(s >= sa, s <= sb)
+            pnts[s_check] = pnl.ratio_point_interpolate((s[s_check] - sa)/pnl.length)
+            sa = sb
+        return pnts
+
+    def evaluate_first_derivatives_at_t(self, s: 'NDArray') -> Vector:
+        u"""This function evaluates the gradient of the spline at the spline lengths s."""
+        s = asarray(s, dtype=float)
+        grds = Vector.zeros(s.shape)
+        sa = 0.0
+        for pnl in self.pnls:
+            sb = sa + pnl.length
+            s_check = logical_and(s >= sa, s <= sb)
+            grds[s_check] = pnl.ratio_gradient_interpolate((s[s_check] - sa)/pnl.length)
+            sa = sb
+        return grds
+
+    def evaluate_tangents_at_t(self, s: 'NDArray') -> Vector:
+        u"""This function evaluates the unit tangent of the spline at the spline lengths s."""
+        return self.evaluate_first_derivatives_at_t(s).to_unit()
+
+    @property
+    def arclength_breaks(self) -> 'NDArray':
+        return self.s
+
     def __repr__(self) -> str:
         return '<Spline>'
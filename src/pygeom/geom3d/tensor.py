@@ -0,0 +1,336 @@
+from typing import TYPE_CHECKING, Any
+
+from numpy import (absolute, arccos, arctan2, asarray, broadcast_arrays, clip,
+                   cos, divide, maximum, ones, pi, result_type, sin, sqrt,
+                   stack, where, zeros)
+
+from ..tools.precision import get_float_dtype
+from .vector import Vector
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
+
+
+def _safe_divide(numer: 'NDArray', denom: 'NDArray') -> 'NDArray':
+    """Returns numer/denom with zero where denom is zero."""
+    denom = asarray(denom)
+    check = denom != 0.0
+    out = zeros(denom.shape, dtype=result_type(numer, denom, 1.0))
+    return divide(numer, denom, out=out, where=check)
+
+
+class Tensor():
+    """Tensor Class
+
+    Arrays of 3x3 matrices stored as the row vectors x, y and z, so that
+    every operation is a closed form expression evaluated over the whole
+    array at once.
+    """
+    x: Vector = None
+    y: Vector = None
+    z: Vector = None
+
+    def __init__(self, x: Vector, y: Vector, z: Vector) -> None:
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @property
+    def xx(self) -> 'NDArray':
+        return self.x.x
+
+    @property
+    def xy(self) -> 'NDArray':
+        return self.x.y
+
+    @property
+    def xz(self) -> 'NDArray':
+        return self.x.z
+
+    @property
+    def yx(self) -> 'NDArray':
+        return self.y.x
+
+    @property
+    def yy(self) -> 'NDArray':
+        return self.y.y
+
+    @property
+    def yz(self) -> 'NDArray':
+        return self.y.z
+
+    @property
+    def zx(self) -> 'NDArray':
+        return self.z.x
+
+    @property
+    def zy(self) -> 'NDArray':
+        return self.z.y
+
+    @property
+    def zz(self) -> 'NDArray':
+        return self.z.z
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        shape_x = self.x.shape
+        if shape_x == self.y.shape and shape_x == self.z.shape:
+            return shape_x
+        raise ValueError('Tensor x, y and z should have the same shape.')
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return self.x.size
+
+    @property
+    def dtype(self) -> 'DTypeLike':
+        return result_type(self.x.dtype, self.y.dtype, self.z.dtype)
+
+    def __getitem__(self, key: Any) -> 'Tensor':
+        return Tensor(self.x[key], self.y[key], self.z[key])
+
+    def __setitem__(self, key: Any, value: 'Tensor') -> None:
+        try:
+            self.x[key] = value.x
+            self.y[key] = value.y
+            self.z[key] = value.z
+        except AttributeError:
+            raise TypeError('Tensor values can only be set from a Tensor.')
+
+    def __add__(self, obj: 'Tensor') -> 'Tensor':
+        try:
+            return Tensor(self.x + obj.x, self.y + obj.y, self.z + obj.z)
+        except AttributeError:
+            raise TypeError('Tensor object can only be added to Tensor object.')
+
+    def __sub__(self, obj: 'Tensor') -> 'Tensor':
+        try:
+            return Tensor(self.x - obj.x, self.y - obj.y, self.z - obj.z)
+        except AttributeError:
+            raise TypeError('Tensor object can only be subtracted from Tensor object.')
+
+    def __mul__(self, obj: Any) -> 'Tensor':
+        return Tensor(self.x*obj, self.y*obj, self.z*obj)
+
+    def __rmul__(self, obj: Any) -> 'Tensor':
+        return Tensor(obj*self.x, obj*self.y, obj*self.z)
+
+    def __truediv__(self, obj: Any) -> 'Tensor':
+        return Tensor(self.x/obj, self.y/obj, self.z/obj)
+
+    def __pos__(self) -> 'Tensor':
+        return self
+
+    def __neg__(self) -> 'Tensor':
+        return Tensor(-self.x, -self.y, -self.z)
+
+    def __matmul__(self, obj: 'Tensor | Vector') -> 'Tensor | Vector':
+        if isinstance(obj, Tensor):
+            objt = obj.transpose()
+            return Tensor(objt.dot(self.x), objt.dot(self.y), objt.dot(self.z))
+        if isinstance(obj, Vector):
+            return self.dot(obj)
+        return NotImplemented
+
+    def dot(self, vector: Vector) -> Vector:
+        """Returns the product of the tensors and the column vectors."""
+        return Vector(self.x.dot(vector), self.y.dot(vector), self.z.dot(vector))
+
+    def transpose(self) -> 'Tensor':
+        """Returns the transposed tensors."""
+        x = Vector(self.xx, self.yx, self.zx)
+        y = Vector(self.xy, self.yy, self.zy)
+        z = Vector(self.xz, self.yz, self.zz)
+        return Tensor(x, y, z)
+
+    def trace(self) -> 'NDArray':
+        return self.xx + self.yy + self.zz
+
+    def det(self) -> 'NDArray':
+        """Returns the determinants of the tensors."""
+        return self.x.dot(self.y.cross(self.z))
+
+    def adjugate(self) -> 'Tensor':
+        """Returns the adjugates of the tensors, the transposed cofactors."""
+        cofx = self.y.cross(self.z)
+        cofy = self.z.cross(self.x)
+        cofz = self.x.cross(self.y)
+        return Tensor(cofx, cofy, cofz).transpose()
+
+    def inverse(self) -> 'Tensor':
+        """Returns the inverses of the tensors, which are zero where the
+        tensor is singular."""
+        adj = self.adjugate()
+        rdet = _safe_divide(1.0, self.det())
+        return adj*rdet
+
+    def solve(self, vector: Vector) -> Vector:
+        """Returns the solutions of the tensors times x equal to vector by
+        Cramer's rule, which are zero where the tensor is singular."""
+        cofx = self.y.cross(self.z)
+        cofy = self.z.cross(self.x)
+        cofz = self.x.cross(self.y)
+        rdet = _safe_divide(1.0, self.x.dot(cofx))
+        return (cofx*vector.x + cofy*vector.y + cofz*vector.z)*rdet
+
+    def eigh(self) -> tuple[Vector, 'Tensor']:
+        """Returns the eigenvalues and eigenvectors of symmetric tensors.
+
+        The eigenvalues are returned in ascending order as the x, y and z of a
+        Vector and the unit eigenvectors as the x, y and z rows of a Tensor.
+        Only the upper triangle of the tensors is used.
+        """
+        a00, a01, a02 = self.xx, self.xy, self.xz
+        a11, a12, a22 = self.yy, self.yz, self.zz
+        a00, a01, a02, a11, a12, a22 = broadcast_arrays(a00, a01, a02,
+                                                        a11, a12, a22)
+        scale = maximum.reduce([absolute(a00), absolute(a01), absolute(a02),
+                                absolute(a11), absolute(a12), absolute(a22)])
+        rscale = _safe_divide(1.0, scale)
+        a00, a01, a02 = a00*rscale, a01*rscale, a02*rscale
+        a11, a12, a22 = a11*rscale, a12*rscale, a22*rscale
+        q = (a00 + a11 + a22)/3
+        b00, b11, b22 = a00 - q, a11 - q, a22 - q
+        p1 = a01**2 + a02**2 + a12**2
+        p = sqrt((b00**2 + b11**2 + b22**2 + 2*p1)/6)
+        rp = _safe_divide(1.0, p)
+        b00, b11, b22 = b00*rp, b11*rp, b22*rp
+        b01, b02, b12 = a01*rp, a02*rp, a12*rp
+        halfdet = (b00*(b11*b22 - b12**2) - b01*(b01*b22 - b12*b02) +
+                   b02*(b01*b12 - b11*b02))/2
+        halfdet = clip(halfdet, -1.0, 1.0)
+        phi = arccos(halfdet)/3
+        emax = q + 2*p*cos(phi)
+        emin = q + 2*p*cos(phi + 2*pi/3)
+        emid = 3*q - emax - emin
+        upper = (a00, a01, a02, a11, a12, a22)
+        # The eigenvector of the eigenvalue furthest from the others is found
+        # first, then the middle one in its orthogonal complement.
+        first = halfdet >= 0.0
+        evala = where(first, emax, emin)
+        veca = _eigenvector_first(upper, evala)
+        vecb = _eigenvector_second(upper, veca, emid)
+        vecc = veca.cross(vecb)
+        vecmin = where(first, vecc, veca)
+        vecmax = where(first, veca, vecc)
+        # Rayleigh quotients recover the accuracy the trigonometric roots
+        # lose near repeated eigenvalues.
+        tensor = Tensor(Vector(a00, a01, a02), Vector(a01, a11, a12),
+                        Vector(a02, a12, a22))
+        emin = vecmin.dot(tensor.dot(vecmin))
+        emid = vecb.dot(tensor.dot(vecb))
+        emax = vecmax.dot(tensor.dot(vecmax))
+        # The refined eigenvalues of nearly repeated roots can swap order, so
+        # the pairs are sorted again.
+        emin, vecmin, emid, vecb = _sort_pair(emin, vecmin, emid, vecb)
+        emid, vecb, emax, vecmax = _sort_pair(emid, vecb, emax, vecmax)
+        emin, vecmin, emid, vecb = _sort_pair(emin, vecmin, emid, vecb)
+        evals = Vector(emin*scale, emid*scale, emax*scale)
+        return evals, Tensor(vecmin, vecb, vecmax)
+
+    def to_xyz(self) -> tuple[Vector, Vector, Vector]:
+        return self.x, self.y, self.z
+
+    @classmethod
+    def zeros(cls, shape: tuple[int, ...] = (),
+              **kwargs: dict[str, Any]) -> 'Tensor':
+        x = Vector.zeros(shape, **kwargs)
+        y = Vector.zeros(shape, **kwargs)
+        z = Vector.zeros(shape, **kwargs)
+        return cls(x, y, z)
+
+    @classmethod
+    def identity(cls, shape: tuple[int, ...] = (),
+                 **kwargs: dict[str, Any]) -> 'Tensor':
+        kwargs.setdefault('dtype', get_float_dtype())
+        tensor = cls.zeros(shape, **kwargs)
+        tensor.x.x = ones(shape, **kwargs)
+        tensor.y.y = ones(shape, **kwargs)
+        tensor.z.z = ones(shape, **kwargs)
+        return tensor
+
+    @classmethod
+    def from_array(cls, arr: 'NDArray') -> 'Tensor':
+        """Returns a tensor whose components are views of a (..., 3, 3) array."""
+        arr = asarray(arr)
+        if arr.ndim < 2 or arr.shape[-2:] != (3, 3):
+            raise ValueError('Tensor array must have last axes of size (3, 3).')
+        x = Vector.from_xyz_array(arr[..., 0, :])
+        y = Vector.from_xyz_array(arr[..., 1, :])
+        z = Vector.from_xyz_array(arr[..., 2, :])
+        return cls(x, y, z)
+
+    def as_array(self) -> 'NDArray':
+        """Returns the tensor as a (..., 3, 3) array."""
+        return stack((self.x.stack_xyz(), self.y.stack_xyz(),
+                      self.z.stack_xyz()), axis=-2)
+
+    def __repr__(self) -> str:
+        return f'<Tensor: shape: {self.shape}, dtype: {self.dtype}>'
+
+    def __str__(self) -> str:
+        outstr = f'Tensor shape: {self.shape}, dtype: {self.dtype}\n'
+        outstr += f'x:\n{self.x}\ny:\n{self.y}\nz:\n{self.z}\n'
+        return outstr
+
+
+def _sort_pair(evala: 'NDArray', veca: Vector, evalb: 'NDArray',
+               vecb: Vector) -> tuple['NDArray', Vector, 'NDArray', Vector]:
+    swap = evalb < evala
+    return (where(swap, evalb, evala), where(swap, vecb, veca),
+            where(swap, evala, evalb), where(swap, veca, vecb))
+
+
+def _eigenvector_first(upper: tuple['NDArray', ...], evals: 'NDArray') -> Vector:
+    """Returns the unit eigenvector of a distinct eigenvalue as the largest
+    cross product of two rows of the symmetric tensor minus the eigenvalue."""
+    a00, a01, a02, a11, a12, a22 = upper
+    row0 = Vector(a00 - evals, a01, a02)
+    row1 = Vector(a01, a11 - evals, a12)
+    row2 = Vector(a02, a12, a22 - evals)
+    r0xr1 = row0.cross(row1)
+    r0xr2 = row0.cross(row2)
+    r1xr2 = row1.cross(row2)
+    d0 = r0xr1.dot(r0xr1)
+    d1 = r0xr2.dot(r0xr2)
+    d2 = r1xr2.dot(r1xr2)
+    vec = where(d0 >= d1, r0xr1, r0xr2)
+    dmax = maximum(d0, d1)
+    vec = where(d2 > dmax, r1xr2, vec)
+    dmax = maximum(dmax, d2)
+    # A zero tensor minus eigenvalue has every direction as eigenvector.
+    vec = where(dmax > 0.0, vec, Vector(ones(dmax.shape), 0.0, 0.0))
+    return vec/sqrt(where(dmax > 0.0, dmax, 1.0))
+
+
+def _eigenvector_second(upper: tuple['NDArray', ...], veca: Vector,
+                        evals: 'NDArray') -> Vector:
+    """Returns the unit eigenvector of the middle eigenvalue, found by a
+    Jacobi rotation of the 2x2 tensor projected onto the plane normal to veca.
+    """
+    a00, a01, a02, a11, a12, a22 = upper
+    checkx = absolute(veca.x) > absolute(veca.y)
+    rlenx = _safe_divide(1.0, sqrt(veca.x**2 + veca.z**2))
+    rleny = _safe_divide(1.0, sqrt(veca.y**2 + veca.z**2))
+    vecu = where(checkx, Vector(-veca.z*rlenx, 0.0*rlenx, veca.x*rlenx),
+                 Vector(0.0*rleny, veca.z*rleny, -veca.y*rleny))
+    vecv = veca.cross(vecu)
+    tensor = Tensor(Vector(a00, a01, a02), Vector(a01, a11, a12),
+                    Vector(a02, a12, a22))
+    tensu = tensor.dot(vecu)
+    tensv = tensor.dot(vecv)
+    m00 = vecu.dot(tensu)
+    m01 = vecu.dot(tensv)
+    m11 = vecv.dot(tensv)
+    # The rotation does not depend on the trigonometric eigenvalue, which is
+    # only used to choose the middle one of the two projected eigenvalues.
+    theta = arctan2(2*m01, m00 - m11)/2
+    cth, sth = cos(theta), sin(theta)
+    half = (m00 + m11)/2
+    rad = sqrt(((m00 - m11)/2)**2 + m01**2)
+    upperb = absolute(half + rad - evals) <= absolute(half - rad - evals)
+    return where(upperb, vecu*cth + vecv*sth, vecv*cth - vecu*sth)
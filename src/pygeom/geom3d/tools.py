@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from numpy import absolute, arctan2, argwhere, divide, full, logical_and
 
+from ..tools.precision import float_type
 from .lines import Lines
 from .triangles import Triangles
 from .vector import Vector
@@ -27,7 +28,7 @@ def intersection_lines_and_triangles(lines: Lines, triangles: Triangles,
     numer = (tpnt - lpnt).dot(tnrm)
     denom = lvec.dot(tnrm)
 
-    dist = full((lnum, tnum), fill_value=float('inf'))
+    dist = full((lnum, tnum), fill_value=float('inf'), dtype=float_type(numer))
 
     denchk = absolute(denom) > tolerance
 
@@ -1,17 +1,61 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from types import NotImplementedType
 from typing import TYPE_CHECKING, Any
 
-from numpy import (allclose, asarray, concatenate, copy, divide, full, hstack,
-                   isclose, logical_and, logical_or, matmul, multiply, ndim,
-                   ravel, repeat, reshape, result_type, shape, size, split,
-                   sqrt, stack, sum, transpose, zeros)
-from numpy.linalg import solve
+from numpy import (allclose, asarray, ascontiguousarray, concatenate, copy,
+                   copyto, divide, full, hstack, isclose, logical_and,
+                   logical_not, logical_or, multiply, ndarray, ndim, ravel,
+                   repeat, reshape, result_type, shape, shares_memory, size,
+                   split, sqrt, stack, sum, transpose, zeros)
+from numpy import load as load_npy
+from numpy import save as save_npy
+from numpy.lib.stride_tricks import as_strided
+
+from ..tools.componentwise import componentwise_function, componentwise_ufunc
+from ..tools.linsolve import linear_solve
+from ..tools.precision import get_float_dtype
 
 if TYPE_CHECKING:
+    from os import PathLike
+
     from numpy import bool_, ufunc
     from numpy.typing import DTypeLike, NDArray
 
+    from ..tools.linsolve import VectorSolver
+
+
+def _shape_tuple(shape: 'int | Iterable[int]') -> tuple[int, ...]:
+    if isinstance(shape, Iterable):
+        return tuple(shape)
+    return (shape, )
+
+def _leading_key(key: Any) -> bool:
+    """Returns True if key only indexes the leading axes of an array."""
+    if not isinstance(key, tuple):
+        key = (key, )
+    return all(k is not Ellipsis and k is not None for k in key)
+
+def _overlaps(out: 'Vector', *vectors: 'Vector') -> bool:
+    """Returns True if a component of out shares memory with a component
+    of vectors."""
+    for ocomp in (out.x, out.y, out.z):
+        for vector in vectors:
+            for comp in (vector.x, vector.y, vector.z):
+                if shares_memory(ocomp, comp):
+                    return True
+    return False
+
+def _rebuild_vector(cls: type['Vector'], xyzarr: 'NDArray',
+                    state: dict[str, Any] | None) -> 'Vector':
+    vector = cls.__new__(cls)
+    vector.x = xyzarr[..., 0]
+    vector.y = xyzarr[..., 1]
+    vector.z = xyzarr[..., 2]
+    if state:
+        vector.__dict__.update(state)
+    return vector
+
+
 class Vector:
     """Vector Class"""
     x: 'NDArray'
@@ -25,32 +69,47 @@ class Vector:
         self.y = y
         self.z = z
 
-    def return_magnitude(self) -> 'NDArray':
+    def return_magnitude(self, out: 'NDArray | None' = None) -> 'NDArray':
         """Returns the magnitude array of this array vector"""
-        return sqrt(self.dot(self))
-
-    def to_unit(self, return_magnitude: bool = False) -> 'Vector | tuple[Vector, NDArray]':
-        """Returns the unit vector of this vector"""
+        if out is None:
+            return sqrt(self.dot(self))
+        self.dot(self, out=out)
+        return sqrt(out, out=out)
+
+    def to_unit(self, return_magnitude: bool = False,
+                out: 'Vector | None' = None) -> 'Vector | tuple[Vector, NDArray]':
+        """Returns the unit vector of this vector, written to out if given"""
         mag = self.return_magnitude()
-        x = zeros(shape(mag))
-        y = zeros(shape(mag))
-        z = zeros(shape(mag))
         magnot0 = mag != 0.0
-        divide(self.x, mag, out=x, where=magnot0)
-        divide(self.y, mag, out=y, where=magnot0)
-        divide(self.z, mag, out=z, where=magnot0)
+        if out is None:
+            dtyp = result_type(mag)
+            out = Vector(zeros(shape(mag), dtype=dtyp), zeros(shape(mag), dtype=dtyp),
+                         zeros(shape(mag), dtype=dtyp))
+        elif not magnot0.all():
+            magis0 = logical_not(magnot0)
+            copyto(out.x, 0.0, where=magis0)
+            copyto(out.y, 0.0, where=magis0)
+            copyto(out.z, 0.0, where=magis0)
+        divide(self.x, mag, out=out.x, where=magnot0)
+        divide(self.y, mag, out=out.y, where=magnot0)
+        divide(self.z, mag, out=out.z, where=magnot0)
         if return_magnitude:
-            return Vector(x, y, z), mag
+            return out, mag
         else:
-            return Vector(x, y, z)
+            return out
 
     def to_xyz(self) -> tuple['NDArray', 'NDArray', 'NDArray']:
         """Returns the x, y and z values of this array vector"""
         return self.x, self.y, self.z
 
-    def dot(self, vector: 'Vector') -> 'NDArray':
+    def dot(self, vector: 'Vector', out: 'NDArray | None' = None) -> 'NDArray':
         try:
-            return self.x*vector.x + self.y*vector.y + self.z*vector.z
+            if out is None:
+                return self.x*vector.x + self.y*vector.y + self.z*vector.z
+            multiply(self.x, vector.x, out=out)
+            out += self.y*vector.y
+            out += self.z*vector.z
+            return out
         except AttributeError:
             err = 'Vector dot product must be with Vector object.'
             raise TypeError(err)
@@ -62,8 +121,19 @@ class Vector:
             err = 'Vector matrix dot product must be with Vector object.'
             raise TypeError(err)
 
-    def cross(self, vector: 'Vector') -> 'Vector':
+    def cross(self, vector: 'Vector', out: 'Vector | None' = None) -> 'Vector':
         try:
+            if out is not None and _overlaps(out, self, vector):
+                out[...] = self.cross(vector)
+                return out
+            if out is not None:
+                multiply(self.y, vector.z, out=out.x)
+                out.x -= self.z*vector.y
+                multiply(self.z, vector.x, out=out.y)
+                out.y -= self.x*vector.z
+                multiply(self.x, vector.y, out=out.z)
+                out.z -= self.y*vector.x
+                return out
             x = self.y*vector.z - self.z*vector.y
             y = self.z*vector.x - self.x*vector.z
             z = self.x*vector.y - self.y*vector.x
@@ -135,6 +205,38 @@ class Vector:
             err = 'Vector object can only be subtracted from Vector object.'
             raise TypeError(err)
 
+    def __iadd__(self, obj: 'Vector') -> 'Vector':
+        try:
+            self.x += obj.x
+            self.y += obj.y
+            self.z += obj.z
+            return self
+        except AttributeError:
+            err = 'Vector object can only be added to Vector object.'
+            raise TypeError(err)
+
+    def __isub__(self, obj: 'Vector') -> 'Vector':
+        try:
+            self.x -= obj.x
+            self.y -= obj.y
+            self.z -= obj.z
+            return self
+        except AttributeError:
+            err = 'Vector object can only be subtracted from Vector object.'
+            raise TypeError(err)
+
+    def __imul__(self, obj: Any) -> 'Vector':
+        self.x *= obj
+        self.y *= obj
+        self.z *= obj
+        return self
+
+    def __itruediv__(self, obj: Any) -> 'Vector':
+        self.x /= obj
+        self.y /= obj
+        self.z /= obj
+        return self
+
     def __pos__(self) -> 'Vector':
         return self
 
@@ -184,7 +286,17 @@ class Vector:
             err = 'Vector object can only be matrix multiplied by a numpy ndarray.'
             raise TypeError(err)
 
+    def rmatmul(self, mat: Any) -> 'Vector':
+        """Returns the matrix product of mat with this vector, which also
+        works for sparse matrices that do not defer their @ operator."""
+        return Vector(mat@self.x, mat@self.y, mat@self.z)
+
     def __getitem__(self, key) -> 'Vector':
+        xyzarr = self._xyz_array()
+        if xyzarr is not None and _leading_key(key):
+            xyzarr = xyzarr[key]
+            if xyzarr.ndim > 1:
+                return Vector.from_xyz_array(xyzarr)
         x = self.x[key]
         y = self.y[key]
         z = self.z[key]
@@ -202,6 +314,51 @@ class Vector:
     def stack_xyz(self) -> 'NDArray':
         return stack((self.x, self.y, self.z), axis=-1)
 
+    def _xyz_array(self) -> 'NDArray | None':
+        """Returns the (..., 3) array the x, y and z arrays are views of
+        or None if they are not interleaved in a single buffer."""
+        x = self.x
+        if not isinstance(x, ndarray):
+            return None
+        step = x.itemsize
+        addr = x.__array_interface__['data'][0]
+        for i, comp in enumerate((self.y, self.z), start=1):
+            if not isinstance(comp, ndarray) or comp.dtype != x.dtype:
+                return None
+            if comp.shape != x.shape or comp.strides != x.strides:
+                return None
+            if comp.__array_interface__['data'][0] != addr + i*step:
+                return None
+        for size, stride in zip(x.shape, x.strides):
+            if size > 1 and abs(stride) < 3*step:
+                return None
+        return as_strided(x, shape=x.shape + (3,), strides=x.strides + (step,),
+                          writeable=x.flags.writeable)
+
+    def as_xyz_array(self) -> 'NDArray':
+        """Returns the vector as a (..., 3) array without copying when it is
+        stored interleaved, otherwise the components are stacked."""
+        xyzarr = self._xyz_array()
+        if xyzarr is None:
+            xyzarr = self.stack_xyz()
+        return xyzarr
+
+    @property
+    def interleaved(self) -> bool:
+        return self._xyz_array() is not None
+
+    def __reduce_ex__(self, protocol: int) -> tuple[Any, ...]:
+        """Pickles array vectors as a single contiguous (..., 3) array, which
+        pickle protocol 5 can pass out of band."""
+        x, y, z = self.x, self.y, self.z
+        if not all(isinstance(comp, ndarray) for comp in (x, y, z)):
+            return super().__reduce_ex__(protocol)
+        if not x.dtype == y.dtype == z.dtype or not x.shape == y.shape == z.shape:
+            return super().__reduce_ex__(protocol)
+        xyzarr = ascontiguousarray(self.as_xyz_array())
+        state = getattr(self, '__dict__', None)
+        return _rebuild_vector, (self.__class__, xyzarr, state)
+
     @property
     def shape(self) -> tuple[int, ...]:
         shape_x = shape(self.x)
@@ -255,23 +412,41 @@ class Vector:
         return Vector(x, y, z)
 
     def reshape(self, shape, order='C') -> 'Vector':
+        xyzarr = self._xyz_array()
+        if xyzarr is not None and order == 'C':
+            return Vector.from_xyz_array(xyzarr.reshape(_shape_tuple(shape) + (3,)))
         x = reshape(self.x, shape, order=order)
         y = reshape(self.y, shape, order=order)
         z = reshape(self.z, shape, order=order)
         return Vector(x, y, z)
 
     def ravel(self, order='C') -> 'Vector':
+        xyzarr = self._xyz_array()
+        if xyzarr is not None and order == 'C':
+            return Vector.from_xyz_array(xyzarr.reshape((-1, 3)))
         x = ravel(self.x, order=order)
         y = ravel(self.y, order=order)
         z = ravel(self.z, order=order)
         return Vector(x, y, z)
 
     def copy(self, order='C') -> 'Vector':
+        xyzarr = self._xyz_array()
+        if xyzarr is not None:
+            return Vector.from_xyz_array(copy(xyzarr, order=order))
         x = copy(self.x, order=order)
         y = copy(self.y, order=order)
         z = copy(self.z, order=order)
         return Vector(x, y, z)
 
+    def astype(self, dtype: 'DTypeLike', copy: bool = True) -> 'Vector':
+        xyzarr = self._xyz_array()
+        if xyzarr is not None:
+            return Vector.from_xyz_array(xyzarr.astype(dtype, copy=copy))
+        x = asarray(self.x).astype(dtype, copy=copy)
+        y = asarray(self.y).astype(dtype, copy=copy)
+        z = asarray(self.z).astype(dtype, copy=copy)
+        return Vector(x, y, z)
+
     def split(self, numsect: int,
               axis: int = -1) -> Iterable['Vector']:
         xlst = split(self.x, numsect, axis=axis)
@@ -313,11 +488,33 @@ class Vector:
     @classmethod
     def zeros(cls, shape: tuple[int, ...] = (),
               **kwargs: dict[str, Any]) -> 'Vector':
+        kwargs.setdefault('dtype', get_float_dtype())
         x = zeros(shape, **kwargs)
         y = zeros(shape, **kwargs)
         z = zeros(shape, **kwargs)
         return cls(x, y, z)
 
+    @classmethod
+    def from_xyz_array(cls, xyzarr: 'NDArray') -> 'Vector':
+        """Returns a vector whose x, y and z are views of a (..., 3) array."""
+        xyzarr = asarray(xyzarr)
+        if xyzarr.ndim == 0 or xyzarr.shape[-1] != 3:
+            raise ValueError('Vector xyz array must have a last axis of size 3.')
+        x = xyzarr[..., 0]
+        y = xyzarr[..., 1]
+        z = xyzarr[..., 2]
+        return cls(x, y, z)
+
+    def save(self, file: 'str | PathLike') -> None:
+        """Saves the vector to a .npy file as a (..., 3) array."""
+        save_npy(file, self.as_xyz_array())
+
+    @classmethod
+    def load(cls, file: 'str | PathLike', mmap_mode: str | None = None) -> 'Vector':
+        """Loads a vector saved with save, memory mapping the file if mmap_mode
+        is given so that only the parts indexed are read."""
+        return cls.from_xyz_array(load_npy(file, mmap_mode=mmap_mode))
+
     @classmethod
     def from_iter(cls, vecs: Iterable['Vector'],
                   **kwargs: dict[str, Any]) -> 'Vector':
@@ -406,34 +603,24 @@ class Vector:
         zclose = allclose(self.z, obj.z, rtol=rtol, atol=atol)
         return xclose and yclose and zclose
 
-    def solve(self, amat: 'NDArray') -> 'Vector':
+    def solve(self, amat: 'NDArray | VectorSolver') -> 'Vector':
+        """Returns the solution of amat x = self along the first axis. Any
+        trailing axes are solved as a batch of right hand sides."""
         shp = self.shape
         if self.ndim == 0:
             bvec = self.reshape((1, 1))
-        elif self.ndim == 1:
-            bvec = self.reshape((self.size, 1))
-        elif self.ndim == 2:
-            bvec = self
         else:
-            raise ValueError('Vector cannot be solved.')
+            bvec = self.reshape((shp[0], -1))
         bmat = hstack(bvec.to_xyz())
-        cmat = solve(amat, bmat)
+        cmat = linear_solve(amat, bmat)
         cvec = Vector(*split(cmat, 3, axis=1)).reshape(shp)
         return cvec
 
     def __array_ufunc__(self, ufunc: 'ufunc', method: str,
                         *inputs: tuple['NDArray | Vector', ...],
                         **kwargs: dict[str, Any]) -> 'Vector | NotImplementedType':
-        if method == '__call__':
-            if ufunc is multiply:
-                if inputs[1] is self:
-                    return self.__rmul__(inputs[0], **kwargs)
-                else:
-                    return NotImplemented
-            elif ufunc is matmul:
-                if inputs[1] is self:
-                    return self.__rmatmul__(inputs[0], **kwargs)
-                else:
-                    return NotImplemented
-        else:
-            return NotImplemented
+        return componentwise_ufunc(Vector, 'xyz', ufunc, method, inputs, kwargs)
+
+    def __array_function__(self, func: 'Callable[..., Any]', types: tuple[type, ...],
+                           args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        return componentwise_function(Vector, 'xyz', func, args, kwargs)
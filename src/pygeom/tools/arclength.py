@@ -0,0 +1,127 @@
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from numpy import (asarray, clip, concatenate, cumsum, divide, linspace,
+                   ravel, searchsorted, shape, unique, zeros)
+from numpy.polynomial.legendre import leggauss
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    DerivCallable = Callable[['NDArray'], Any]
+
+
+class ArcLengthTable():
+    """Cumulative arc length table of a parametric curve.
+
+    Every interval between the break parameters is divided into num equal
+    sub-intervals and the speed of the curve is integrated over all of them
+    at once with Gauss-Legendre quadrature of the given order. The inverse
+    lookup finds the sub-interval of each length with searchsorted,
+    interpolates an initial parameter and polishes it with Newton iteration.
+    """
+    deriv: 'DerivCallable' = None
+    t: 'NDArray' = None
+    s: 'NDArray' = None
+    order: int = None
+    _xi: 'NDArray' = None
+    _wi: 'NDArray' = None
+
+    def __init__(self, deriv: 'DerivCallable', breaks: 'NDArray',
+                 num: int = 4, order: int = 8) -> None:
+        self.deriv = deriv
+        self.order = order
+        self._xi, self._wi = leggauss(order)
+        breaks = unique(asarray(breaks, dtype=float))
+        frac = linspace(0.0, 1.0, num + 1)[:-1]
+        tsub = breaks[:-1, None] + (breaks[1:] - breaks[:-1])[:, None]*frac
+        self.t = concatenate((ravel(tsub), breaks[-1:]))
+        self.s = zeros(self.t.shape)
+        self.s[1:] = cumsum(self.integrate(self.t[:-1], self.t[1:]))
+
+    @property
+    def length(self) -> float:
+        return self.s[-1]
+
+    def speeds(self, u: 'NDArray') -> 'NDArray':
+        """Returns the magnitude of the first derivative at u."""
+        return asarray(self.deriv(u).return_magnitude()).reshape(shape(u))
+
+    def integrate(self, ta: 'NDArray', tb: 'NDArray') -> 'NDArray':
+        """Returns the arc length from ta to tb by Gauss-Legendre quadrature."""
+        ta = asarray(ta, dtype=float)
+        tb = asarray(tb, dtype=float)
+        half = (tb - ta)/2
+        mid = (tb + ta)/2
+        nodes = mid[..., None] + half[..., None]*self._xi
+        return (self.speeds(nodes)*self._wi).sum(axis=-1)*half
+
+    def evaluate_arclengths_at_t(self, u: 'NDArray') -> 'NDArray':
+        """Returns the arc length from the start of the curve to u."""
+        u = clip(asarray(u, dtype=float), self.t[0], self.t[-1])
+        ind = clip(searchsorted(self.t, u, side='right') - 1, 0, self.t.size - 2)
+        return self.s[ind] + self.integrate(self.t[ind], u)
+
+    def evaluate_t_at_arclengths(self, s: 'NDArray', tol: float = 1e-12,
+                                 maxiter: int = 8) -> 'NDArray':
+        """Returns the parameters at the arc lengths s from the start of the
+        curve."""
+        s = clip(asarray(s, dtype=float), 0.0, self.length)
+        ind = clip(searchsorted(self.s, s, side='right') - 1, 0, self.s.size - 2)
+        ta, tb = self.t[ind], self.t[ind + 1]
+        sa, sb = self.s[ind], self.s[ind + 1]
+        frac = divide(s - sa, sb - sa, out=zeros(s.shape), where=sb > sa)
+        t = ta + (tb - ta)*frac
+        for _ in range(maxiter):
+            err = sa + self.integrate(ta, t) - s
+            speed = self.speeds(t)
+            dt = divide(err, speed, out=zeros(t.shape), where=speed > 0.0)
+            t = clip(t - dt, ta, tb)
+            if (abs(err) <= tol*max(self.length, 1.0)).all():
+                break
+        return t
+
+    def __repr__(self) -> str:
+        return f'<ArcLengthTable: length={self.length:g}, numsub={self.t.size - 1:d}>'
+
+
+class ArcLengthCurve():
+    """Mixin adding arc length queries to a curve that defines
+    evaluate_points_at_t and evaluate_first_derivatives_at_t.
+
+    The arc length table spans the parameters in arclength_breaks, with
+    arclength_num sub-intervals between consecutive breaks, and is built on
+    first use.
+    """
+    arclength_num: int = 4
+    _arclength_table: ArcLengthTable = None
+
+    @property
+    def arclength_breaks(self) -> 'NDArray':
+        return asarray([0.0, 1.0])
+
+    @property
+    def arclength_table(self) -> ArcLengthTable:
+        if self._arclength_table is None:
+            self._arclength_table = ArcLengthTable(self.evaluate_first_derivatives_at_t,
+                                                   self.arclength_breaks,
+                                                   num=self.arclength_num)
+        return self._arclength_table
+
+    def evaluate_arclengths_at_t(self, u: 'NDArray') -> 'NDArray':
+        return self.arclength_table.evaluate_arclengths_at_t(u)
+
+    def evaluate_t_at_arclengths(self, arcl: 'NDArray') -> 'NDArray':
+        return self.arclength_table.evaluate_t_at_arclengths(arcl)
+
+    def evaluate_points_at_arclengths(self, arcl: 'NDArray') -> Any:
+        u = self.evaluate_t_at_arclengths(arcl)
+        return self.evaluate_points_at_t(u)
+
+    def evaluate_tangents_at_arclengths(self, arcl: 'NDArray') -> Any:
+        u = self.evaluate_t_at_arclengths(arcl)
+        return self.evaluate_first_derivatives_at_t(u).to_unit()
+
+    def evaluate_arclength_t(self, num: int) -> 'NDArray':
+        """Returns num + 1 parameters equally spaced in arc length."""
+        arcl = linspace(0.0, self.arclength_table.length, num + 1)
+        return self.evaluate_t_at_arclengths(arcl)
@@ -1,6 +1,16 @@
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from hashlib import blake2b
+from math import comb
+from typing import TYPE_CHECKING, Any
 
-from numpy import linspace, logical_and, shape, unique, where, zeros
+from numpy import (arange, asarray, ascontiguousarray, clip, concatenate,
+                   diff, flatnonzero, full, linspace, logical_and, logical_or,
+                   ravel, searchsorted, shape, unique, where, zeros)
+
+from .precision import as_float_array, float_type
+from .sparse import CSRMatrix
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -9,7 +19,7 @@ def basis_functions(p: int, k: 'NDArray', u: 'NDArray') -> 'NDArray':
     m = k.size - 1
     ushp = shape(u)
     Nushp = (m, *ushp)
-    Nu = zeros(Nushp)
+    Nu = zeros(Nushp, dtype=float_type(u))
     for i in range(m):
         check1 = u >= k[i]
         check2 = u < k[i + 1]
@@ -21,7 +31,7 @@ def basis_functions(p: int, k: 'NDArray', u: 'NDArray') -> 'NDArray':
         for j in range(1, p + 1):
             prevNu = Nu.copy()
             Nushp = (m - j, *ushp)
-            Nu = zeros(Nushp)
+            Nu = zeros(Nushp, dtype=float_type(u))
             for i in range(m - j):
                 Dk1 = k[i + j] - k[i]
                 Dk2 = k[i + 1 + j] - k[i + 1]
@@ -38,7 +48,7 @@ def basis_first_derivatives(p: int, k: 'NDArray', u: 'NDArray') -> 'NDArray':
     m = k.size - 1
     ushp = shape(u)
     dNushp = (m - p, *ushp)
-    dNu = zeros(dNushp)
+    dNu = zeros(dNushp, dtype=float_type(u))
     kp = k.copy()
     if kp[-1] == kp[-2]:
         kp = kp[:-1]
@@ -56,7 +66,7 @@ def basis_second_derivatives(p: int, k: 'NDArray', u: 'NDArray') -> 'NDArray':
     m = k.size - 1
     ushp = shape(u)
     d2Nushp = (m - p, *ushp)
-    d2Nu = zeros(d2Nushp)
+    d2Nu = zeros(d2Nushp, dtype=float_type(u))
     kp = k.copy()
     if kp[-1] == kp[-2]:
         kp = kp[:-1]
@@ -70,6 +80,338 @@ def basis_second_derivatives(p: int, k: 'NDArray', u: 'NDArray') -> 'NDArray':
             d2Nu[i] -= pdNu[i + 1]/Dk2
     return d2Nu
 
+def knot_spans(k: 'NDArray', u: 'NDArray') -> 'NDArray':
+    """Returns the knot span index i with k[i] <= u < k[i + 1] for each u.
+
+    Parameters equal to the last knot are assigned to the last non-zero length
+    span so that the end point is evaluated from the left.
+    """
+    nzspans = flatnonzero(diff(k) > 0.0)
+    span = searchsorted(k, u, side='right') - 1
+    return clip(span, nzspans[0], nzspans[-1])
+
+def _basis_knots(p: int, k: 'NDArray', u: 'NDArray') -> tuple['NDArray',
+                                                              'NDArray',
+                                                              'NDArray']:
+    kbeg = full(p, k[0])
+    kend = full(p, k[-1])
+    kp = concatenate((kbeg, k, kend)).astype(u.dtype, copy=False)
+    span = knot_spans(k, u)
+    return kp, ravel(span) + p, span
+
+def _basis_mask(p: int, k: 'NDArray', u: 'NDArray',
+                span: 'NDArray') -> 'NDArray':
+    n = k.size - p - 1
+    ind = ravel(span)[:, None] - p + arange(p + 1)
+    check1 = logical_or(ind < 0, ind >= n)
+    uf = ravel(u)[:, None]
+    check2 = logical_or(uf < k[0], uf > k[-1])
+    return logical_or(check1, check2)
+
+def basis_functions_sparse(p: int, k: 'NDArray',
+                           u: 'NDArray') -> tuple['NDArray', 'NDArray']:
+    """Returns the p + 1 non-zero basis functions and knot spans of u.
+
+    The values array has shape (*u.shape, p + 1) where values[..., r] is the
+    basis function with index span - p + r.
+    """
+    u = as_float_array(u)
+    ushp = shape(u)
+    kp, s, span = _basis_knots(p, k, u)
+    uf = ravel(u)
+    numu = uf.size
+    Nu = zeros((numu, p + 1), dtype=u.dtype)
+    Nu[:, 0] = 1.0
+    left = zeros((numu, p + 1), dtype=u.dtype)
+    right = zeros((numu, p + 1), dtype=u.dtype)
+    for j in range(1, p + 1):
+        left[:, j] = uf - kp[s + 1 - j]
+        right[:, j] = kp[s + j] - uf
+        saved = zeros(numu, dtype=u.dtype)
+        for r in range(j):
+            temp = Nu[:, r]/(right[:, r + 1] + left[:, j - r])
+            Nu[:, r] = saved + right[:, r + 1]*temp
+            saved = left[:, j - r]*temp
+        Nu[:, j] = saved
+    Nu[_basis_mask(p, k, u, span)] = 0.0
+    return Nu.reshape((*ushp, p + 1)), span
+
+def basis_derivatives_sparse(p: int, k: 'NDArray', u: 'NDArray',
+                             n: int) -> tuple['NDArray', 'NDArray']:
+    """Returns the p + 1 non-zero basis functions and their derivatives up to
+    order n from a single triangular recursion, along with the knot spans.
+
+    The derivatives array has shape (n + 1, *u.shape, p + 1) where
+    ders[i, ..., r] is the ith derivative of the basis function with index
+    span - p + r.
+    """
+    u = as_float_array(u)
+    ushp = shape(u)
+    kp, s, span = _basis_knots(p, k, u)
+    uf = ravel(u)
+    numu = uf.size
+    ndu = zeros((p + 1, p + 1, numu), dtype=u.dtype)
+    ndu[0, 0] = 1.0
+    left = zeros((p + 1, numu), dtype=u.dtype)
+    right = zeros((p + 1, numu), dtype=u.dtype)
+    for j in range(1, p + 1):
+        left[j] = uf - kp[s + 1 - j]
+        right[j] = kp[s + j] - uf
+        saved = zeros(numu, dtype=u.dtype)
+        for r in range(j):
+            ndu[j, r] = right[r + 1] + left[j - r]
+            temp = ndu[r, j - 1]/ndu[j, r]
+            ndu[r, j] = saved + right[r + 1]*temp
+            saved = left[j - r]*temp
+        ndu[j, j] = saved
+    ders = zeros((n + 1, p + 1, numu), dtype=u.dtype)
+    ders[0] = ndu[:, p]
+    a = zeros((2, p + 1, numu), dtype=u.dtype)
+    for r in range(p + 1):
+        s1, s2 = 0, 1
+        a[0, 0] = 1.0
+        for i in range(1, min(n, p) + 1):
+            d = zeros(numu, dtype=u.dtype)
+            ri = r - i
+            pi = p - i
+            if r >= i:
+                a[s2, 0] = a[s1, 0]/ndu[pi + 1, ri]
+                d += a[s2, 0]*ndu[ri, pi]
+            j1 = 1 if ri >= -1 else -ri
+            j2 = i - 1 if r - 1 <= pi else p - r
+            for j in range(j1, j2 + 1):
+                a[s2, j] = (a[s1, j] - a[s1, j - 1])/ndu[pi + 1, ri + j]
+                d += a[s2, j]*ndu[ri + j, pi]
+            if r <= pi:
+                a[s2, i] = -a[s1, i - 1]/ndu[pi + 1, r]
+                d += a[s2, i]*ndu[r, pi]
+            ders[i, r] = d
+            s1, s2 = s2, s1
+    fac = p
+    for i in range(1, min(n, p) + 1):
+        ders[i] *= fac
+        fac *= p - i
+    ders = ders.transpose((0, 2, 1))
+    ders[:, _basis_mask(p, k, u, span)] = 0.0
+    return ders.reshape((n + 1, *ushp, p + 1)), span
+
+def basis_sparse_to_dense(n: int, Nu: 'NDArray', span: 'NDArray') -> 'NDArray':
+    """Returns the dense (n, *span.shape) basis array of a sparse basis."""
+    p = Nu.shape[-1] - 1
+    ushp = shape(span)
+    spanf = ravel(span)
+    Nuf = Nu.reshape((spanf.size, p + 1))
+    col = arange(spanf.size)
+    dense = zeros((n, spanf.size), dtype=float_type(Nu))
+    for r in range(p + 1):
+        ind = clip(spanf - p + r, 0, n - 1)
+        dense[ind, col] += Nuf[:, r]
+    return dense.reshape((n, *ushp))
+
+def basis_sparse_to_csr(n: int, Nu: 'NDArray', span: 'NDArray') -> CSRMatrix:
+    """Returns the (span.size, n) sparse basis matrix of a sparse basis, so
+    that its product with n control points evaluates the flattened points."""
+    p = Nu.shape[-1] - 1
+    spanf = ravel(span)
+    Nuf = Nu.reshape((spanf.size, p + 1))
+    rows = arange(spanf.size).repeat(p + 1)
+    cols = (spanf[:, None] - p + arange(p + 1)).ravel()
+    check = logical_and(cols >= 0, cols < n)
+    return CSRMatrix.from_coo(rows[check], cols[check], Nuf.ravel()[check],
+                              (spanf.size, n))
+
+def basis_sparse_product(ctlpnts: Any, Nu: 'NDArray', span: 'NDArray') -> Any:
+    """Returns the sum of the sparse basis times the control points.
+
+    The first axis of ctlpnts is contracted and the result has shape
+    (*span.shape, *ctlpnts.shape[1:]). ctlpnts can be a Vector, a Vector2D
+    or an ndarray.
+    """
+    p = Nu.shape[-1] - 1
+    n = ctlpnts.shape[0]
+    tshp = (*shape(span), *(1,)*(ctlpnts.ndim - 1))
+    result = None
+    for r in range(p + 1):
+        ind = clip(span - p + r, 0, n - 1)
+        term = ctlpnts[ind]*Nu[..., r].reshape(tshp)
+        if result is None:
+            result = term
+        else:
+            result += term
+    return result
+
+def basis_sparse_grid_product(ctlpnts: Any, Nu: 'NDArray', spanu: 'NDArray',
+                              Nv: 'NDArray', spanv: 'NDArray') -> Any:
+    """Returns the tensor product of sparse u and v bases with a control net.
+
+    The control net is contracted in v first and then in u, so the result has
+    shape (u.size, v.size) and only the active control points are visited.
+    """
+    ctlv = basis_sparse_product(ctlpnts.transpose(), Nv, spanv)
+    return basis_sparse_product(ctlv.transpose(), Nu, spanu)
+
+def basis_sparse_mesh_product(ctlpnts: Any, Nu: 'NDArray', spanu: 'NDArray',
+                              Nv: 'NDArray', spanv: 'NDArray') -> Any:
+    """Returns the tensor product of sparse u and v bases with a control net
+    for paired (u, v) samples.
+
+    Only the (p + 1)(q + 1) active control points of each sample are gathered
+    and the result has the shape of spanu and spanv.
+    """
+    p = Nu.shape[-1] - 1
+    q = Nv.shape[-1] - 1
+    nu, nv = ctlpnts.shape[:2]
+    indu = clip(spanu[..., None] - p + arange(p + 1), 0, nu - 1)
+    indv = clip(spanv[..., None] - q + arange(q + 1), 0, nv - 1)
+    Nuv = Nu[..., :, None]*Nv[..., None, :]
+    active = ctlpnts[indu[..., :, None], indv[..., None, :]]
+    return (active*Nuv).sum(axis=(-2, -1))
+
+def basis_sparse_mesh_derivatives(ctlpnts: Any, dNu: 'NDArray', spanu: 'NDArray',
+                                  dNv: 'NDArray', spanv: 'NDArray',
+                                  order: int) -> list[list[Any]]:
+    """Returns the products ders[k][l] of the kth u and lth v sparse basis
+    derivatives with a control net for paired (u, v) samples and k + l <= order.
+
+    The active control points are gathered once and contracted in v and then
+    in u for every derivative.
+    """
+    p = dNu.shape[-1] - 1
+    q = dNv.shape[-1] - 1
+    nu, nv = ctlpnts.shape[:2]
+    indu = clip(spanu[..., None] - p + arange(p + 1), 0, nu - 1)
+    indv = clip(spanv[..., None] - q + arange(q + 1), 0, nv - 1)
+    active = ctlpnts[indu[..., :, None], indv[..., None, :]]
+    ders = [[None]*(order - k + 1) for k in range(order + 1)]
+    for l in range(order + 1):
+        ctlv = (active*dNv[l][..., None, :]).sum(axis=-1)
+        for k in range(order - l + 1):
+            ders[k][l] = (ctlv*dNu[k]).sum(axis=-1)
+    return ders
+
+def rational_derivatives(ders: list[Any], wders: list['NDArray']) -> list[Any]:
+    """Returns the derivatives of a rational function from the derivatives
+    of its weighted numerator and of its weight denominator."""
+    rders = []
+    for k, deriv in enumerate(ders):
+        for i in range(1, k + 1):
+            deriv = deriv - rders[k - i]*(comb(k, i)*wders[i])
+        rders.append(deriv/wders[0])
+    return rders
+
+def rational_surface_derivatives(ders: list[list[Any]],
+                                 wders: list[list['NDArray']]) -> list[list[Any]]:
+    """Returns the derivatives ders[k][l] of a rational surface, with k
+    derivatives in u and l in v, from the derivatives of its weighted
+    numerator and of its weight denominator."""
+    rders = []
+    for k, row in enumerate(ders):
+        rrow = []
+        for l, deriv in enumerate(row):
+            for j in range(1, l + 1):
+                deriv = deriv - rrow[l - j]*(comb(l, j)*wders[0][j])
+            for i in range(1, k + 1):
+                deriv = deriv - rders[k - i][l]*(comb(k, i)*wders[i][0])
+                for j in range(1, l + 1):
+                    deriv = deriv - rders[k - i][l - j]*(comb(k, i)*comb(l, j)*wders[i][j])
+            rrow.append(deriv/wders[0][0])
+        rders.append(rrow)
+    return rders
+
+class BasisCache():
+    """Bounded least recently used cache of sparse basis tables.
+
+    Tables are keyed on the degree and on the content of the knot and
+    parameter arrays, so equal knots and parameters from different objects
+    share the same entry. A table of derivative order n also serves requests
+    for any lower order. Cached arrays are returned read only. Tables for
+    more than maxnum parameters, or requested within a bypass block, are
+    computed but not stored.
+    """
+    maxsize: int = None
+    maxnum: int = None
+    hits: int = None
+    misses: int = None
+    _bypass: int = 0
+    _data: OrderedDict[tuple[Any, ...], tuple['NDArray', 'NDArray']] = None
+
+    def __init__(self, maxsize: int = 16, maxnum: int = 65536) -> None:
+        self.maxsize = maxsize
+        self.maxnum = maxnum
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        return len(self._data)
+
+    @staticmethod
+    def key(p: int, k: 'NDArray', u: 'NDArray') -> tuple[Any, ...]:
+        khash = blake2b(k.tobytes(), digest_size=16).digest()
+        uhash = blake2b(u.tobytes(), digest_size=16).digest()
+        return (p, k.shape, khash, u.shape, u.dtype.str, uhash)
+
+    def basis_derivatives_sparse(self, p: int, k: 'NDArray', u: 'NDArray',
+                                 n: int) -> tuple['NDArray', 'NDArray']:
+        k = ascontiguousarray(k, dtype=float)
+        u = asarray(u, dtype=float_type(u))
+        if u.size > self.maxnum or self._bypass > 0:
+            self.misses += 1
+            return basis_derivatives_sparse(p, k, u, n)
+        shp = u.shape
+        u = ascontiguousarray(u.ravel())
+        key = self.key(p, k, u)
+        entry = self._data.get(key)
+        if entry is not None and entry[0].shape[0] > n:
+            self.hits += 1
+            self._data.move_to_end(key)
+            ders, span = entry
+        else:
+            self.misses += 1
+            ders, span = basis_derivatives_sparse(p, k, u, n)
+            span = asarray(span)
+            ders.flags.writeable = False
+            span.flags.writeable = False
+            if self.maxsize > 0:
+                self._data[key] = (ders, span)
+                self._data.move_to_end(key)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        ders = ders[:n + 1].reshape((n + 1, *shp, p + 1))
+        return ders, span.reshape(shp)
+
+    @contextmanager
+    def bypass(self) -> Iterator['BasisCache']:
+        """Computes tables without storing them within a with block, for one
+        off parameters such as the iterates of a Newton solve."""
+        self._bypass += 1
+        try:
+            yield self
+        finally:
+            self._bypass -= 1
+
+    def basis_functions_sparse(self, p: int, k: 'NDArray',
+                               u: 'NDArray') -> tuple['NDArray', 'NDArray']:
+        ders, span = self.basis_derivatives_sparse(p, k, u, 0)
+        return ders[0], span
+
+    def cache_info(self) -> dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses,
+                'maxsize': self.maxsize, 'maxnum': self.maxnum,
+                'size': self.size}
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f'<BasisCache: size={self.size:d}, maxsize={self.maxsize:d}>'
+
+
+basis_cache = BasisCache()
+
 def knots_from_spacing(spacing: 'NDArray', degree: int) -> 'NDArray':
     fullknots = spacing.repeat(degree)
     if degree > 1:
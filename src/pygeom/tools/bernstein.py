@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 
 from numpy import empty, size, zeros
 
+from .precision import float_type
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
     from sympy import Symbol
@@ -55,7 +57,7 @@ def bernstein_second_derivative(n: int, i: int, t: 'NDArray') -> 'NDArray':
 
 def bernstein_polynomials(n: int, t: 'NDArray') -> 'NDArray':
     size_t = size(t)
-    polys = zeros((n + 1, size_t), dtype=type(t))
+    polys = zeros((n + 1, size_t), dtype=float_type(t))
     for i in range(n + 1):
         polys[i, :] = bernstein_polynomial(n, i, t)
     if size_t == 1:
@@ -64,7 +66,7 @@ def bernstein_polynomials(n: int, t: 'NDArray') -> 'NDArray':
 
 def bernstein_first_derivatives(n: int, t: 'NDArray') -> 'NDArray':
     size_t = size(t)
-    polyder1s = zeros((n + 1, size_t))
+    polyder1s = zeros((n + 1, size_t), dtype=float_type(t))
     for i in range(n + 1):
         polyder1s[i, :] = bernstein_first_derivative(n, i, t)
     if size_t == 1:
@@ -73,7 +75,7 @@ def bernstein_first_derivatives(n: int, t: 'NDArray') -> 'NDArray':
 
 def bernstein_second_derivatives(n: int, t: 'NDArray') -> 'NDArray':
     size_t = size(t)
-    polyder2s = zeros((n + 1, size_t))
+    polyder2s = zeros((n + 1, size_t), dtype=float_type(t))
     for i in range(n + 1):
         polyder2s[i, :] = bernstein_second_derivative(n, i, t)
     if size_t == 1:
@@ -0,0 +1,95 @@
+from typing import TYPE_CHECKING, Any
+
+from numpy import asarray, empty, zeros
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
+
+
+class ArrayBuffer():
+    """Growable typed array of rows with amortised constant time appends.
+
+    Rows are written into a preallocated array whose capacity doubles when
+    it is full, and view returns the filled rows without copying. Rows that
+    have been handed out by view are never overwritten, clear releases the
+    array rather than reusing it.
+    """
+    dtype: 'DTypeLike' = None
+    ncol: int = None
+    size: int = None
+    _data: 'NDArray' = None
+    _view: 'NDArray' = None
+
+    def __init__(self, dtype: 'DTypeLike', ncol: int | None = None) -> None:
+        self.dtype = dtype
+        self.ncol = ncol
+        self.size = 0
+
+    @classmethod
+    def from_array(cls, arr: 'NDArray') -> 'ArrayBuffer':
+        arr = asarray(arr)
+        buffer = cls(arr.dtype, arr.shape[1])
+        buffer.extend(arr)
+        return buffer
+
+    @property
+    def capacity(self) -> int:
+        if self._data is None:
+            return 0
+        return self._data.shape[0]
+
+    def reserve(self, capacity: int) -> None:
+        """Grows the buffer to hold at least capacity rows."""
+        if capacity <= self.capacity:
+            return
+        capacity = max(capacity, 2*self.capacity, 16)
+        data = empty((capacity, self.ncol), dtype=self.dtype)
+        if self.size > 0:
+            data[:self.size] = self._data[:self.size]
+        self._data = data
+
+    def append(self, value: Any) -> None:
+        if self.ncol is None:
+            self.ncol = asarray(value).size
+        if self.size == self.capacity:
+            self.reserve(self.size + 1)
+        self._data[self.size] = value
+        self.size += 1
+
+    def extend(self, values: 'NDArray') -> None:
+        values = asarray(values)
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        if self.ncol is None:
+            self.ncol = values.shape[1]
+        num = values.shape[0]
+        self.reserve(self.size + num)
+        self._data[self.size:self.size + num] = values
+        self.size += num
+
+    def view(self) -> 'NDArray':
+        """Returns the filled rows as a view of the buffer."""
+        if self._data is None:
+            self._view = zeros((0, self.ncol or 0), dtype=self.dtype)
+        else:
+            self._view = self._data[:self.size]
+        return self._view
+
+    def holds(self, arr: 'NDArray') -> bool:
+        """Returns True if arr is the latest view of the buffer."""
+        return arr is self._view and arr.shape[0] == self.size
+
+    def clear(self) -> None:
+        self.size = 0
+        self._data = None
+        self._view = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        if self._data is not None:
+            state['_data'] = self._data[:self.size].copy()
+        state['_view'] = None
+        return state
+
+    def __repr__(self) -> str:
+        return f'<ArrayBuffer: size={self.size:d}, capacity={self.capacity:d}>'
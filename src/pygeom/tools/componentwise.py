@@ -0,0 +1,97 @@
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+import numpy
+from numpy import ndarray
+
+if TYPE_CHECKING:
+    from numpy import ufunc
+
+
+COMPONENTWISE_NAMES = (
+    'append', 'around', 'array_split', 'atleast_1d', 'atleast_2d',
+    'atleast_3d', 'average', 'broadcast_to', 'choose', 'clip',
+    'column_stack', 'compress', 'concatenate', 'copy', 'copyto', 'cumsum',
+    'delete', 'diff', 'digitize', 'dstack', 'empty_like', 'expand_dims',
+    'extract', 'flip', 'fliplr', 'flipud', 'full_like', 'hsplit', 'hstack',
+    'insert', 'interp', 'max', 'mean', 'min', 'moveaxis', 'nan_to_num',
+    'ones_like', 'pad', 'place', 'put', 'put_along_axis', 'ravel',
+    'repeat', 'reshape', 'roll', 'rot90', 'round', 'searchsorted',
+    'select', 'split', 'squeeze', 'stack', 'sum', 'swapaxes', 'take',
+    'take_along_axis', 'tile', 'transpose', 'trapezoid', 'vsplit',
+    'vstack', 'where', 'zeros_like',
+)
+
+COMPONENTWISE_FUNCTIONS = {getattr(numpy, name) for name in COMPONENTWISE_NAMES
+                           if hasattr(numpy, name)}
+
+ATTRIBUTE_FUNCTIONS = {numpy.shape: 'shape', numpy.ndim: 'ndim',
+                       numpy.size: 'size'}
+
+
+def split_component(obj: Any, cls: type, comp: str) -> Any:
+    """Returns obj with every instance of cls, including those nested in
+    lists, tuples and dicts, replaced by its comp component."""
+    if isinstance(obj, cls):
+        return getattr(obj, comp)
+    if isinstance(obj, (list, tuple)):
+        return obj.__class__(split_component(item, cls, comp) for item in obj)
+    if isinstance(obj, dict):
+        return {key: split_component(value, cls, comp) for key, value in obj.items()}
+    return obj
+
+def join_components(results: list[Any], cls: type) -> Any:
+    """Returns the instance of cls built from the per component results,
+    keeping the list or tuple structure of the results."""
+    first = results[0]
+    if first is None:
+        return None
+    if isinstance(first, (list, tuple)):
+        return first.__class__(join_components(list(items), cls)
+                               for items in zip(*results))
+    return cls(*results)
+
+def foreign_operand(obj: Any, cls: type) -> bool:
+    """Returns True if obj defines its own array protocol and is neither an
+    ndarray nor an instance of cls, so cls cannot handle it."""
+    if isinstance(obj, (list, tuple)):
+        return any(foreign_operand(item, cls) for item in obj)
+    if isinstance(obj, (cls, ndarray)):
+        return False
+    return hasattr(obj, '__array_ufunc__') or hasattr(obj, '__array_function__')
+
+def componentwise_ufunc(cls: type, comps: str, ufunc: 'ufunc', method: str,
+                        inputs: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    """Applies a ufunc method to each component of the cls operands."""
+    if foreign_operand(inputs, cls) or foreign_operand(kwargs.get('out', ()), cls):
+        return NotImplemented
+    func = getattr(ufunc, method)
+    results = []
+    for comp in comps:
+        comp_inputs = split_component(inputs, cls, comp)
+        comp_kwargs = split_component(kwargs, cls, comp)
+        results.append(func(*comp_inputs, **comp_kwargs))
+    out = kwargs.get('out', None)
+    if out is not None and all(isinstance(obj, cls) for obj in out):
+        return out[0] if len(out) == 1 else out
+    return join_components(results, cls)
+
+def componentwise_function(cls: type, comps: str, func: Callable[..., Any],
+                           args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    """Applies a numpy function to each component of the cls arguments or
+    defers to the numpy implementation if it has no componentwise form."""
+    if func in ATTRIBUTE_FUNCTIONS and isinstance(args[0], cls):
+        return getattr(args[0], ATTRIBUTE_FUNCTIONS[func])
+    if func not in COMPONENTWISE_FUNCTIONS:
+        return func._implementation(*args, **kwargs)
+    if foreign_operand(args, cls):
+        return NotImplemented
+    results = []
+    for comp in comps:
+        comp_args = split_component(args, cls, comp)
+        comp_kwargs = split_component(kwargs, cls, comp)
+        results.append(func(*comp_args, **comp_kwargs))
+    out = kwargs.get('out', None)
+    if isinstance(out, cls):
+        return out
+    return join_components(results, cls)
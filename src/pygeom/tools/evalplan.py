@@ -0,0 +1,215 @@
+from typing import TYPE_CHECKING, Any
+
+from numpy import arange, array_equal, clip, shape
+
+from .basis import (basis_derivatives_sparse, basis_sparse_to_csr,
+                    rational_derivatives)
+from .precision import as_float_array
+from .sparse import CSRMatrix
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from ..geom2d import NurbsCurve2D, NurbsSurface2D
+    from ..geom3d import NurbsCurve, NurbsSurface
+
+
+class NurbsCurvePlan():
+    """Precomputed sparse basis operators of a knot vector at fixed parameters.
+
+    The plan can be applied to any NurbsCurve or NurbsCurve2D with the same
+    degree and clamped knots, so updating control points or weights only
+    costs a gather and a sum over the degree + 1 active control points, or a
+    single product with the sparse operator.
+    """
+    degree: int = None
+    cknots: 'NDArray' = None
+    u: 'NDArray' = None
+    order: int = None
+    _ders: 'NDArray' = None
+    _span: 'NDArray' = None
+    _indices: 'NDArray' = None
+    _operators: dict[int, CSRMatrix] = None
+
+    def __init__(self, degree: int, cknots: 'NDArray', u: 'NDArray',
+                 order: int = 0) -> None:
+        self.degree = degree
+        self.cknots = as_float_array(cknots)
+        self.u = as_float_array(u)
+        self.order = order
+
+    @classmethod
+    def from_curve(cls, curve: 'NurbsCurve | NurbsCurve2D', u: 'NDArray',
+                   order: int = 0) -> 'NurbsCurvePlan':
+        return cls(curve.degree, curve.cknots, as_float_array(u, curve.dtype),
+                   order=order)
+
+    def reset(self) -> None:
+        for attr in self.__dict__:
+            if attr.startswith('_'):
+                setattr(self, attr, None)
+
+    @property
+    def numfunc(self) -> int:
+        return self.cknots.size - self.degree - 1
+
+    def evaluate_basis(self) -> None:
+        self._ders, self._span = basis_derivatives_sparse(self.degree,
+                                                          self.cknots, self.u,
+                                                          self.order)
+
+    @property
+    def ders(self) -> 'NDArray':
+        if self._ders is None:
+            self.evaluate_basis()
+        return self._ders
+
+    @property
+    def span(self) -> 'NDArray':
+        if self._span is None:
+            self.evaluate_basis()
+        return self._span
+
+    @property
+    def indices(self) -> 'NDArray':
+        if self._indices is None:
+            ind = self.span[..., None] - self.degree + arange(self.degree + 1)
+            self._indices = clip(ind, 0, self.numfunc - 1)
+        return self._indices
+
+    def operator(self, k: int = 0) -> CSRMatrix:
+        """Returns the sparse (u.size, numfunc) kth derivative operator, whose
+        product with the control points gives the flattened derivatives."""
+        if self._operators is None:
+            self._operators = {}
+        if k not in self._operators:
+            self._operators[k] = basis_sparse_to_csr(self.numfunc, self.ders[k],
+                                                     self.span)
+        return self._operators[k]
+
+    def apply(self, ctlpnts: Any, k: int = 0) -> Any:
+        """Returns the kth derivative basis applied to the control points."""
+        return (ctlpnts[self.indices]*self.ders[k]).sum(axis=-1)
+
+    def check(self, curve: 'NurbsCurve | NurbsCurve2D') -> None:
+        if curve.degree != self.degree:
+            raise ValueError('Curve degree does not match the plan degree.')
+        if not array_equal(curve.cknots, self.cknots):
+            raise ValueError('Curve knots do not match the plan knots.')
+
+    def evaluate_derivatives(self, curve: 'NurbsCurve | NurbsCurve2D',
+                             order: int | None = None) -> list[Any]:
+        self.check(curve)
+        if order is None:
+            order = self.order
+        if order > self.order:
+            raise ValueError('Derivative order exceeds the plan order.')
+        ders = [self.apply(curve.wpoints, k) for k in range(order + 1)]
+        if curve.rational:
+            wders = [self.apply(curve.weights, k) for k in range(order + 1)]
+            ders = rational_derivatives(ders, wders)
+        return ders
+
+    def evaluate_points(self, curve: 'NurbsCurve | NurbsCurve2D') -> Any:
+        return self.evaluate_derivatives(curve, 0)[0]
+
+    def evaluate_first_derivatives(self, curve: 'NurbsCurve | NurbsCurve2D') -> Any:
+        return self.evaluate_derivatives(curve, 1)[1]
+
+    def evaluate_second_derivatives(self, curve: 'NurbsCurve | NurbsCurve2D') -> Any:
+        return self.evaluate_derivatives(curve, 2)[2]
+
+    def __repr__(self) -> str:
+        return f'<NurbsCurvePlan: degree={self.degree:d}, order={self.order:d}>'
+
+
+class NurbsSurfacePlan():
+    """Precomputed sparse basis operators of u and v knot vectors at fixed
+    parameters.
+
+    With grid set to True the plan evaluates the tensor grid of 1D u and v
+    arrays like evaluate_points_at_uv, otherwise u and v are paired samples
+    like evaluate_points_at_uv_mesh.
+    """
+    uplan: NurbsCurvePlan = None
+    vplan: NurbsCurvePlan = None
+    grid: bool = None
+
+    def __init__(self, udegree: int, ucknots: 'NDArray', u: 'NDArray',
+                 vdegree: int, vcknots: 'NDArray', v: 'NDArray',
+                 order: int = 0, grid: bool = True) -> None:
+        if not grid and shape(u) != shape(v):
+            raise ValueError('The shapes of u and v must be the same.')
+        self.uplan = NurbsCurvePlan(udegree, ucknots, u, order=order)
+        self.vplan = NurbsCurvePlan(vdegree, vcknots, v, order=order)
+        self.grid = grid
+
+    @classmethod
+    def from_surface(cls, surface: 'NurbsSurface | NurbsSurface2D', u: 'NDArray',
+                     v: 'NDArray', order: int = 0,
+                     grid: bool = True) -> 'NurbsSurfacePlan':
+        u = as_float_array(u, surface.dtype)
+        v = as_float_array(v, surface.dtype)
+        return cls(surface.udegree, surface.ucknots, u,
+                   surface.vdegree, surface.vcknots, v,
+                   order=order, grid=grid)
+
+    @property
+    def order(self) -> int:
+        return self.uplan.order
+
+    def apply(self, ctlpnts: Any, ku: int = 0, kv: int = 0) -> Any:
+        """Returns the (ku, kv) derivative basis applied to the control net."""
+        Nu = self.uplan.ders[ku]
+        Nv = self.vplan.ders[kv]
+        indu = self.uplan.indices
+        indv = self.vplan.indices
+        if self.grid:
+            ctlv = (ctlpnts[:, indv]*Nv).sum(axis=-1)
+            return (ctlv[indu]*Nu[..., None]).sum(axis=1)
+        else:
+            Nuv = Nu[..., :, None]*Nv[..., None, :]
+            active = ctlpnts[indu[..., :, None], indv[..., None, :]]
+            return (active*Nuv).sum(axis=(-2, -1))
+
+    def check(self, surface: 'NurbsSurface | NurbsSurface2D') -> None:
+        if surface.udegree != self.uplan.degree:
+            raise ValueError('Surface udegree does not match the plan udegree.')
+        if surface.vdegree != self.vplan.degree:
+            raise ValueError('Surface vdegree does not match the plan vdegree.')
+        if not array_equal(surface.ucknots, self.uplan.cknots):
+            raise ValueError('Surface uknots do not match the plan uknots.')
+        if not array_equal(surface.vcknots, self.vplan.cknots):
+            raise ValueError('Surface vknots do not match the plan vknots.')
+
+    def evaluate_points(self, surface: 'NurbsSurface | NurbsSurface2D') -> Any:
+        self.check(surface)
+        numer = self.apply(surface.wpoints)
+        if surface.rational:
+            denom = self.apply(surface.weights)
+            points = numer/denom
+        else:
+            points = numer
+        return points
+
+    def evaluate_tangents(self, surface: 'NurbsSurface | NurbsSurface2D') -> tuple[Any, Any]:
+        self.check(surface)
+        if self.order < 1:
+            raise ValueError('Surface plan order must be at least 1 for tangents.')
+        dnumer_u = self.apply(surface.wpoints, 1, 0)
+        dnumer_v = self.apply(surface.wpoints, 0, 1)
+        if surface.rational:
+            numer = self.apply(surface.wpoints)
+            denom = self.apply(surface.weights)
+            ddenom_u = self.apply(surface.weights, 1, 0)
+            ddenom_v = self.apply(surface.weights, 0, 1)
+            tangent_u = (dnumer_u*denom - numer*ddenom_u)/denom**2
+            tangent_v = (dnumer_v*denom - numer*ddenom_v)/denom**2
+        else:
+            tangent_u = dnumer_u
+            tangent_v = dnumer_v
+        return tangent_u, tangent_v
+
+    def __repr__(self) -> str:
+        return (f'<NurbsSurfacePlan: udegree={self.uplan.degree:d}, '
+                f'vdegree={self.vplan.degree:d}, order={self.order:d}>')
@@ -5,6 +5,7 @@ from numpy import (arange, asarray, concatenate, diag, hstack, linspace, ones,
 from numpy.linalg import lstsq, norm
 
 from ..geom2d import Vector2D
+from .basis import basis_sparse_to_dense
 from .solvers import solve_clsq
 
 if TYPE_CHECKING:
@@ -96,10 +97,12 @@ def bspline2d_lstsq_fit(bspline: 'BSplineCurve2D', pnts_target: Vector2D,
 
         t_f = t[ind_t_f]
 
-        Nt = bspline.basis_functions(t).transpose()
+        Nt, spant = bspline.basis_functions_sparse(t)
+        Nt = basis_sparse_to_dense(numctl, Nt, spant).transpose()
         # print(f'Nt = \n{Nt}\n')
 
-        dNt = bspline.basis_first_derivatives(t).transpose()
+        dNt, spant = bspline.basis_derivatives_sparse(t, 1)
+        dNt = basis_sparse_to_dense(numctl, dNt[1], spant).transpose()
         # print(f'dNt = \n{dNt}\n')
 
         dDxdX_f = Nt[ind_p_f, ...]
@@ -0,0 +1,293 @@
+from itertools import product
+from typing import TYPE_CHECKING
+
+from numpy import (append, arange, argsort, asarray, clip, cumprod, cumsum,
+                   divide, flatnonzero, floor, full, inf, int64, meshgrid,
+                   minimum, ones, repeat, searchsorted, stack, unique, where,
+                   zeros)
+
+from .basis import basis_cache
+from .weld import hash_cells
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from ..geom2d import NurbsCurve2D, NurbsSurface2D, Vector2D
+    from ..geom3d import NurbsCurve, NurbsSurface, Vector
+    CurveLike = NurbsCurve | NurbsCurve2D
+    SurfaceLike = NurbsSurface | NurbsSurface2D
+    VectorLike = Vector | Vector2D
+
+
+def geometry_scale(ctlpnts: 'VectorLike') -> float:
+    """Returns the diagonal of the bounding box of the control points and
+    the origin, which bounds the size and the coordinates of the geometry."""
+    scale = 0.0
+    for comp in ctlpnts.__slots__:
+        values = getattr(ctlpnts, comp)
+        scale += (max(values.max(), 0.0) - min(values.min(), 0.0))**2
+    return float(scale)**0.5
+
+def nearest_samples(pnts: 'VectorLike', samples: 'VectorLike',
+                    maxcount: int = 2**22) -> 'NDArray':
+    """Returns the index of the nearest sample to each point.
+
+    The distances are computed by brute force for blocks of points so that
+    no more than maxcount point to sample distances are held at once.
+    """
+    pnts = pnts.ravel()
+    samples = samples.ravel().reshape((1, -1))
+    index = zeros(pnts.size, dtype=int)
+    chunk = max(maxcount//samples.size, 1)
+    for i in range(0, pnts.size, chunk):
+        diff = pnts[i:i + chunk].reshape((-1, 1)) - samples
+        index[i:i + chunk] = diff.dot(diff).argmin(axis=1)
+    return index
+
+
+class SampleGrid():
+    """Samples of a curve or surface bucketed in a uniform grid of cells.
+
+    The cell size is about the spacing of the samples along the geometry, so
+    the nearest sample to a point is found by searching rings of cells
+    outward from the cell of the point until no unsearched cell can be
+    closer. Points still unresolved after maxring rings are compared with
+    every sample.
+    """
+    num: int = None
+    samples: 'VectorLike' = None
+    params: tuple['NDArray', ...] = None
+    size: float = None
+    _lower: 'NDArray' = None
+    _maxcell: 'NDArray' = None
+    _keys: 'NDArray' = None
+    _order: 'NDArray' = None
+    _start: 'NDArray' = None
+    _count: 'NDArray' = None
+
+    def __init__(self, samples: 'VectorLike', params: tuple['NDArray', ...],
+                 num: int, dim: int) -> None:
+        self.num = num
+        self.samples = samples.ravel()
+        self.params = tuple(asarray(param).ravel() for param in params)
+        xyz = self._coordinates(self.samples)
+        self._lower = xyz.min(axis=0)
+        extent = float((xyz.max(axis=0) - self._lower).max())
+        spacing = extent/max(xyz.shape[0]**(1.0/dim) - 1.0, 1.0)
+        self.size = spacing if spacing > 0.0 else 1.0
+        cells = floor((xyz - self._lower)/self.size).astype(int64)
+        self._maxcell = cells.max(axis=0)
+        keys = hash_cells(cells)
+        order = argsort(keys, kind='stable')
+        skeys = keys[order]
+        first = ones(skeys.size, dtype=bool)
+        first[1:] = skeys[1:] != skeys[:-1]
+        self._start = flatnonzero(first)
+        self._keys = skeys[self._start]
+        self._count = append(self._start[1:], skeys.size) - self._start
+        self._order = order
+
+    @staticmethod
+    def _coordinates(pnts: 'VectorLike') -> 'NDArray':
+        return stack([asarray(getattr(pnts, comp), dtype=float).ravel()
+                      for comp in pnts.__slots__], axis=1)
+
+    def _searched(self, xyz: 'NDArray', cells: 'NDArray', ring: int) -> 'NDArray':
+        """Returns the distance of the points to the nearest face of the
+        block of cells searched so far that has cells beyond it."""
+        lower = self._lower + (cells - ring)*self.size
+        upper = self._lower + (cells + ring + 1)*self.size
+        dlower = where(cells - ring > 0, xyz - lower, inf)
+        dupper = where(cells + ring < self._maxcell, upper - xyz, inf)
+        return minimum(dlower, dupper).min(axis=1)
+
+    def _candidates(self, cells: 'NDArray', ring: int) -> 'NDArray':
+        """Returns the samples in the shell of cells ring cells away from
+        each of cells as rows padded with -1."""
+        ndim = cells.shape[1]
+        offsets = asarray([offset for offset in product(range(-ring, ring + 1),
+                                                        repeat=ndim)
+                           if max(abs(value) for value in offset) == ring],
+                          dtype=int64)
+        ncells = (cells[:, None, :] + offsets).reshape(-1, ndim)
+        valid = ((ncells >= 0) & (ncells <= self._maxcell)).all(axis=1)
+        keys = hash_cells(ncells)
+        pos = searchsorted(self._keys, keys)
+        pos[pos == self._keys.size] = 0
+        found = valid & (self._keys[pos] == keys)
+        count = zeros(keys.size, dtype=int64)
+        count[found] = self._count[pos[found]]
+        total = count.sum()
+        rowcount = count.reshape(cells.shape[0], -1).sum(axis=1)
+        cand = full((cells.shape[0], max(int(rowcount.max(initial=0)), 1)), -1,
+                    dtype=int64)
+        if total > 0:
+            first = cumsum(count) - count
+            jnd = repeat(self._start[pos] - first, count) + arange(total)
+            row = repeat(arange(cells.shape[0]), rowcount)
+            col = arange(total) - repeat(cumsum(rowcount) - rowcount, rowcount)
+            cand[row, col] = self._order[jnd]
+        return cand
+
+    def nearest(self, pnts: 'VectorLike', maxring: int = 4,
+                maxcount: int = 2**22) -> 'NDArray':
+        """Returns the index of the nearest sample to each point."""
+        xyz = self._coordinates(pnts)
+        sxyz = self._coordinates(self.samples)
+        num = xyz.shape[0]
+        cells = floor((xyz - self._lower)/self.size)
+        cells = clip(cells, 0, self._maxcell).astype(int64)
+        strides = cumprod(append(1, self._maxcell[:-1] + 1))
+        _, first, inverse = unique(cells@strides, return_index=True,
+                                   return_inverse=True)
+        ucells = cells[first]
+        best = full(num, inf)
+        index = zeros(num, dtype=int64)
+        active = arange(num)
+        for ring in range(maxring + 1):
+            uact, rows = unique(inverse[active], return_inverse=True)
+            cand = self._candidates(ucells[uact], ring)
+            chunk = max(maxcount//cand.shape[1], 1)
+            for i in range(0, active.size, chunk):
+                ind = active[i:i + chunk]
+                cnd = cand[rows[i:i + chunk]]
+                dist2 = ((xyz[ind, None, :] - sxyz[cnd])**2).sum(axis=2)
+                dist2[cnd < 0] = inf
+                jmin = dist2.argmin(axis=1)
+                dmin = dist2[arange(ind.size), jmin]
+                check = dmin < best[ind]
+                best[ind[check]] = dmin[check]
+                index[ind[check]] = cnd[check, jmin[check]]
+            active = active[best[active] > self._searched(xyz[active], cells[active],
+                                                          ring)**2]
+            if active.size == 0:
+                break
+        if active.size > 0:
+            index[active] = nearest_samples(pnts.ravel()[active], self.samples)
+        return index
+
+
+def curve_samples(curve: 'CurveLike', num: int) -> SampleGrid:
+    """Returns the grid of num samples per knot span of a curve, which is
+    kept on the curve until it is reset."""
+    grid = curve._sample_grid
+    if grid is None or grid.num != num:
+        k = curve.cknots
+        umin, umax = k[curve.degree], k[k.size - curve.degree - 1]
+        useed = clip(curve.evaluate_t(num), umin, umax)
+        seeds, = curve.evaluate_derivatives_at_t(useed, 0)
+        grid = SampleGrid(seeds, (useed, ), num, 1)
+        curve._sample_grid = grid
+    return grid
+
+def surface_samples(surface: 'SurfaceLike', num: int) -> SampleGrid:
+    """Returns the grid of num by num samples per knot span of a surface,
+    which is kept on the surface until it is reset."""
+    grid = surface._sample_grid
+    if grid is None or grid.num != num:
+        ku = surface.ucknots
+        kv = surface.vcknots
+        umin, umax = ku[surface.udegree], ku[ku.size - surface.udegree - 1]
+        vmin, vmax = kv[surface.vdegree], kv[kv.size - surface.vdegree - 1]
+        useed, vseed = surface.evaluate_uv(num, num)
+        useed = clip(useed, umin, umax)
+        vseed = clip(vseed, vmin, vmax)
+        seeds = surface.evaluate_points_at_uv(useed, vseed)
+        um, vm = meshgrid(useed, vseed, indexing='ij')
+        grid = SampleGrid(seeds, (um, vm), num, 2)
+        surface._sample_grid = grid
+    return grid
+
+def project_points_on_curve(curve: 'CurveLike', pnts: 'VectorLike',
+                            num: int = 8, tol: float = 1e-12,
+                            maxiter: int = 20) -> tuple['NDArray',
+                                                        'VectorLike',
+                                                        'NDArray']:
+    """Returns the parameters, foot points and distances of the closest
+    points on a curve to pnts.
+
+    The initial parameters are the nearest of num samples per knot span,
+    found through the SampleGrid kept on the curve, and all points are
+    improved together by Newton-Raphson iteration. Points are dropped from
+    the iteration once their step is smaller than tol relative to the
+    geometry scale of the control points.
+    """
+    shp = pnts.shape
+    pnts = pnts.ravel()
+    tol = tol*max(geometry_scale(curve.ctlpnts), 1.0)
+    k = curve.cknots
+    umin, umax = k[curve.degree], k[k.size - curve.degree - 1]
+    grid = curve_samples(curve, num)
+    u = grid.params[0][grid.nearest(pnts)]
+    active = arange(pnts.size)
+    with basis_cache.bypass():
+        for _ in range(maxiter):
+            ua = u[active]
+            pnt, der1, der2 = curve.evaluate_derivatives_at_t(ua, 2)
+            diff = pnt - pnts[active]
+            fun = der1.dot(diff)
+            dfun = der1.dot(der1) + der2.dot(diff)
+            du = divide(fun, dfun, out=zeros(fun.shape), where=dfun != 0.0)
+            unew = clip(ua - du, umin, umax)
+            step = abs(unew - ua)*der1.return_magnitude()
+            u[active] = unew
+            active = active[step > tol]
+            if active.size == 0:
+                break
+    foot, = curve.evaluate_derivatives_at_t(u, 0)
+    dist = (foot - pnts).return_magnitude()
+    return u.reshape(shp), foot.reshape(shp), dist.reshape(shp)
+
+def project_points_on_surface(surface: 'SurfaceLike', pnts: 'VectorLike',
+                              num: int = 8, tol: float = 1e-12,
+                              maxiter: int = 20) -> tuple['NDArray', 'NDArray',
+                                                          'VectorLike',
+                                                          'NDArray']:
+    """Returns the parameters, foot points and distances of the closest
+    points on a surface to pnts.
+
+    The initial parameters are the nearest of a grid of num by num samples
+    per knot span, found through the SampleGrid kept on the surface, and all
+    points are improved together by Newton-Raphson iteration. Points are
+    dropped from the iteration once their step is smaller than tol relative
+    to the geometry scale of the control points.
+    """
+    shp = pnts.shape
+    pnts = pnts.ravel()
+    tol = tol*max(geometry_scale(surface.ctlpnts), 1.0)
+    ku = surface.ucknots
+    kv = surface.vcknots
+    umin, umax = ku[surface.udegree], ku[ku.size - surface.udegree - 1]
+    vmin, vmax = kv[surface.vdegree], kv[kv.size - surface.vdegree - 1]
+    grid = surface_samples(surface, num)
+    index = grid.nearest(pnts)
+    u = grid.params[0][index]
+    v = grid.params[1][index]
+    active = arange(pnts.size)
+    with basis_cache.bypass():
+        for _ in range(maxiter):
+            ua = u[active]
+            va = v[active]
+            ders = surface.evaluate_derivatives_at_uv_mesh(ua, va, 2)
+            (pnt, der_v, der_vv), (der_u, der_uv), (der_uu, ) = ders
+            diff = pnt - pnts[active]
+            fun_u = der_u.dot(diff)
+            fun_v = der_v.dot(diff)
+            jac_uu = der_u.dot(der_u) + der_uu.dot(diff)
+            jac_uv = der_u.dot(der_v) + der_uv.dot(diff)
+            jac_vv = der_v.dot(der_v) + der_vv.dot(diff)
+            det = jac_uu*jac_vv - jac_uv**2
+            check = det != 0.0
+            du = divide(fun_u*jac_vv - fun_v*jac_uv, det, out=zeros(det.shape), where=check)
+            dv = divide(fun_v*jac_uu - fun_u*jac_uv, det, out=zeros(det.shape), where=check)
+            unew = clip(ua - du, umin, umax)
+            vnew = clip(va - dv, vmin, vmax)
+            step = (der_u*(unew - ua) + der_v*(vnew - va)).return_magnitude()
+            u[active] = unew
+            v[active] = vnew
+            active = active[step > tol]
+            if active.size == 0:
+                break
+    foot = surface.evaluate_points_at_uv_mesh(u, v)
+    dist = (foot - pnts).return_magnitude()
+    return u.reshape(shp), v.reshape(shp), foot.reshape(shp), dist.reshape(shp)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Any
 
-from numpy import arange, asarray, hstack, vstack, zeros
+from numpy import arange, asarray, ascontiguousarray, hstack, vstack, zeros
 
 from ..geom2d import Vector2D
 from ..geom3d import Vector
@@ -13,6 +13,8 @@ except ImportError:
     raise ImportError("k3d is not installed. Please install it using 'pip install k3d'")
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from ..geom2d import (CubicSpline2D, NurbsCurve2D, NurbsSurface2D,
                           ParamCurve2D)
     from ..geom3d import (CubicSpline, NurbsCurve, NurbsSurface, ParamCurve,
@@ -26,7 +28,12 @@ def make_vector_3d(vec: Vector | Vector2D) -> Vector:
     if hasattr(vec, 'z'):
         return vec
     else:
-        return Vector(vec.x, vec.y, zeros(vec.shape))
+        return Vector(vec.x, vec.y, zeros(vec.shape, dtype=vec.dtype))
+
+def k3d_array(vec: Vector) -> 'NDArray':
+    """Returns the vector as a contiguous float32 (..., 3) array, without
+    copying when it is already stored that way."""
+    return ascontiguousarray(vec.as_xyz_array(), dtype='float32')
 
 def k3d_curve(curve: 'CurveLike', **kwargs: dict[str, Any]) -> Line:
 
@@ -36,7 +43,7 @@ def k3d_curve(curve: 'CurveLike', **kwargs: dict[str, Any]) -> Line:
 
     pnts = make_vector_3d(curve.evaluate_points(num))
 
-    k3dpnts = pnts.stack_xyz().astype('float32')
+    k3dpnts = k3d_array(pnts)
 
     return line(k3dpnts, **kwargs)
 
@@ -50,8 +57,8 @@ def k3d_curve_tangents(curve: 'CurveLike', **kwargs: dict[str, Any]) -> Vectors:
     pnts = make_vector_3d(curve.evaluate_points(num))
     tgts = make_vector_3d(curve.evaluate_first_derivatives(num).to_unit())
 
-    k3dpnts = pnts.stack_xyz().astype('float32')
-    k3dtgts = tgts.stack_xyz().astype('float32')*scale
+    k3dpnts = k3d_array(pnts)
+    k3dtgts = k3d_array(tgts)*scale
 
     return vectors(k3dpnts, k3dtgts, **kwargs)
 
@@ -65,8 +72,8 @@ def k3d_curve_normals(curve: 'CurveLike', **kwargs: dict[str, Any]) -> Vectors:
     pnts = make_vector_3d(curve.evaluate_points(num))
     nrms = make_vector_3d(curve.evaluate_second_derivatives(num).to_unit())
 
-    k3dpnts = pnts.stack_xyz().astype('float32')
-    k3dnrms = nrms.stack_xyz().astype('float32')*scale
+    k3dpnts = k3d_array(pnts)
+    k3dnrms = k3d_array(nrms)*scale
 
     return vectors(k3dpnts, k3dnrms, **kwargs)
 
@@ -82,8 +89,8 @@ def k3d_curve_binormals(curve: 'CurveLike', **kwargs: dict[str, Any]) -> Vectors
     nrms = make_vector_3d(curve.evaluate_second_derivatives(num).to_unit())
     bins = tgts.cross(nrms).to_unit()
 
-    k3dpnts = pnts.stack_xyz().astype('float32')
-    binsxyz = bins.stack_xyz().astype('float32')*scale
+    k3dpnts = k3d_array(pnts)
+    binsxyz = k3d_array(bins)*scale
 
     return vectors(k3dpnts, binsxyz, **kwargs)
 
@@ -116,8 +123,8 @@ def k3d_surface(surface: 'SurfaceLike', **kwargs: dict[str, Any]) -> Mesh:
 
     faceind = asarray(faces, dtype='uint32')
 
-    k3dpnts = pnts.reshape(num).stack_xyz().astype('float32')
-    k3dnrms = nrms.reshape(num).stack_xyz().astype('float32')
+    k3dpnts = k3d_array(pnts.reshape(num))
+    k3dnrms = k3d_array(nrms.reshape(num))
 
     return mesh(k3dpnts, faceind, k3dnrms, **kwargs)
 
@@ -142,8 +149,8 @@ def k3d_surface_normals(surface: 'SurfaceLike', **kwargs: dict[str, Any]) -> Vec
 
     num = pnts.size
 
-    k3dpnts = pnts.reshape(num).stack_xyz().astype('float32')
-    k3dnrms = nrms.reshape(num).stack_xyz().astype('float32')*scale
+    k3dpnts = k3d_array(pnts.reshape(num))
+    k3dnrms = k3d_array(nrms.reshape(num))*scale
 
     return vectors(k3dpnts, k3dnrms, **kwargs)
 
@@ -173,9 +180,9 @@ def k3d_surface_tangents(surface: 'SurfaceLike',
 
     num = pnts.size
 
-    k3dpnts = pnts.reshape(num).stack_xyz().astype('float32')
-    k3dtgtsu = tgtsu.reshape(num).stack_xyz().astype('float32')*scale
-    k3dtgtsv = tgtsv.reshape(num).stack_xyz().astype('float32')*scale
+    k3dpnts = k3d_array(pnts.reshape(num))
+    k3dtgtsu = k3d_array(tgtsu.reshape(num))*scale
+    k3dtgtsv = k3d_array(tgtsv.reshape(num))*scale
 
     return vectors(k3dpnts, k3dtgtsu, **kwargsu), \
            vectors(k3dpnts, k3dtgtsv, **kwargsv)
@@ -189,9 +196,9 @@ def k3d_nurbs_control_points(curve: 'NurbsLike', **kwargs: dict[str, Any]) -> Po
     ctlpnts = make_vector_3d(curve.ctlpnts.ravel())
     weights = curve.weights.ravel()
 
-    k3dpnts = ctlpnts.stack_xyz().astype('float32')
+    k3dpnts = k3d_array(ctlpnts)
 
-    kwargs.setdefault('point_sizes', scale*weights.astype('float32'))
+    kwargs.setdefault('point_sizes', scale*asarray(weights, dtype='float32'))
 
     return points(k3dpnts, **kwargs)
 
@@ -207,13 +214,13 @@ def k3d_nurbs_control_polygon(surface: 'NurbsSurface', **kwargs: dict[str, Any])
     uindsb = inds[1:, :].reshape((-1, 1))
     ulinesind = hstack((uindsa, uindsb)).astype('float32')
     uctlpnts = make_vector_3d(surface.ctlpnts.reshape((-1, 1)).ravel())
-    uctlk3dpnts = uctlpnts.stack_xyz().astype('float32')
+    uctlk3dpnts = k3d_array(uctlpnts)
 
     vindsa = inds[:, :-1].reshape((-1, 1)) + inds.size
     vindsb = inds[:, 1:].reshape((-1, 1)) + inds.size
     vlinesind = hstack((vindsa, vindsb)).astype('float32')
     vctlpnts = make_vector_3d(surface.ctlpnts.reshape((-1, 1)).ravel())
-    vctlk3dpnts = vctlpnts.stack_xyz().astype('float32')
+    vctlk3dpnts = k3d_array(vctlpnts)
 
     ucolors = [kwargs['ucolor']] * inds.size
     vcolors = [kwargs['vcolor']] * inds.size
@@ -0,0 +1,212 @@
+from math import comb
+from typing import TYPE_CHECKING
+
+from numpy import (asarray, concatenate, count_nonzero, eye, full, moveaxis,
+                   searchsorted, unique, zeros)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+def find_span(p: int, k: 'NDArray', u: float) -> int:
+    """Returns the knot span index of u within the domain of the B-spline."""
+    n = k.size - p - 2
+    if u >= k[n + 1]:
+        return n
+    span = int(searchsorted(k, u, side='right')) - 1
+    return min(max(span, p), n)
+
+def refine_knot_vector(p: int, k: 'NDArray', ctlpnts: 'NDArray',
+                       x: 'NDArray', axis: int = 0) -> tuple['NDArray',
+                                                             'NDArray']:
+    """Inserts all of the sorted knots x into a B-spline in one pass.
+
+    The control points are stored along axis of ctlpnts and any other axes
+    are carried along, so whole control nets and homogeneous coordinates are
+    refined together. Returns the new knot vector and control points.
+    """
+    x = asarray(x, dtype=float)
+    if x.size == 0:
+        return k.copy(), ctlpnts.copy()
+    n = ctlpnts.shape[axis] - 1
+    if x[0] <= k[p] or x[-1] >= k[n + 1]:
+        raise ValueError('Inserted knots must be inside the knot domain.')
+    Pw = moveaxis(ctlpnts, axis, 0)
+    m = n + p + 1
+    r = x.size - 1
+    a = find_span(p, k, x[0])
+    b = find_span(p, k, x[r]) + 1
+    Qw = zeros((n + r + 2, *Pw.shape[1:]), dtype=Pw.dtype)
+    kbar = zeros(m + r + 2, dtype=k.dtype)
+    Qw[:a - p + 1] = Pw[:a - p + 1]
+    Qw[b + r:] = Pw[b - 1:]
+    kbar[:a + 1] = k[:a + 1]
+    kbar[b + p + r + 1:] = k[b + p:]
+    i = b + p - 1
+    j = b + p + r
+    for l in range(r, -1, -1):
+        while x[l] <= k[i] and i > a:
+            Qw[j - p - 1] = Pw[i - p - 1]
+            kbar[j] = k[i]
+            j -= 1
+            i -= 1
+        Qw[j - p - 1] = Qw[j - p]
+        for s in range(1, p + 1):
+            ind = j - p + s
+            alfa = kbar[j + s] - x[l]
+            if alfa == 0.0:
+                Qw[ind - 1] = Qw[ind]
+            else:
+                alfa = alfa/(kbar[j + s] - k[i - p + s])
+                Qw[ind - 1] = alfa*Qw[ind - 1] + (1.0 - alfa)*Qw[ind]
+        kbar[j] = x[l]
+        j -= 1
+    return kbar, moveaxis(Qw, 0, axis)
+
+def insert_knot(p: int, k: 'NDArray', ctlpnts: 'NDArray', x: float,
+                r: int = 1, axis: int = 0) -> tuple['NDArray', 'NDArray']:
+    """Inserts the knot x r times into a B-spline."""
+    return refine_knot_vector(p, k, ctlpnts, full(r, x, dtype=float), axis=axis)
+
+def knot_refinement_matrix(p: int, k: 'NDArray', x: 'NDArray') -> 'NDArray':
+    """Returns the matrix that maps the control points of a B-spline to the
+    control points after inserting the knots x."""
+    n = k.size - p - 1
+    _, refmat = refine_knot_vector(p, k, eye(n), x)
+    return refmat
+
+def bezier_knots(p: int, k: 'NDArray') -> 'NDArray':
+    """Returns the knots to insert so that every interior knot of a clamped
+    B-spline has multiplicity p."""
+    n = k.size - p - 2
+    interior = unique(k[p + 1:n + 1])
+    interior = interior[interior > k[p]]
+    interior = interior[interior < k[n + 1]]
+    x = [full(p - count_nonzero(k == xi), xi) for xi in interior]
+    if x:
+        return concatenate(x)
+    return zeros(0)
+
+def split_knot_vector(p: int, k: 'NDArray', ctlpnts: 'NDArray', x: float,
+                      axis: int = 0) -> tuple[tuple['NDArray', 'NDArray'],
+                                              tuple['NDArray', 'NDArray']]:
+    """Splits a clamped B-spline at x into two clamped B-splines."""
+    s = count_nonzero(k == x)
+    kbar, Qw = insert_knot(p, k, ctlpnts, x, r=max(p - s, 0), axis=axis)
+    ind = searchsorted(kbar, x, side='left')
+    kone = concatenate((kbar[:ind + p], full(1, x)))
+    ktwo = concatenate((full(1, x), kbar[ind:]))
+    Qw = moveaxis(Qw, axis, 0)
+    Qone = moveaxis(Qw[:ind], 0, axis)
+    Qtwo = moveaxis(Qw[ind - 1:], 0, axis)
+    return (kone, Qone), (ktwo, Qtwo)
+
+def elevate_degree(p: int, k: 'NDArray', ctlpnts: 'NDArray', t: int = 1,
+                   axis: int = 0) -> tuple['NDArray', 'NDArray']:
+    """Elevates the degree of a clamped B-spline from p to p + t.
+
+    Each Bezier segment is extracted, degree elevated and the redundant
+    knots are removed again as the knot vector is traversed. Returns the new
+    knot vector and control points.
+    """
+    if t < 1:
+        return k.copy(), ctlpnts.copy()
+    Pw = moveaxis(ctlpnts, axis, 0)
+    cshp = Pw.shape[1:]
+    n = Pw.shape[0] - 1
+    m = n + p + 1
+    ph = p + t
+    ph2 = ph//2
+    bezalfs = zeros((ph + 1, p + 1))
+    bezalfs[0, 0] = 1.0
+    bezalfs[ph, p] = 1.0
+    for i in range(1, ph2 + 1):
+        inv = 1.0/comb(ph, i)
+        for j in range(max(0, i - t), min(p, i) + 1):
+            bezalfs[i, j] = inv*comb(p, j)*comb(t, i - j)
+    for i in range(ph2 + 1, ph):
+        for j in range(max(0, i - t), min(p, i) + 1):
+            bezalfs[i, j] = bezalfs[ph - i, p - j]
+    numseg = unique(k).size - 1
+    Qw = zeros(((n + 1) + numseg*t, *cshp), dtype=Pw.dtype)
+    kh = zeros(Qw.shape[0] + ph + 1, dtype=k.dtype)
+    bpts = zeros((p + 1, *cshp), dtype=Pw.dtype)
+    ebpts = zeros((ph + 1, *cshp), dtype=Pw.dtype)
+    nextbpts = zeros((max(p - 1, 1), *cshp), dtype=Pw.dtype)
+    alfs = zeros(max(p - 1, 1))
+    mh = ph
+    kind = ph + 1
+    r = -1
+    a = p
+    b = p + 1
+    cind = 1
+    ua = k[0]
+    Qw[0] = Pw[0]
+    kh[:ph + 1] = ua
+    bpts[:] = Pw[:p + 1]
+    while b < m:
+        i = b
+        while b < m and k[b] == k[b + 1]:
+            b += 1
+        mul = b - i + 1
+        mh += mul + t
+        ub = k[b]
+        oldr = r
+        r = p - mul
+        lbz = (oldr + 2)//2 if oldr > 0 else 1
+        rbz = ph - (r + 1)//2 if r > 0 else ph
+        if r > 0:
+            numer = ub - ua
+            for q in range(p, mul, -1):
+                alfs[q - mul - 1] = numer/(k[a + q] - ua)
+            for j in range(1, r + 1):
+                save = r - j
+                s = mul + j
+                for q in range(p, s - 1, -1):
+                    bpts[q] = alfs[q - s]*bpts[q] + (1.0 - alfs[q - s])*bpts[q - 1]
+                nextbpts[save] = bpts[p]
+        for i in range(lbz, ph + 1):
+            ebpts[i] = 0.0
+            for j in range(max(0, i - t), min(p, i) + 1):
+                ebpts[i] += bezalfs[i, j]*bpts[j]
+        if oldr > 1:
+            first = kind - 2
+            last = kind
+            den = ub - ua
+            bet = (ub - kh[kind - 1])/den
+            for tr in range(1, oldr):
+                i = first
+                j = last
+                kj = j - kind + 1
+                while j - i > tr:
+                    if i < cind:
+                        alf = (ub - kh[i])/(ua - kh[i])
+                        Qw[i] = alf*Qw[i] + (1.0 - alf)*Qw[i - 1]
+                    if j >= lbz:
+                        if j - tr <= kind - ph + oldr:
+                            gam = (ub - kh[j - tr])/den
+                            ebpts[kj] = gam*ebpts[kj] + (1.0 - gam)*ebpts[kj + 1]
+                        else:
+                            ebpts[kj] = bet*ebpts[kj] + (1.0 - bet)*ebpts[kj + 1]
+                    i += 1
+                    j -= 1
+                    kj -= 1
+                first -= 1
+                last += 1
+        if a != p:
+            for i in range(ph - oldr):
+                kh[kind] = ua
+                kind += 1
+        for j in range(lbz, rbz + 1):
+            Qw[cind] = ebpts[j]
+            cind += 1
+        if b < m:
+            bpts[:r] = nextbpts[:r]
+            bpts[r:] = Pw[b - p + r:b + 1]
+            a = b
+            b += 1
+            ua = ub
+        else:
+            kh[kind:kind + ph + 1] = ub
+    nh = mh - ph - 1
+    return kh[:nh + ph + 2], moveaxis(Qw[:nh + 1], 0, axis)
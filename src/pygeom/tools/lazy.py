@@ -0,0 +1,236 @@
+from numbers import Number
+from typing import TYPE_CHECKING, Any
+
+from numpy import (add, broadcast_shapes, broadcast_to, divide, empty, equal,
+                   generic, greater, greater_equal, less, less_equal, multiply,
+                   ndarray, negative, not_equal, power, prod, shape, subtract)
+
+from ..geom2d.vector2d import Vector2D
+from ..geom3d.vector import Vector
+
+if TYPE_CHECKING:
+    from numpy import ufunc
+    from numpy.typing import DTypeLike, NDArray
+
+CHUNKSIZE = 16384
+
+
+def _is_operand(obj: Any) -> bool:
+    return isinstance(obj, (LazyArray, ndarray, Number, generic))
+
+
+class LazyArray():
+    """Deferred elementwise array expression.
+
+    Arithmetic and ufuncs on a LazyArray only record the operation. The
+    expression is evaluated when materialised, in chunks of about CHUNKSIZE
+    elements along the first axis, so the temporaries of the expression are
+    only ever chunk sized and shared sub expressions are evaluated once per
+    chunk.
+    """
+    func: 'ufunc | None' = None
+    args: tuple[Any, ...] = None
+    _shape: tuple[int, ...] = None
+    _dtype: 'DTypeLike' = None
+
+    def __init__(self, func: 'ufunc | None', *args: Any) -> None:
+        self.func = func
+        self.args = args
+
+    @classmethod
+    def leaf(cls, value: 'NDArray') -> 'LazyArray':
+        return cls(None, value)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        if self._shape is None:
+            self._shape = broadcast_shapes(*[arg.shape if isinstance(arg, LazyArray)
+                                             else shape(arg) for arg in self.args])
+        return self._shape
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(prod(self.shape))
+
+    @property
+    def dtype(self) -> 'DTypeLike':
+        if self._dtype is None:
+            key = slice(0, 0) if self.ndim > 0 else ()
+            self._dtype = self._evaluate_chunk(self.shape, key, {}).dtype
+        return self._dtype
+
+    def _evaluate_chunk(self, shp: tuple[int, ...], key: Any,
+                        memo: dict[int, Any]) -> Any:
+        result = memo.get(id(self))
+        if result is None:
+            values = []
+            for arg in self.args:
+                if isinstance(arg, LazyArray):
+                    values.append(arg._evaluate_chunk(shp, key, memo))
+                elif isinstance(arg, ndarray) and arg.ndim > 0:
+                    values.append(broadcast_to(arg, shp)[key])
+                else:
+                    values.append(arg)
+            if self.func is None:
+                result = values[0]
+            else:
+                result = self.func(*values)
+            memo[id(self)] = result
+        return result
+
+    def evaluate(self, chunksize: int = CHUNKSIZE) -> 'NDArray':
+        """Returns the value of the expression as an array."""
+        return evaluate_arrays([self], chunksize=chunksize)[0]
+
+    def __array_ufunc__(self, ufunc: 'ufunc', method: str, *inputs: Any,
+                        **kwargs: dict[str, Any]) -> Any:
+        if method == '__call__' and ufunc.nout == 1 and not kwargs:
+            if all(_is_operand(obj) for obj in inputs):
+                return LazyArray(ufunc, *inputs)
+            return NotImplemented
+        out = kwargs.get('out', ())
+        out = out if isinstance(out, tuple) else (out, )
+        if any(isinstance(obj, LazyArray) for obj in out):
+            raise TypeError('LazyArray cannot be used as a ufunc out argument.')
+        inputs = [obj.evaluate() if isinstance(obj, LazyArray) else obj
+                  for obj in inputs]
+        kwargs = {key: value.evaluate() if isinstance(value, LazyArray) else value
+                  for key, value in kwargs.items()}
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __getitem__(self, key: Any) -> 'LazyArray':
+        return self._index(self.shape, key, {})
+
+    def _index(self, shp: tuple[int, ...], key: Any,
+               memo: dict[int, 'LazyArray']) -> 'LazyArray':
+        """Returns the expression with key applied to its broadcast leaves,
+        keeping sub expressions shared."""
+        result = memo.get(id(self))
+        if result is None:
+            args = []
+            for arg in self.args:
+                if isinstance(arg, LazyArray):
+                    args.append(arg._index(shp, key, memo))
+                elif isinstance(arg, ndarray) and arg.ndim > 0:
+                    args.append(broadcast_to(arg, shp)[key])
+                else:
+                    args.append(arg)
+            result = LazyArray(self.func, *args)
+            memo[id(self)] = result
+        return result
+
+    def _binary(self, func: 'ufunc', obj: Any, reflect: bool = False) -> 'LazyArray':
+        if not _is_operand(obj):
+            return NotImplemented
+        if reflect:
+            return LazyArray(func, obj, self)
+        return LazyArray(func, self, obj)
+
+    def __add__(self, obj: Any) -> 'LazyArray':
+        return self._binary(add, obj)
+
+    def __radd__(self, obj: Any) -> 'LazyArray':
+        return self._binary(add, obj, True)
+
+    def __sub__(self, obj: Any) -> 'LazyArray':
+        return self._binary(subtract, obj)
+
+    def __rsub__(self, obj: Any) -> 'LazyArray':
+        return self._binary(subtract, obj, True)
+
+    def __mul__(self, obj: Any) -> 'LazyArray':
+        return self._binary(multiply, obj)
+
+    def __rmul__(self, obj: Any) -> 'LazyArray':
+        return self._binary(multiply, obj, True)
+
+    def __truediv__(self, obj: Any) -> 'LazyArray':
+        return self._binary(divide, obj)
+
+    def __rtruediv__(self, obj: Any) -> 'LazyArray':
+        return self._binary(divide, obj, True)
+
+    def __pow__(self, obj: Any) -> 'LazyArray':
+        return self._binary(power, obj)
+
+    def __rpow__(self, obj: Any) -> 'LazyArray':
+        return self._binary(power, obj, True)
+
+    def __lt__(self, obj: Any) -> 'LazyArray':
+        return self._binary(less, obj)
+
+    def __le__(self, obj: Any) -> 'LazyArray':
+        return self._binary(less_equal, obj)
+
+    def __gt__(self, obj: Any) -> 'LazyArray':
+        return self._binary(greater, obj)
+
+    def __ge__(self, obj: Any) -> 'LazyArray':
+        return self._binary(greater_equal, obj)
+
+    def __eq__(self, obj: Any) -> 'LazyArray':
+        return self._binary(equal, obj)
+
+    def __ne__(self, obj: Any) -> 'LazyArray':
+        return self._binary(not_equal, obj)
+
+    def __neg__(self) -> 'LazyArray':
+        return LazyArray(negative, self)
+
+    def __pos__(self) -> 'LazyArray':
+        return self
+
+    __hash__ = object.__hash__
+
+    def __repr__(self) -> str:
+        name = 'leaf' if self.func is None else self.func.__name__
+        return f'<LazyArray {name}: shape={self.shape}>'
+
+
+def evaluate_arrays(exprs: list[Any], chunksize: int = CHUNKSIZE) -> list[Any]:
+    """Returns the values of the lazy expressions, evaluated together chunk
+    by chunk so that sub expressions they share are only evaluated once."""
+    lazys = [expr for expr in exprs if isinstance(expr, LazyArray)]
+    if not lazys:
+        return list(exprs)
+    shp = broadcast_shapes(*[expr.shape for expr in lazys])
+    outs = {id(expr): empty(shp, dtype=expr.dtype) for expr in lazys}
+    if len(shp) == 0:
+        memo = {}
+        for expr in lazys:
+            outs[id(expr)][...] = expr._evaluate_chunk(shp, (), memo)
+    else:
+        rowsize = int(prod(shp[1:]))
+        numrow = max(1, chunksize//max(rowsize, 1))
+        for start in range(0, shp[0], numrow):
+            key = slice(start, start + numrow)
+            memo = {}
+            for expr in lazys:
+                outs[id(expr)][key] = expr._evaluate_chunk(shp, key, memo)
+    return [outs[id(expr)] if isinstance(expr, LazyArray) else expr
+            for expr in exprs]
+
+
+def lazy(obj: Any) -> Any:
+    """Returns a Vector, Vector2D or array whose arithmetic is deferred until
+    it is passed to evaluate."""
+    if isinstance(obj, Vector):
+        return Vector(LazyArray.leaf(obj.x), LazyArray.leaf(obj.y),
+                      LazyArray.leaf(obj.z))
+    if isinstance(obj, Vector2D):
+        return Vector2D(LazyArray.leaf(obj.x), LazyArray.leaf(obj.y))
+    return LazyArray.leaf(obj)
+
+
+def evaluate(obj: Any, chunksize: int = CHUNKSIZE) -> Any:
+    """Returns the materialised value of a lazy Vector, Vector2D or array.
+    The components of a vector are evaluated together in fused chunks."""
+    if isinstance(obj, Vector):
+        return Vector(*evaluate_arrays([obj.x, obj.y, obj.z], chunksize))
+    if isinstance(obj, Vector2D):
+        return Vector2D(*evaluate_arrays([obj.x, obj.y], chunksize))
+    return evaluate_arrays([obj], chunksize)[0]
@@ -0,0 +1,212 @@
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any
+
+from numpy import arange, asarray, ascontiguousarray, ndarray, result_type, zeros
+from numpy.linalg import inv, solve
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+def _is_sparse(amat: Any) -> bool:
+    return not isinstance(amat, ndarray) and hasattr(amat, 'toarray')
+
+
+class VectorSolver():
+    """Factorisation of a square linear operator for repeated solves.
+
+    Dense matrices are factorised once into their inverse so that every
+    later solve is a single matrix product. Banded matrices, given in row
+    band storage, are factorised by banded elimination without pivoting and
+    are intended for diagonally dominant systems such as spline fits. Sparse
+    matrices use a scipy sparse LU factorisation when scipy is available and
+    are otherwise treated as dense.
+    """
+    kind: str = None
+    size: int = None
+    lower: int = None
+    upper: int = None
+    _inv: 'NDArray' = None
+    _band: 'NDArray' = None
+    _splu: Any = None
+
+    def __init__(self, amat: 'NDArray | Any') -> None:
+        if _is_sparse(amat):
+            try:
+                from scipy.sparse.linalg import splu
+            except ImportError:
+                amat = amat.toarray()
+            else:
+                self.kind = 'sparse'
+                self.size = amat.shape[0]
+                self._splu = splu(amat.tocsc())
+                return
+        amat = asarray(amat)
+        if amat.ndim != 2 or amat.shape[0] != amat.shape[1]:
+            raise ValueError('VectorSolver matrix must be square.')
+        self.kind = 'dense'
+        self.size = amat.shape[0]
+        self._inv = inv(amat)
+
+    @classmethod
+    def banded(cls, band: 'NDArray', lower: int, upper: int) -> 'VectorSolver':
+        """Returns the solver of a banded matrix stored by rows, where
+        band[i, lower + j - i] is the matrix entry a[i, j]."""
+        band = asarray(band, dtype=result_type(band, 1.0))
+        if band.ndim != 2 or band.shape[1] != lower + upper + 1:
+            raise ValueError('VectorSolver band must have lower + upper + 1 columns.')
+        solver = cls.__new__(cls)
+        solver.kind = 'banded'
+        solver.size = band.shape[0]
+        solver.lower = lower
+        solver.upper = upper
+        solver._band = _band_factor(band.copy(), lower, upper)
+        return solver
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.size, self.size)
+
+    def solve(self, bmat: 'NDArray') -> 'NDArray':
+        """Returns the solution of the system for the right hand sides bmat,
+        which has the system size as its first axis."""
+        bmat = asarray(bmat)
+        if bmat.shape[0] != self.size:
+            raise ValueError('VectorSolver right hand side has the wrong size.')
+        if self.kind == 'dense':
+            return self._inv@bmat
+        if self.kind == 'sparse':
+            return self._splu.solve(ascontiguousarray(bmat))
+        return _band_solve(self._band, self.lower, self.upper, bmat)
+
+    def __repr__(self) -> str:
+        return f'<VectorSolver {self.kind:s}: size={self.size:d}>'
+
+
+def _band_factor(band: 'NDArray', lower: int, upper: int) -> 'NDArray':
+    """Overwrites band with the L and U factors of the banded matrix."""
+    num = band.shape[0]
+    for k in range(num - 1):
+        nrow = min(lower, num - 1 - k)
+        if nrow == 0:
+            continue
+        rows = arange(k + 1, k + 1 + nrow)
+        ncol = min(upper, num - 1 - k)
+        cols = lower + k - rows
+        band[rows, cols] /= band[k, lower]
+        if ncol > 0:
+            jcol = arange(1, ncol + 1)
+            band[rows[:, None], cols[:, None] + jcol] -= \
+                band[rows, cols][:, None]*band[k, lower + jcol]
+    return band
+
+
+def _band_solve(band: 'NDArray', lower: int, upper: int,
+                bmat: 'NDArray') -> 'NDArray':
+    """Returns the solution of the factorised banded system."""
+    num = band.shape[0]
+    x = zeros(bmat.shape, dtype=result_type(band, bmat))
+    x[...] = bmat
+    for i in range(1, num):
+        k0 = max(0, i - lower)
+        if k0 < i:
+            coef = band[i, lower + k0 - i:lower]
+            x[i] -= coef@x[k0:i]
+    for i in range(num - 1, -1, -1):
+        k1 = min(num, i + upper + 1)
+        if k1 > i + 1:
+            coef = band[i, lower + 1:lower + k1 - i]
+            x[i] -= coef@x[i + 1:k1]
+        x[i] /= band[i, lower]
+    return x
+
+
+class SolverCache():
+    """Bounded least recently used cache of VectorSolver factorisations.
+
+    Matrices are keyed on their content, so every solve hashes the matrix,
+    and matrices smaller than minsize are always solved directly. The
+    module solver_cache is disabled until its maxsize is set, and nothing in
+    pygeom solves through it unless asked to.
+    """
+    maxsize: int = None
+    minsize: int = None
+    hits: int = None
+    misses: int = None
+    _data: OrderedDict[tuple[Any, ...], VectorSolver] = None
+
+    def __init__(self, maxsize: int = 8, minsize: int = 64) -> None:
+        self.maxsize = maxsize
+        self.minsize = minsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        return len(self._data)
+
+    @staticmethod
+    def key(amat: 'NDArray') -> tuple[Any, ...]:
+        amat = ascontiguousarray(amat)
+        ahash = blake2b(amat.tobytes(), digest_size=16).digest()
+        return (amat.shape, amat.dtype.str, ahash)
+
+    def solver(self, amat: 'NDArray') -> VectorSolver:
+        """Returns the cached solver of amat, factorising it if needed."""
+        key = self.key(amat)
+        solver = self._data.get(key)
+        if solver is None:
+            self.misses += 1
+            solver = VectorSolver(amat)
+            self._store(key, solver)
+        else:
+            self.hits += 1
+            self._data.move_to_end(key)
+        return solver
+
+    def solve(self, amat: 'NDArray', bmat: 'NDArray') -> 'NDArray':
+        """Returns the solution of amat x = bmat, reusing the cached
+        factorisation of amat, or solving directly if the cache is disabled
+        or amat is small."""
+        if _is_sparse(amat):
+            return VectorSolver(amat).solve(bmat)
+        amat = asarray(amat)
+        if self.maxsize <= 0 or amat.shape[0] < self.minsize:
+            return solve(amat, bmat)
+        return self.solver(amat).solve(bmat)
+
+    def _store(self, key: tuple[Any, ...], solver: VectorSolver) -> None:
+        if self.maxsize <= 0:
+            return
+        self._data[key] = solver
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def cache_info(self) -> dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses,
+                'maxsize': self.maxsize, 'minsize': self.minsize,
+                'size': self.size}
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f'<SolverCache: size={self.size:d}, maxsize={self.maxsize:d}>'
+
+
+solver_cache = SolverCache(maxsize=0)
+
+
+def linear_solve(amat: 'NDArray | VectorSolver | Any', bmat: 'NDArray') -> 'NDArray':
+    """Returns the solution of amat x = bmat, where amat is a VectorSolver, a
+    sparse matrix or a dense matrix solved by numpy.linalg.solve."""
+    if isinstance(amat, VectorSolver):
+        return amat.solve(bmat)
+    if _is_sparse(amat):
+        return VectorSolver(amat).solve(bmat)
+    return solve(amat, bmat)
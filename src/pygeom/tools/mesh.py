@@ -1,39 +1,85 @@
+from itertools import count
 from typing import TYPE_CHECKING, Any
 
-from numpy import (arange, argsort, asarray, bool_, hstack, int64, logical_and,
-                   round, sort, take_along_axis, unique, vstack, zeros)
+from numpy import (arange, argsort, asarray, bool_, broadcast_to,
+                   column_stack, concatenate, cumsum, diff, full, hstack,
+                   int64, logical_and, maximum, minimum, ones, repeat, round,
+                   sort, take_along_axis, unique, vstack, zeros)
+
+from .buffer import ArrayBuffer
+from .precision import get_float_dtype
+from .sparse import CSRMatrix
+from .weld import weld_indices
 
 if TYPE_CHECKING:
     from numpy.typing import DTypeLike, NDArray
 
+    from ..geom2d.vector2d import Vector2D
+    from ..geom3d.vector import Vector
+
+_versions = count(1)
+
 
 class MetaCache():
     key: str = None
     dtype: 'DTypeLike' = None
     default: Any = None
-    data: list[Any] = None
+    buffer: ArrayBuffer = None
 
     def __init__(self, key: str, dtype: 'DTypeLike', default: Any) -> None:
         self.key = key
         self.dtype = dtype
         self.default = default
-        self.data = []
+        self.buffer = ArrayBuffer(dtype)
+
+    @property
+    def ncol(self) -> int:
+        return asarray(self.default, dtype=self.dtype).size
 
     @property
     def size(self) -> int:
-        return len(self.data)
+        return self.buffer.size
 
     def clear(self) -> None:
-        self.data.clear()
+        self.buffer = ArrayBuffer(self.dtype)
 
     def append(self, value: Any) -> None:
-        self.data.append(value)
+        self.buffer.append(value)
+
+    def extend(self, values: Any, size: int | None = None) -> None:
+        """Appends an array of values, one row per item. Scalar or single
+        row values are repeated size times."""
+        if size is not None:
+            values = asarray(values, dtype=self.dtype).reshape(1, -1)
+            values = broadcast_to(values, (size, values.shape[1]))
+        self.buffer.extend(values)
 
     def asarray(self) -> 'NDArray':
-        arr = asarray(self.data, dtype=self.dtype)
-        if len(arr.shape) == 1:
-            return arr.reshape(-1, 1)
-        return arr
+        if self.size == 0:
+            return zeros((0, self.ncol), dtype=self.dtype)
+        return self.buffer.view()
+
+    def resolve(self) -> tuple['NDArray', ArrayBuffer]:
+        """Returns the cached rows and the buffer holding them, leaving the
+        cache empty."""
+        arr, buffer = self.asarray(), self.buffer
+        self.clear()
+        return arr, buffer
+
+    def append_to(self, arr: 'NDArray',
+                  store: ArrayBuffer | None) -> tuple['NDArray', ArrayBuffer]:
+        """Returns arr with the cached rows appended and the buffer holding
+        the result, leaving the cache empty. The rows are appended in place
+        when arr is the latest view of store."""
+        if self.size == 0:
+            return arr, store
+        if arr.shape[0] == 0:
+            return self.resolve()
+        if store is None or not store.holds(arr):
+            store = ArrayBuffer.from_array(arr)
+        store.extend(self.buffer.view())
+        self.clear()
+        return store.view(), store
 
     def __repr__(self) -> str:
         outstr = '<MetaCache'
@@ -55,12 +101,43 @@ class MetaCache():
 
 
 class MeshObject():
+    """Base of mesh data, whose version stamp changes whenever a public
+    attribute is assigned or its data is modified by a method.
+
+    Stamps are unique across all mesh objects, so a cache keyed on the
+    stamps of its inputs is stale exactly when an input has been modified
+    or replaced. Arrays modified in place by user code should be followed
+    by a call to touch.
+    """
+    version: int = 0
     meta: dict[str, 'NDArray'] = None
     meta_cache: dict[str, MetaCache] = None
+    _store: ArrayBuffer = None
+    _meta_store: dict[str, ArrayBuffer] = None
 
     def __init__(self) -> None:
         self.meta = {}
         self.meta_cache = {}
+        self._meta_store = {}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != 'version' and not name.startswith('_'):
+            self.touch()
+
+    def touch(self) -> None:
+        """Marks the data as modified."""
+        self.version = next(_versions)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_store'] = None
+        state['_meta_store'] = {}
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.touch()
 
     def add_meta(self, key: str, dtype: 'DTypeLike', default: Any) -> None:
         if key in self.__dict__:
@@ -68,20 +145,58 @@ class MeshObject():
         self.meta_cache[key] = MetaCache(key, dtype, default)
         self.meta[key] = zeros(0, dtype=dtype)
 
+    def extend_meta(self, size: int, **kwargs: dict[str, Any]) -> None:
+        """Appends size rows to every meta cache, taking arrays from kwargs
+        and filling missing keys with their defaults."""
+        for key, value in self.meta_cache.items():
+            if key in kwargs:
+                values = asarray(kwargs[key])
+                if values.shape[0] != size:
+                    raise ValueError(f'Meta {key:s} must have {size:d} rows.')
+                value.extend(values)
+            else:
+                value.extend(value.default, size)
+
 
 class MeshVectors(MeshObject):
     ndim: int = 3
     name: str = None
     label: str = None
     vecs: 'NDArray' = None
-    vecs_cache: list[tuple[float, float, float]] = None
+    vecs_cache: MetaCache = None
+    _bounds: tuple['NDArray', 'NDArray'] = None
+    _bounds_version: int = None
 
     def __init__(self, label: str, name: str = 'MeshVectors') -> None:
         self.name = name
         self.label = label
         super().__init__()
-        self.vecs = zeros((0, self.ndim))
-        self.vecs_cache = []
+        dtype = get_float_dtype()
+        self.vecs = zeros((0, self.ndim), dtype=dtype)
+        self.vecs_cache = MetaCache(label, dtype, (0.0, )*self.ndim)
+
+    @classmethod
+    def from_arrays(cls, vecs: 'Vector | NDArray', *args: str,
+                    **kwargs: 'NDArray') -> 'MeshVectors':
+        """Returns mesh vectors holding vecs, with a meta for every keyword
+        array. Positional arguments are passed to the constructor."""
+        meshvecs = cls(*args)
+        meshvecs.vecs = meshvecs.vecs_array(vecs)
+        for key, value in kwargs.items():
+            value = asarray(value)
+            if value.shape[0] != meshvecs.size:
+                raise ValueError(f'Meta {key:s} must have {meshvecs.size:d} rows.')
+            meshvecs.add_meta(key, value.dtype, zeros(1, dtype=value.dtype)[0])
+            meshvecs.meta[key] = value.reshape(meshvecs.size, -1)
+        return meshvecs
+
+    def vecs_array(self, vecs: 'Vector | NDArray') -> 'NDArray':
+        if hasattr(vecs, 'as_xyz_array'):
+            vecs = vecs.as_xyz_array()
+        vecs = asarray(vecs, dtype=self.vecs_cache.dtype)
+        if vecs.shape[-1] != self.ndim:
+            raise ValueError(f'{self.name:s} arrays must have {self.ndim:d} columns.')
+        return vecs.reshape(-1, self.ndim)
 
     def add(self, x: float, y: float, z: float, **kwargs: dict[str, Any]) -> None:
         self.vecs_cache.append((x, y, z))
@@ -89,43 +204,38 @@ class MeshVectors(MeshObject):
             value = kwargs.get(key, self.meta_cache[key].default)
             self.meta_cache[key].append(value)
 
+    def add_many(self, vecs: 'Vector | NDArray', **kwargs: 'NDArray') -> None:
+        """Adds every vector of vecs, an array of rows or a Vector, with meta
+        arrays of one row per vector."""
+        vecs = self.vecs_array(vecs)
+        self.vecs_cache.extend(vecs)
+        self.extend_meta(vecs.shape[0], **kwargs)
+
     def clear_cache(self) -> None:
         self.vecs_cache.clear()
         for value in self.meta_cache.values():
             value.clear()
 
     def resolve_cache(self) -> None:
-        self.vecs = asarray(self.vecs_cache)
+        self.vecs, self._store = self.vecs_cache.resolve()
         for key, value in self.meta_cache.items():
-            self.meta[key] = value.asarray()
+            self.meta[key], self._meta_store[key] = value.resolve()
         self.clear_cache()
 
     def append_cache(self) -> None:
-        vecs = asarray(self.vecs_cache)
-        meta = {}
+        self.vecs, self._store = self.vecs_cache.append_to(self.vecs, self._store)
         for key, value in self.meta_cache.items():
-            meta[key] = value.asarray()
-        vec_data = []
-        meta_data = {mkey: [] for mkey in meta.keys()}
-        if self.size > 0:
-            vec_data.append(self.vecs)
-            for key in self.meta.keys():
-                meta_data[key].append(self.meta[key])
-        if len(vecs) > 0:
-            vec_data.append(vecs)
-            for key in meta.keys():
-                meta_data[key].append(meta[key])
-        if len(vec_data) > 0:
-            self.vecs = vstack(tuple(vec_data))
-            for key in meta.keys():
-                if len(meta_data[key]) > 0:
-                    self.meta[key] = vstack(tuple(meta_data[key]))
+            store = self._meta_store.get(key)
+            self.meta[key], self._meta_store[key] = value.append_to(self.meta[key], store)
         self.clear_cache()
 
-    def duplicate_indices(self, decimals: int | None = None) -> tuple['NDArray[int64]',
-                                                                      'NDArray[int64]']:
+    def duplicate_indices(self, decimals: int | None = None,
+                          tol: float | None = None) -> tuple['NDArray[int64]',
+                                                             'NDArray[int64]']:
         if self.size == 0:
             return zeros(0, dtype=int64), zeros(0, dtype=int64)
+        if tol is not None:
+            return weld_indices(self.vecs, tol, tuple(self.meta.values()))
         if decimals is not None:
             data = round(self.vecs, decimals=decimals)
         else:
@@ -146,6 +256,7 @@ class MeshVectors(MeshObject):
             raise ValueError(f'Cannot apply inverse to {self.label:s}.')
         if key in self.meta:
             self.meta[key] = invind[self.meta[key]]
+            self.touch()
 
     def __getitem__(self, index: Any) -> 'MeshVectors':
         meshvecs = self.__class__(self.label, self.name)
@@ -162,6 +273,7 @@ class MeshVectors(MeshObject):
             self.vecs[index] = value.vecs
             for key in self.meta.keys():
                 self.meta[key][index] = value.meta[key]
+            self.touch()
         except IndexError:
             err = f'{self.name:s} index out of range.'
             raise IndexError(err)
@@ -170,6 +282,16 @@ class MeshVectors(MeshObject):
     def size(self) -> int:
         return self.vecs.shape[0]
 
+    @property
+    def bounds(self) -> tuple['NDArray', 'NDArray']:
+        """Returns the minimum and maximum of the vectors in each axis."""
+        if self._bounds is None or self._bounds_version != self.version:
+            if self.size == 0:
+                raise ValueError(f'{self.name:s} has no vectors to bound.')
+            self._bounds = (self.vecs.min(axis=0), self.vecs.max(axis=0))
+            self._bounds_version = self.version
+        return self._bounds
+
     @property
     def full_str(self) -> str:
         outstr = f'{self.name:s}: size = {self.size:d}, dtype = {self.vecs.dtype}\n'
@@ -191,6 +313,11 @@ class MeshVectors2D(MeshVectors):
     def __init__(self, label: str, name: str = 'MeshVectors2D') -> None:
         super().__init__(label, name)
 
+    def vecs_array(self, vecs: 'Vector2D | NDArray') -> 'NDArray':
+        if hasattr(vecs, 'as_xy_array'):
+            vecs = vecs.as_xy_array()
+        return super().vecs_array(vecs)
+
     def add(self, x: float, y: float, **kwargs: dict[str, Any]) -> None:
         self.vecs_cache.append((x, y))
         for key in self.meta_cache.keys():
@@ -222,12 +349,32 @@ class MeshElems(MeshObject):
     desc: str = 'elems'
     numg: int = 0
     grids: 'NDArray[int64]' = None
-    grids_cache: list[tuple[int, ...]] = None
+    grids_cache: MetaCache = None
 
     def __init__(self) -> None:
         super().__init__()
         self.grids = zeros((0, self.numg), dtype=int64)
-        self.grids_cache = []
+        self.grids_cache = MetaCache('grids', int64, (0, )*self.numg)
+
+    @classmethod
+    def from_arrays(cls, grids: 'NDArray', **kwargs: 'NDArray') -> 'MeshElems':
+        """Returns mesh elements with the grid indices of grids, with a meta
+        for every keyword array."""
+        meshelems = cls()
+        meshelems.grids = meshelems.grids_array(grids)
+        for key, value in kwargs.items():
+            value = asarray(value)
+            if value.shape[0] != meshelems.size:
+                raise ValueError(f'Meta {key:s} must have {meshelems.size:d} rows.')
+            meshelems.add_meta(key, value.dtype, zeros(1, dtype=value.dtype)[0])
+            meshelems.meta[key] = value.reshape(meshelems.size, -1)
+        return meshelems
+
+    def grids_array(self, grids: 'NDArray') -> 'NDArray[int64]':
+        grids = asarray(grids, dtype=int64)
+        if grids.ndim != 2 or grids.shape[1] != self.numg:
+            raise ValueError(f'{self.name:s} grids must have {self.numg:d} columns.')
+        return grids
 
     def add(self, *grids: int, **kwargs: dict[str, Any]) -> None:
         self.grids_cache.append(grids)
@@ -235,37 +382,29 @@ class MeshElems(MeshObject):
             value = kwargs.get(key, self.meta_cache[key].default)
             self.meta_cache[key].append(value)
 
+    def add_many(self, grids: 'NDArray', **kwargs: 'NDArray') -> None:
+        """Adds every row of grids as an element, with meta arrays of one
+        row per element."""
+        grids = self.grids_array(grids)
+        self.grids_cache.extend(grids)
+        self.extend_meta(grids.shape[0], **kwargs)
+
     def clear_cache(self) -> None:
         self.grids_cache.clear()
         for value in self.meta_cache.values():
             value.clear()
 
     def resolve_cache(self) -> None:
-        self.grids = asarray(self.grids_cache, dtype=int64)
+        self.grids, self._store = self.grids_cache.resolve()
         for key, value in self.meta_cache.items():
-            self.meta[key] = value.asarray()
+            self.meta[key], self._meta_store[key] = value.resolve()
         self.clear_cache()
 
     def append_cache(self) -> None:
-        grids = asarray(self.grids_cache, dtype=int64)
-        meta = {}
+        self.grids, self._store = self.grids_cache.append_to(self.grids, self._store)
         for key, value in self.meta_cache.items():
-            meta[key] = value.asarray()
-        grid_data = []
-        meta_data = {mkey: [] for mkey in meta.keys()}
-        if self.size > 0:
-            grid_data.append(self.grids)
-            for key in self.meta.keys():
-                meta_data[key].append(self.meta[key])
-        if len(grids) > 0:
-            grid_data.append(grids)
-            for key in meta.keys():
-                meta_data[key].append(meta[key])
-        if len(grid_data) > 0:
-            self.grids = vstack(tuple(grid_data))
-            for key in meta.keys():
-                if len(meta_data[key]) > 0:
-                    self.meta[key] = vstack(tuple(meta_data[key]))
+            store = self._meta_store.get(key)
+            self.meta[key], self._meta_store[key] = value.append_to(self.meta[key], store)
         self.clear_cache()
 
     def duplicate_indices(self) -> tuple['NDArray[int64]',
@@ -294,6 +433,7 @@ class MeshElems(MeshObject):
             self.grids = invind[self.grids]
         if key in self.meta:
             self.meta[key] = invind[self.meta[key]]
+            self.touch()
 
     def remove_collapsed(self) -> None:
         if self.size == 0:
@@ -337,6 +477,7 @@ class MeshElems(MeshObject):
             self.grids[index, :] = value.grids
             for key in self.meta.keys():
                 self.meta[key][index, :] = value.meta[key]
+            self.touch()
         except IndexError:
             err = f'{self.name:s} index out of range.'
             raise IndexError(err)
@@ -381,6 +522,7 @@ class MeshQuads(MeshElems):
 class MeshEdges():
     mesh: 'Mesh' = None
     mode: str = None
+    version: tuple[int, ...] = None
     _include: list[MeshElems] = None
     _edges: 'NDArray[int64]' = None
     _unique: 'NDArray[int64]' = None
@@ -392,6 +534,7 @@ class MeshEdges():
     def __init__(self, mesh: 'Mesh', mode: str = '3D') -> None:
         self.mesh = mesh
         self.mode = mode
+        self.version = mesh.elems_version
 
     @property
     def include(self) -> list[MeshElems]:
@@ -485,6 +628,162 @@ class MeshEdges():
         return self._free
 
 
+class MeshTopology():
+    """Adjacency index of the lines, trias and quads of a mesh.
+
+    Elements are numbered across lines, trias and quads in that order, with
+    the elements of each kind starting at its entry in offsets. Every map is
+    a CSRMatrix built lazily by sorting, whose row i lists the indices
+    adjacent to item i and whose data counts repeated adjacencies, so rows
+    are queried by slicing and the maps can be used in matrix products.
+    """
+    mesh: 'Mesh' = None
+    version: tuple[int, ...] = None
+    _offsets: 'NDArray[int64]' = None
+    _elem_grids: CSRMatrix = None
+    _grid_elems: CSRMatrix = None
+    _edges: 'NDArray[int64]' = None
+    _elem_edges: CSRMatrix = None
+    _edge_elems: CSRMatrix = None
+    _elem_elems: CSRMatrix = None
+    _grid_grids: CSRMatrix = None
+
+    def __init__(self, mesh: 'Mesh') -> None:
+        self.mesh = mesh
+        self.version = mesh.topology_version
+
+    @property
+    def elements(self) -> list[MeshElems]:
+        return [self.mesh.lines, self.mesh.trias, self.mesh.quads]
+
+    @property
+    def offsets(self) -> 'NDArray[int64]':
+        if self._offsets is None:
+            sizes = [elems.size for elems in self.elements]
+            self._offsets = concatenate(([0], cumsum(sizes)))
+        return self._offsets
+
+    @property
+    def num_grids(self) -> int:
+        return self.mesh.grids.size
+
+    @property
+    def num_elems(self) -> int:
+        return int(self.offsets[-1])
+
+    @property
+    def num_edges(self) -> int:
+        return self.edges.shape[0]
+
+    @property
+    def elem_grids(self) -> CSRMatrix:
+        if self._elem_grids is None:
+            indices = concatenate([elems.grids.ravel() for elems in self.elements])
+            numg = concatenate([full(elems.size, elems.numg) for elems in self.elements])
+            indptr = concatenate(([0], cumsum(numg)))
+            shape = (self.num_elems, self.num_grids)
+            self._elem_grids = CSRMatrix(ones(indices.size, dtype=int64),
+                                         indices.astype(int64), indptr, shape)
+        return self._elem_grids
+
+    @property
+    def grid_elems(self) -> CSRMatrix:
+        if self._grid_elems is None:
+            self._grid_elems = self.elem_grids.T
+        return self._grid_elems
+
+    def unique_edges(self) -> None:
+        grida, gridb, nume = [], [], []
+        for elems in self.elements:
+            if isinstance(elems, MeshLines):
+                ind1, ind2 = [0], [1]
+            else:
+                ind1, ind2 = arange(-1, elems.numg-1), arange(0, elems.numg)
+            grida.append(elems.grids[:, ind1].ravel())
+            gridb.append(elems.grids[:, ind2].ravel())
+            nume.append(full(elems.size, len(ind1)))
+        grida, gridb = concatenate(grida), concatenate(gridb)
+        key = minimum(grida, gridb)*self.num_grids + maximum(grida, gridb)
+        ukey, inverse = unique(key, return_inverse=True)
+        self._edges = column_stack((ukey//self.num_grids, ukey % self.num_grids))
+        indptr = concatenate(([0], cumsum(concatenate(nume))))
+        shape = (self.num_elems, ukey.size)
+        self._elem_edges = CSRMatrix(ones(key.size, dtype=int64),
+                                     inverse.astype(int64), indptr, shape)
+
+    @property
+    def edges(self) -> 'NDArray[int64]':
+        if self._edges is None:
+            self.unique_edges()
+        return self._edges
+
+    @property
+    def elem_edges(self) -> CSRMatrix:
+        if self._elem_edges is None:
+            self.unique_edges()
+        return self._elem_edges
+
+    @property
+    def edge_elems(self) -> CSRMatrix:
+        if self._edge_elems is None:
+            self._edge_elems = self.elem_edges.T
+        return self._edge_elems
+
+    @property
+    def edge_counts(self) -> 'NDArray[int64]':
+        return diff(self.edge_elems.indptr)
+
+    @property
+    def free_edges(self) -> 'NDArray[int64]':
+        return self.edges[self.edge_counts == 1, :]
+
+    @property
+    def elem_elems(self) -> CSRMatrix:
+        """Element to element map through shared edges."""
+        if self._elem_elems is None:
+            edge_elems = self.edge_elems
+            rows = edge_elems.rows
+            count = diff(edge_elems.indptr)[rows]
+            total = count.sum()
+            ind = repeat(edge_elems.indices, count)
+            pos = repeat(edge_elems.indptr[rows] - cumsum(count) + count, count)
+            jnd = edge_elems.indices[pos + arange(total)]
+            check = ind != jnd
+            shape = (self.num_elems, self.num_elems)
+            self._elem_elems = CSRMatrix.from_coo(ind[check], jnd[check],
+                                                  ones(check.sum(), dtype=int64),
+                                                  shape)
+        return self._elem_elems
+
+    @property
+    def grid_grids(self) -> CSRMatrix:
+        """Grid to grid map through edges."""
+        if self._grid_grids is None:
+            rows = concatenate((self.edges[:, 0], self.edges[:, 1]))
+            cols = concatenate((self.edges[:, 1], self.edges[:, 0]))
+            check = rows != cols
+            shape = (self.num_grids, self.num_grids)
+            self._grid_grids = CSRMatrix.from_coo(rows[check], cols[check],
+                                                  ones(check.sum(), dtype=int64),
+                                                  shape)
+        return self._grid_grids
+
+    def grid_elements(self, grid: int) -> 'NDArray[int64]':
+        return self.grid_elems.row_indices(grid)
+
+    def grid_neighbours(self, grid: int) -> 'NDArray[int64]':
+        return self.grid_grids.row_indices(grid)
+
+    def edge_elements(self, edge: int) -> 'NDArray[int64]':
+        return self.edge_elems.row_indices(edge)
+
+    def element_neighbours(self, elem: int) -> 'NDArray[int64]':
+        return self.elem_elems.row_indices(elem)
+
+    def __repr__(self) -> str:
+        return f'<MeshTopology: grids = {self.num_grids:d}, elems = {self.num_elems:d}>'
+
+
 class Mesh():
     ndim: int = 3
     grids: MeshGrids = None
@@ -494,6 +793,7 @@ class Mesh():
     attrs: dict[str, MeshVectors] = None
     _edges: MeshEdges = None
     _edges2D: MeshEdges = None
+    _topology: MeshTopology = None
 
     def __init__(self) -> None:
         if self.ndim == 3:
@@ -540,10 +840,11 @@ class Mesh():
         for attr in self.attrs.values():
             attr.append_cache()
 
-    def remove_duplicate_grids(self, decimals: int | None = None) -> None:
+    def remove_duplicate_grids(self, decimals: int | None = None,
+                               tol: float | None = None) -> None:
         if self.grids.size == 0:
             return None
-        unind, invind = self.grids.duplicate_indices(decimals=decimals)
+        unind, invind = self.grids.duplicate_indices(decimals=decimals, tol=tol)
         self.grids = self.grids[unind]
         self.lines.apply_inverse(invind, 'grids')
         self.trias.apply_inverse(invind, 'grids')
@@ -552,11 +853,12 @@ class Mesh():
             attr.apply_inverse(invind, 'grids')
 
     def remove_duplicate_vectors(self, label: str,
-                                 decimals: int | None = None) -> None:
+                                 decimals: int | None = None,
+                                 tol: float | None = None) -> None:
         attr = self.attrs[label]
         if attr.size == 0:
             return None
-        unind, invind = attr.duplicate_indices(decimals=decimals)
+        unind, invind = attr.duplicate_indices(decimals=decimals, tol=tol)
         self.attrs[label] = attr[unind]
         self.grids.apply_inverse(invind, label)
         self.lines.apply_inverse(invind, label)
@@ -748,18 +1050,41 @@ class Mesh():
 
         return True
 
+    @property
+    def elems_version(self) -> tuple[int, int, int]:
+        return (self.lines.version, self.trias.version, self.quads.version)
+
+    @property
+    def topology_version(self) -> tuple[int, ...]:
+        return (self.grids.size, *self.elems_version)
+
+    @property
+    def version(self) -> tuple[int, ...]:
+        versions = [attr.version for attr in self.attrs.values()]
+        return (self.grids.version, *self.elems_version, *versions)
+
     @property
     def edges(self) -> MeshEdges:
-        if self._edges is None:
+        if self._edges is None or self._edges.version != self.elems_version:
             self._edges = MeshEdges(self)
         return self._edges
 
     @property
     def edges2D(self) -> MeshEdges:
-        if self._edges2D is None:
+        if self._edges2D is None or self._edges2D.version != self.elems_version:
             self._edges2D = MeshEdges(self, mode='2D')
         return self._edges2D
 
+    @property
+    def topology(self) -> MeshTopology:
+        if self._topology is None or self._topology.version != self.topology_version:
+            self._topology = MeshTopology(self)
+        return self._topology
+
+    @property
+    def bounds(self) -> tuple['NDArray', 'NDArray']:
+        return self.grids.bounds
+
     @property
     def mesh_template(self) -> str:
         outstr = 'Mesh Template:\n'
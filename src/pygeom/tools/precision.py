@@ -0,0 +1,49 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from numpy import asarray, dtype, float64, ndarray
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
+
+_float_dtype = dtype(float64)
+
+
+def get_float_dtype() -> dtype:
+    """Returns the floating point dtype new arrays are created with."""
+    return _float_dtype
+
+def set_float_dtype(dtyp: 'DTypeLike') -> None:
+    """Sets the floating point dtype new arrays are created with."""
+    global _float_dtype
+    dtyp = dtype(dtyp)
+    if dtyp.kind != 'f':
+        raise ValueError('The float dtype must be a floating point dtype.')
+    _float_dtype = dtyp
+
+@contextmanager
+def float_dtype(dtyp: 'DTypeLike') -> Iterator[dtype]:
+    """Sets the floating point dtype within a with block."""
+    previous = get_float_dtype()
+    set_float_dtype(dtyp)
+    try:
+        yield get_float_dtype()
+    finally:
+        set_float_dtype(previous)
+
+def float_type(obj: Any) -> dtype:
+    """Returns the dtype of obj if it is a floating point array or dtype,
+    otherwise the current float dtype."""
+    if isinstance(obj, ndarray):
+        obj = obj.dtype
+    if isinstance(obj, dtype) and obj.kind == 'f':
+        return obj
+    return _float_dtype
+
+def as_float_array(obj: Any, dtyp: 'DTypeLike | None' = None) -> 'NDArray':
+    """Returns obj as an array of dtyp, keeping a floating point array's own
+    dtype if dtyp is None and using the current float dtype otherwise."""
+    if dtyp is None:
+        dtyp = float_type(obj)
+    return asarray(obj, dtype=dtyp)
@@ -0,0 +1,96 @@
+from math import comb, factorial
+from typing import TYPE_CHECKING
+
+from numpy import (clip, diff, ravel, result_type, searchsorted, shape, unique,
+                   zeros)
+
+from .basis import basis_derivatives_sparse, basis_sparse_product
+from .precision import as_float_array, float_type
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+class PowerSegments():
+    """Piecewise power basis form of a B-spline on its knot spans.
+
+    Each knot span [a, b] stores the coefficients c[j] of the polynomial
+    sum(c[j]*t**j) in the local parameter t = (u - a)/(b - a), for every
+    component of the (homogeneous) control points. Evaluation finds the span
+    of each parameter with searchsorted and applies Horner's scheme.
+    """
+    breaks: 'NDArray' = None
+    coeffs: 'NDArray' = None
+
+    def __init__(self, breaks: 'NDArray', coeffs: 'NDArray') -> None:
+        self.breaks = breaks
+        self.coeffs = coeffs
+
+    @classmethod
+    def from_bspline(cls, p: int, k: 'NDArray',
+                     ctlpnts: 'NDArray') -> 'PowerSegments':
+        """Returns the segments of a B-spline with control points stored on
+        the first axis of ctlpnts (shape (n, ncomp))."""
+        n = k.size - p - 1
+        breaks = unique(k[p:n + 1])
+        a = breaks[:-1]
+        h = diff(breaks)
+        ders, span = basis_derivatives_sparse(p, k, a, p)
+        coeffs = zeros((a.size, p + 1, *ctlpnts.shape[1:]),
+                       dtype=float_type(ctlpnts))
+        for j in range(p + 1):
+            scale = h**j/factorial(j)
+            deriv = basis_sparse_product(ctlpnts, ders[j], span)
+            coeffs[:, j] = deriv*scale.reshape((-1, *(1,)*(ctlpnts.ndim - 1)))
+        return cls(breaks, coeffs)
+
+    @property
+    def degree(self) -> int:
+        return self.coeffs.shape[1] - 1
+
+    @property
+    def numseg(self) -> int:
+        return self.coeffs.shape[0]
+
+    def segment_index(self, u: 'NDArray') -> tuple['NDArray', 'NDArray',
+                                                   'NDArray']:
+        """Returns the segment index, local parameter and span length of u."""
+        seg = searchsorted(self.breaks, u, side='right') - 1
+        seg = clip(seg, 0, self.numseg - 1)
+        a = self.breaks[seg]
+        h = self.breaks[seg + 1] - a
+        t = (u - a)/h
+        return seg, t, h
+
+    def evaluate(self, u: 'NDArray', order: int = 0) -> 'NDArray':
+        """Returns the derivatives up to order of the segments at u with shape
+        (order + 1, *u.shape, ncomp)."""
+        u = as_float_array(u)
+        ushp = shape(u)
+        p = self.degree
+        seg, t, h = self.segment_index(ravel(u))
+        cshp = self.coeffs.shape[2:]
+        tshp = (t.size, *(1,)*len(cshp))
+        dtyp = result_type(self.coeffs, u)
+        t = t.reshape(tshp).astype(dtyp, copy=False)
+        h = h.reshape(tshp).astype(dtyp, copy=False)
+        result = zeros((order + 1, t.size, *cshp), dtype=dtyp)
+        for i in range(min(order, p) + 1):
+            res = self.coeffs[seg, p]*(factorial(p)/factorial(p - i))
+            for j in range(p - 1, i - 1, -1):
+                res = res*t + self.coeffs[seg, j]*(factorial(j)/factorial(j - i))
+            result[i] = res/h**i
+        return result.reshape((order + 1, *ushp, *cshp))
+
+    def bezier_points(self) -> 'NDArray':
+        """Returns the Bezier control points of every segment with shape
+        (numseg, p + 1, ncomp)."""
+        p = self.degree
+        bezier = zeros(self.coeffs.shape, dtype=self.coeffs.dtype)
+        for i in range(p + 1):
+            for j in range(i + 1):
+                bezier[:, i] += self.coeffs[:, j]*(comb(i, j)/comb(p, j))
+        return bezier
+
+    def __repr__(self) -> str:
+        return f'<PowerSegments: degree={self.degree:d}, numseg={self.numseg:d}>'
@@ -0,0 +1,78 @@
+from multiprocessing.shared_memory import SharedMemory
+from pickle import PickleBuffer, dumps, loads
+from typing import Any
+
+ALIGNMENT = 64
+
+_blocks: dict[str, SharedMemory] = {}
+
+
+def _attach(name: str) -> SharedMemory:
+    shm = _blocks.get(name)
+    if shm is None:
+        shm = SharedMemory(name=name)
+        _blocks[name] = shm
+    return shm
+
+
+class SharedObject():
+    """Picklable handle to an object whose array buffers live in shared memory.
+
+    The object is pickled with protocol 5 and every out of band buffer, such
+    as the interleaved array of a Vector or the arrays of a Mesh, is copied
+    once into a shared memory block. The handle itself only carries the block
+    name and the in band pickle data, so it is cheap to send to worker
+    processes, where load rebuilds the object with arrays that are views of
+    the shared block. The creating process is responsible for calling unlink
+    once the workers are done.
+    """
+    name: str = None
+    data: bytes = None
+    spans: list[tuple[int, int]] = None
+
+    def __init__(self, obj: Any) -> None:
+        buffers: list[PickleBuffer] = []
+        self.data = dumps(obj, protocol=5, buffer_callback=buffers.append)
+        views = [buffer.raw() for buffer in buffers]
+        self.spans = []
+        size = 0
+        for view in views:
+            self.spans.append((size, view.nbytes))
+            size += -(-view.nbytes//ALIGNMENT)*ALIGNMENT
+        shm = SharedMemory(create=True, size=max(size, 1))
+        for (start, nbytes), view in zip(self.spans, views):
+            shm.buf[start:start + nbytes] = view
+            view.release()
+        self.name = shm.name
+        _blocks[self.name] = shm
+
+    @property
+    def nbytes(self) -> int:
+        return sum(nbytes for _, nbytes in self.spans)
+
+    def load(self) -> Any:
+        """Returns the object with its arrays as views of the shared block."""
+        shm = _attach(self.name)
+        buffers = [shm.buf[start:start + nbytes] for start, nbytes in self.spans]
+        return loads(self.data, buffers=buffers)
+
+    def unlink(self) -> None:
+        """Removes the shared block, which is freed once every process that
+        loaded the object has released its arrays."""
+        _attach(self.name).unlink()
+
+    def __repr__(self) -> str:
+        return f'<SharedObject {self.name:s}: nbytes={self.nbytes:d}>'
+
+
+def share(obj: Any) -> SharedObject:
+    """Returns a handle to a copy of obj placed in shared memory."""
+    return SharedObject(obj)
+
+
+def release(name: str) -> None:
+    """Closes this process's mapping of the named shared block. Objects
+    loaded from it must no longer be in use."""
+    shm = _blocks.pop(name, None)
+    if shm is not None:
+        shm.close()
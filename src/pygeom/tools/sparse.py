@@ -0,0 +1,149 @@
+from numbers import Number
+from typing import TYPE_CHECKING, Any
+
+from numpy import (add, arange, argsort, asarray, bincount, concatenate,
+                   cumsum, diff, flatnonzero, ndarray, nonzero, ones, repeat,
+                   zeros)
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
+
+
+def _is_scalar(obj: Any) -> bool:
+    """Return True for a number or a 0-d array."""
+    return isinstance(obj, Number) or (isinstance(obj, ndarray) and obj.ndim == 0)
+
+
+class CSRMatrix():
+    """Compressed sparse row matrix.
+
+    Products with dense arrays cost O(nnz) and the class defers ndarray
+    operators to itself, so it can be used as an operand of Vector,
+    Vector2D and Tensor2D matrix products, or as the components of a Vector
+    of matrices for matdot and matcross. A scipy.sparse matrix can be used
+    in the same places.
+    """
+    data: 'NDArray' = None
+    indices: 'NDArray' = None
+    indptr: 'NDArray' = None
+    shape: tuple[int, int] = None
+    _rows: 'NDArray' = None
+    _transpose: 'CSRMatrix' = None
+
+    __array_ufunc__ = None
+
+    def __init__(self, data: 'NDArray', indices: 'NDArray', indptr: 'NDArray',
+                 shape: tuple[int, int]) -> None:
+        self.data = asarray(data)
+        self.indices = asarray(indices)
+        self.indptr = asarray(indptr)
+        self.shape = tuple(shape)
+        if self.indptr.size != self.shape[0] + 1:
+            raise ValueError('CSRMatrix indptr must have one more entry than rows.')
+
+    @classmethod
+    def from_coo(cls, rows: 'NDArray', cols: 'NDArray', data: 'NDArray',
+                 shape: tuple[int, int]) -> 'CSRMatrix':
+        """Returns the matrix of the coordinate entries, summing duplicates."""
+        rows = asarray(rows).ravel()
+        cols = asarray(cols).ravel()
+        data = asarray(data).ravel()
+        key = rows*shape[1] + cols
+        order = argsort(key, kind='stable')
+        key = key[order]
+        first = ones(key.size, dtype=bool)
+        first[1:] = key[1:] != key[:-1]
+        start = flatnonzero(first)
+        data = add.reduceat(data[order], start) if start.size > 0 else data[:0]
+        rows = rows[order][start]
+        cols = cols[order][start]
+        indptr = concatenate(([0], cumsum(bincount(rows, minlength=shape[0]))))
+        return cls(data, cols, indptr, shape)
+
+    @classmethod
+    def from_dense(cls, arr: 'NDArray') -> 'CSRMatrix':
+        arr = asarray(arr)
+        if arr.ndim != 2:
+            raise ValueError('CSRMatrix can only be made from a 2D array.')
+        rows, cols = nonzero(arr)
+        return cls.from_coo(rows, cols, arr[rows, cols], arr.shape)
+
+    @property
+    def nnz(self) -> int:
+        return self.data.size
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def dtype(self) -> 'DTypeLike':
+        return self.data.dtype
+
+    @property
+    def rows(self) -> 'NDArray':
+        if self._rows is None:
+            self._rows = repeat(arange(self.shape[0]), diff(self.indptr))
+        return self._rows
+
+    @property
+    def T(self) -> 'CSRMatrix':
+        if self._transpose is None:
+            shape = (self.shape[1], self.shape[0])
+            self._transpose = CSRMatrix.from_coo(self.indices, self.rows,
+                                                 self.data, shape)
+        return self._transpose
+
+    def transpose(self) -> 'CSRMatrix':
+        return self.T
+
+    def row_indices(self, row: int) -> 'NDArray':
+        """Returns the column indices of the entries of a row."""
+        return self.indices[self.indptr[row]:self.indptr[row + 1]]
+
+    def toarray(self) -> 'NDArray':
+        arr = zeros(self.shape, dtype=self.dtype)
+        add.at(arr, (self.rows, self.indices), self.data)
+        return arr
+
+    def dot(self, arr: 'NDArray') -> 'NDArray':
+        """Returns the product of the matrix with arr along its first axis."""
+        arr = asarray(arr)
+        if arr.shape[0] != self.shape[1]:
+            raise ValueError('CSRMatrix and array shapes do not align.')
+        tail = arr.shape[1:]
+        prod = self.data.reshape((-1, *(1,)*len(tail)))*arr[self.indices]
+        result = zeros((self.shape[0], *tail), dtype=prod.dtype)
+        nonempty = flatnonzero(diff(self.indptr))
+        if nonempty.size > 0:
+            result[nonempty] = add.reduceat(prod, self.indptr[nonempty], axis=0)
+        return result
+
+    def __matmul__(self, obj: Any) -> 'NDArray | CSRMatrix':
+        if isinstance(obj, ndarray):
+            return self.dot(obj)
+        return NotImplemented
+
+    def __rmatmul__(self, obj: Any) -> 'NDArray':
+        if isinstance(obj, ndarray):
+            if obj.ndim == 1:
+                return self.T.dot(obj)
+            objf = obj.reshape((-1, obj.shape[-1]))
+            return self.T.dot(objf.T).T.reshape((*obj.shape[:-1], self.shape[1]))
+        return NotImplemented
+
+    def __mul__(self, obj: Any) -> 'CSRMatrix':
+        if not _is_scalar(obj):
+            return NotImplemented
+        return CSRMatrix(self.data*obj, self.indices, self.indptr, self.shape)
+
+    def __rmul__(self, obj: Any) -> 'CSRMatrix':
+        if not _is_scalar(obj):
+            return NotImplemented
+        return CSRMatrix(obj*self.data, self.indices, self.indptr, self.shape)
+
+    def __neg__(self) -> 'CSRMatrix':
+        return CSRMatrix(-self.data, self.indices, self.indptr, self.shape)
+
+    def __repr__(self) -> str:
+        return f'<CSRMatrix: shape={self.shape}, nnz={self.nnz:d}>'
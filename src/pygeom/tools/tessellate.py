@@ -0,0 +1,216 @@
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from numpy import (arccos, argsort, asarray, clip, concatenate, divide, full,
+                   int64, logical_or, maximum, meshgrid, ones, ravel,
+                   searchsorted, stack, unique, zeros)
+
+from .mesh import Mesh, Mesh2D
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    CurveCallable = Callable[['NDArray'], Any]
+    SurfaceCallable = Callable[['NDArray', 'NDArray'], Any]
+
+
+def midpoint_deviation(pnta: Any, pntm: Any, pntb: Any) -> tuple['NDArray',
+                                                               'NDArray']:
+    """Returns the distance of pntm from the chord pnta to pntb and the angle
+    the polyline pnta, pntm, pntb turns through at pntm."""
+    chord = pntb - pnta
+    veca = pntm - pnta
+    vecb = pntb - pntm
+    clen2 = chord.dot(chord)
+    frac = divide(veca.dot(chord), clen2, out=zeros(clen2.shape), where=clen2 > 0.0)
+    height = (veca - chord*frac).return_magnitude()
+    maga = veca.return_magnitude()
+    magb = vecb.return_magnitude()
+    denom = maga*magb
+    cosang = divide(veca.dot(vecb), denom, out=ones(denom.shape), where=denom > 0.0)
+    angle = arccos(clip(cosang, -1.0, 1.0))
+    return height, angle
+
+def tessellate_curve(evaluate: 'CurveCallable', t: 'NDArray', tol: float,
+                     angtol: float | None = None,
+                     maxiter: int = 16) -> tuple['NDArray', Any]:
+    """Returns the parameters and points of an adaptive tessellation of a
+    curve.
+
+    Starting from the sorted parameters t, every segment whose midpoint is
+    further than tol from its chord, or turns by more than angtol radians,
+    is split in two. All segments are tested together in each round and only
+    the segments created in the previous round are tested again.
+    """
+    t = unique(asarray(t, dtype=float))
+    pnts = evaluate(t)
+    active = ones(t.size - 1, dtype=bool)
+    for _ in range(maxiter):
+        ind = active.nonzero()[0]
+        if ind.size == 0:
+            break
+        tm = (t[ind] + t[ind + 1])/2
+        pntm = evaluate(tm).reshape(tm.shape)
+        height, angle = midpoint_deviation(pnts[ind], pntm, pnts[ind + 1])
+        split = height > tol
+        if angtol is not None:
+            split = logical_or(split, angle > angtol)
+        if not split.any():
+            break
+        tall = concatenate((t, tm[split]))
+        order = argsort(tall, kind='stable')
+        isnew = concatenate((zeros(t.size, dtype=bool),
+                             ones(split.sum(), dtype=bool)))[order]
+        t = tall[order]
+        pnts = pnts.__class__.concatenate((pnts, pntm[split]))[order]
+        active = logical_or(isnew[:-1], isnew[1:])
+    return t, pnts
+
+def _lattice_to_param(breaks: 'NDArray', lat: 'NDArray', scale: int) -> 'NDArray':
+    cell = clip(lat//scale, 0, breaks.size - 2)
+    frac = (lat - cell*scale)/scale
+    return breaks[cell] + (breaks[cell + 1] - breaks[cell])*frac
+
+def _cell_keys(i: 'NDArray', j: 'NDArray', numj: int) -> 'NDArray':
+    return i*numj + j
+
+def tessellate_surface(evaluate: 'SurfaceCallable', ub: 'NDArray',
+                       vb: 'NDArray', tol: float, angtol: float | None = None,
+                       maxlevel: int = 8) -> tuple[Mesh | Mesh2D,
+                                                   'NDArray', 'NDArray']:
+    """Returns a mesh of an adaptive tessellation of a surface and the
+    parameters of its grids.
+
+    The cells of the grid of breaks ub by vb are split into four in
+    vectorized rounds while the centre or an edge midpoint of a cell is
+    further than tol from the bilinear interpolation of its corners, or the
+    surface turns by more than angtol radians across a cell. Cells are then
+    split until neighbours differ by at most one level so that cells with
+    a hanging node on an edge can be filled with a fan of triangles about
+    their centre and the remaining cells become quads.
+    """
+    ub = unique(asarray(ub, dtype=float))
+    vb = unique(asarray(vb, dtype=float))
+    scale = 2**maxlevel
+    numj = (vb.size - 1)*scale + 1
+    ic, jc = meshgrid(range(ub.size - 1), range(vb.size - 1), indexing='ij')
+    i0 = ravel(ic).astype(int64)*scale
+    j0 = ravel(jc).astype(int64)*scale
+    size = full(i0.shape, scale, dtype=int64)
+    done = []
+
+    # offsets of the corners, edge midpoints and centre of a unit cell
+    offi = asarray([0.0, 1.0, 1.0, 0.0, 0.5, 1.0, 0.5, 0.0, 0.5])
+    offj = asarray([0.0, 0.0, 1.0, 1.0, 0.0, 0.5, 1.0, 0.5, 0.5])
+
+    for _ in range(maxlevel):
+        if i0.size == 0:
+            break
+        li = i0[:, None] + size[:, None]*offi
+        lj = j0[:, None] + size[:, None]*offj
+        u = _lattice_to_param(ub, li.astype(int64), scale)
+        v = _lattice_to_param(vb, lj.astype(int64), scale)
+        pnts = evaluate(u, v)
+        pc = [pnts[:, k] for k in range(9)]
+        height = zeros(i0.shape)
+        angle = zeros(i0.shape)
+        for a, m, b in ((0, 4, 1), (1, 5, 2), (2, 6, 3), (3, 7, 0),
+                        (0, 8, 2), (1, 8, 3), (7, 8, 5), (4, 8, 6)):
+            hgt, ang = midpoint_deviation(pc[a], pc[m], pc[b])
+            height = maximum(height, hgt)
+            angle = maximum(angle, ang)
+        split = height > tol
+        if angtol is not None:
+            split = logical_or(split, angle > angtol)
+        split = split & (size > 1)
+        done.append((i0[~split], j0[~split], size[~split]))
+        i0, j0, size = _split_cells(i0[split], j0[split], size[split])
+    done.append((i0, j0, size))
+
+    i0 = concatenate([cell[0] for cell in done])
+    j0 = concatenate([cell[1] for cell in done])
+    size = concatenate([cell[2] for cell in done])
+
+    # balance the cells so neighbours differ by at most one level
+    while True:
+        keys = _corner_keys(i0, j0, size, numj)
+        quarter = size//4
+        check = quarter > 0
+        hanging = zeros(i0.shape, dtype=bool)
+        for qi, qj in _edge_offsets(size, quarter):
+            qkeys = _cell_keys(i0 + qi, j0 + qj, numj)
+            hanging |= check & _isin_sorted(qkeys, keys)
+        for qi, qj in _edge_offsets(size, size - quarter):
+            qkeys = _cell_keys(i0 + qi, j0 + qj, numj)
+            hanging |= check & _isin_sorted(qkeys, keys)
+        if not hanging.any():
+            break
+        ci, cj, cs = _split_cells(i0[hanging], j0[hanging], size[hanging])
+        i0 = concatenate((i0[~hanging], ci))
+        j0 = concatenate((j0[~hanging], cj))
+        size = concatenate((size[~hanging], cs))
+
+    # find the hanging edge midpoints of each cell
+    keys = _corner_keys(i0, j0, size, numj)
+    half = size//2
+    midkeys = []
+    midflag = []
+    for mi, mj in _edge_offsets(size, half):
+        mkeys = _cell_keys(i0 + mi, j0 + mj, numj)
+        midkeys.append(mkeys)
+        midflag.append((half > 0) & _isin_sorted(mkeys, keys))
+    fan = midflag[0] | midflag[1] | midflag[2] | midflag[3]
+    cenkeys = _cell_keys(i0 + half, j0 + half, numj)
+    allkeys = unique(concatenate((keys, cenkeys[fan])))
+    corners = [searchsorted(allkeys, _cell_keys(i0 + ci*size, j0 + cj*size, numj))
+               for ci, cj in ((0, 0), (1, 0), (1, 1), (0, 1))]
+
+    quads = stack([corner[~fan] for corner in corners], axis=1)
+    cen = searchsorted(allkeys, cenkeys[fan])
+    trias = []
+    for k in range(4):
+        ca = corners[k][fan]
+        cb = corners[(k + 1) % 4][fan]
+        flag = midflag[k][fan]
+        mid = searchsorted(allkeys, midkeys[k][fan][flag])
+        trias.append(stack((cen[~flag], ca[~flag], cb[~flag]), axis=1))
+        trias.append(stack((cen[flag], ca[flag], mid), axis=1))
+        trias.append(stack((cen[flag], mid, cb[flag]), axis=1))
+    trias = concatenate(trias, axis=0)
+
+    u = _lattice_to_param(ub, allkeys//numj, scale)
+    v = _lattice_to_param(vb, allkeys % numj, scale)
+    pnts = evaluate(u, v)
+    if hasattr(pnts, 'z'):
+        mesh = Mesh()
+        mesh.grids.vecs = pnts.as_xyz_array()
+    else:
+        mesh = Mesh2D()
+        mesh.grids.vecs = pnts.as_xy_array()
+    mesh.trias.grids = trias.astype(int64)
+    mesh.quads.grids = quads.astype(int64)
+    return mesh, u, v
+
+def _split_cells(i0: 'NDArray', j0: 'NDArray',
+                 size: 'NDArray') -> tuple['NDArray', 'NDArray', 'NDArray']:
+    half = size//2
+    ci = concatenate((i0, i0 + half, i0 + half, i0))
+    cj = concatenate((j0, j0, j0 + half, j0 + half))
+    cs = concatenate((half, half, half, half))
+    return ci, cj, cs
+
+def _corner_keys(i0: 'NDArray', j0: 'NDArray', size: 'NDArray',
+                 numj: int) -> 'NDArray':
+    keys = [_cell_keys(i0 + ci*size, j0 + cj*size, numj)
+            for ci, cj in ((0, 0), (1, 0), (1, 1), (0, 1))]
+    return unique(concatenate(keys))
+
+def _edge_offsets(size: 'NDArray', dist: 'NDArray') -> list[tuple['NDArray',
+                                                                  'NDArray']]:
+    """Returns the lattice offsets of the points dist along each edge of the
+    cells, in counter clockwise order from the first corner."""
+    zero = zeros(size.shape, dtype=int64)
+    return [(dist, zero), (size, dist), (size - dist, size), (zero, size - dist)]
+
+def _isin_sorted(query: 'NDArray', keys: 'NDArray') -> 'NDArray':
+    ind = clip(searchsorted(keys, query), 0, keys.size - 1)
+    return keys[ind] == query
@@ -0,0 +1,132 @@
+from itertools import product
+from typing import TYPE_CHECKING
+
+from numpy import (append, arange, argsort, asarray, concatenate, cumprod,
+                   cumsum, diff, flatnonzero, floor, int64, iinfo, maximum,
+                   minimum, repeat, searchsorted, zeros)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+HASH_PRIMES = (73856093, 19349663, 83492791)
+
+
+def hash_cells(cells: 'NDArray[int64]') -> 'NDArray[int64]':
+    """Returns hash keys of integer cell coordinates, one cell per row."""
+    keys = zeros(cells.shape[0], dtype=int64)
+    for i in range(cells.shape[1]):
+        keys ^= cells[:, i]*HASH_PRIMES[i % len(HASH_PRIMES)]
+    return keys
+
+
+def _cell_strides(cells: 'NDArray[int64]') -> 'NDArray[int64] | None':
+    """Returns the strides numbering the cells and their neighbours linearly,
+    or None if the grid is too large for int64 keys."""
+    dims = cells.max(axis=0).astype(float) + 2.0
+    if dims.prod() >= iinfo(int64).max:
+        return None
+    return cumprod(append(1, dims[:-1].astype(int64)))
+
+
+def _close_pairs(pnts: 'NDArray', tol: float) -> tuple['NDArray[int64]',
+                                                        'NDArray[int64]']:
+    """Returns index pairs of points closer than tol, found by sorting the
+    points into cells of size tol and searching neighbouring cells.
+
+    Cells are numbered linearly when the grid is small enough, so that the
+    keys of neighbouring cells keep their order and each search is a merge
+    of sorted keys, and are hashed otherwise.
+    """
+    num, ndim = pnts.shape
+    cells = floor(pnts/tol).astype(int64)
+    cells = cells - cells.min(axis=0) + 1
+    strides = _cell_strides(cells)
+    keys = cells@strides if strides is not None else hash_cells(cells)
+    order = argsort(keys, kind='stable')
+    skeys = keys[order]
+    first = append(True, skeys[1:] != skeys[:-1])
+    start = flatnonzero(first)
+    ukeys = skeys[start]
+    count = diff(append(start, num))
+    bucket = cumsum(first) - 1
+    ipairs, jpairs = [], []
+    for offset in product((-1, 0, 1), repeat=ndim):
+        offset = asarray(offset, dtype=int64)
+        if (offset != 0).any() and offset[offset != 0][0] < 0:
+            continue
+        if strides is not None:
+            npos = searchsorted(ukeys, ukeys + offset@strides)[bucket]
+            nkeys = skeys + offset@strides
+        else:
+            nkeys = hash_cells(cells[order] + offset)
+            qorder = argsort(nkeys)
+            npos = zeros(num, dtype=int64)
+            npos[qorder] = searchsorted(ukeys, nkeys[qorder])
+        npos[npos == ukeys.size] = 0
+        found = ukeys[npos] == nkeys
+        if (offset != 0).any():
+            found &= npos != bucket
+        pcount = zeros(num, dtype=int64)
+        pcount[found] = count[npos[found]]
+        total = pcount.sum()
+        if total == 0:
+            continue
+        ind = repeat(arange(num), pcount)
+        jnd = repeat(start[npos] - cumsum(pcount) + pcount, pcount) + arange(total)
+        if not (offset != 0).any():
+            check = jnd < ind
+            ind, jnd = ind[check], jnd[check]
+        ipairs.append(ind)
+        jpairs.append(jnd)
+    if len(ipairs) == 0:
+        return zeros(0, dtype=int64), zeros(0, dtype=int64)
+    ind, jnd = order[concatenate(ipairs)], order[concatenate(jpairs)]
+    dist2 = ((pnts[ind] - pnts[jnd])**2).sum(axis=1)
+    check = dist2 <= tol**2
+    return ind[check], jnd[check]
+
+
+def weld_indices(pnts: 'NDArray', tol: float,
+                 meta: tuple['NDArray', ...] = ()) -> tuple['NDArray[int64]',
+                                                           'NDArray[int64]']:
+    """Returns the indices unind of the retained points and invind, which
+    maps every point to its retained point, welding points within tol of
+    each other that have equal meta rows.
+
+    Points are sorted into a uniform grid of cells of size tol, so that
+    only points in neighbouring cells are compared, and chains of close
+    points are welded into one. The retained point of each group is its
+    first point, so that unind is in the original order of the points.
+    """
+    pnts = asarray(pnts)
+    if pnts.ndim == 1:
+        pnts = pnts.reshape(-1, 1)
+    num = pnts.shape[0]
+    if tol <= 0.0:
+        raise ValueError('Weld tolerance must be positive.')
+    ind, jnd = _close_pairs(pnts, tol)
+    for value in meta:
+        value = asarray(value).reshape(num, -1)
+        check = (value[ind] == value[jnd]).all(axis=1)
+        ind, jnd = ind[check], jnd[check]
+    # Every round hooks the larger root of each joining pair onto the smaller
+    # and then jumps pointers until every label is a root again, so that the
+    # number of rounds grows with the log of the group size.
+    label = arange(num)
+    while ind.size > 0:
+        lind, ljnd = label[ind], label[jnd]
+        check = lind != ljnd
+        if not check.any():
+            break
+        ind, jnd = ind[check], jnd[check]
+        lind, ljnd = lind[check], ljnd[check]
+        minimum.at(label, maximum(lind, ljnd), minimum(lind, ljnd))
+        while True:
+            newlabel = label[label]
+            if (newlabel == label).all():
+                break
+            label = newlabel
+    keep = label == arange(num)
+    unind = flatnonzero(keep)
+    invind = (cumsum(keep) - 1)[label]
+    return unind, invind
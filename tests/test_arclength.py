@@ -0,0 +1,30 @@
+from numpy import asarray, cos, isclose, linspace, pi, sin, sqrt
+
+from pygeom.geom2d import NurbsCurve2D, ParamCurve2D, Vector2D
+from pygeom.geom3d import CubicSpline, Vector
+
+
+def test_param_curve_arclength():
+    curve = ParamCurve2D(lambda u: Vector2D(cos(pi*u), sin(pi*u)),
+                         lambda u: Vector2D(-pi*sin(pi*u), pi*cos(pi*u)))
+    assert isclose(curve.arclength_table.length, pi)
+    assert isclose(curve.evaluate_arclength_t(8), linspace(0.0, 1.0, 9)).all()
+
+def test_nurbs_curve_arclength():
+    ctlpnts = Vector2D(asarray([1.0, 1.0, 0.0]), asarray([0.0, 1.0, 1.0]))
+    weights = asarray([1.0, sqrt(0.5), 1.0])
+    curve = NurbsCurve2D(ctlpnts, weights=weights, degree=2)
+    arcl = linspace(0.0, pi/2, 7)
+    pnts = curve.evaluate_points_at_arclengths(arcl)
+    assert isclose(pnts.return_angle(), arcl).all()
+    u = curve.evaluate_t_at_arclengths(arcl)
+    assert isclose(curve.evaluate_arclengths_at_t(u), arcl).all()
+
+def test_cubic_spline_arclength():
+    th = linspace(0.0, pi, 17)
+    spline = CubicSpline(Vector(cos(th), sin(th), 0.0*th))
+    s = spline.evaluate_arclength_t(16)
+    pnts = spline.evaluate_points_at_t(s)
+    dist = (pnts[1:] - pnts[:-1]).return_magnitude()
+    assert isclose(dist, dist.mean(), rtol=1e-3).all()
+    assert isclose(spline.arclength_table.length, pi, rtol=1e-3)
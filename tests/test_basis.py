@@ -0,0 +1,78 @@
+from numpy import asarray, concatenate, full, isclose, linspace
+
+from pygeom.geom3d import NurbsSurface, Vector
+from pygeom.tools.basis import (BasisCache, basis_derivatives_sparse,
+                                basis_first_derivatives, basis_functions,
+                                basis_functions_sparse,
+                                basis_second_derivatives,
+                                basis_sparse_to_dense, knot_linspace)
+
+p = 3
+k = asarray([0.0, 0.2, 0.5, 0.5, 1.0])
+ck = concatenate((full(p, k[0]), k, full(p, k[-1])))
+u = knot_linspace(8, k)
+n = ck.size - p - 1
+
+uk = asarray([0.0, 2.0, 4.0, 6.0, 8.0])
+uu = linspace(-2.0, 10.0, 121)
+
+def test_basis_functions_sparse_clamped():
+    Nu, span = basis_functions_sparse(p, ck, u)
+    dense = basis_sparse_to_dense(n, Nu, span)
+    assert isclose(dense, basis_functions(p, ck, u), atol=1e-12).all()
+
+def test_basis_functions_sparse_unclamped():
+    for q in range(4):
+        Nu, span = basis_functions_sparse(q, uk, uu)
+        dense = basis_sparse_to_dense(uk.size - q - 1, Nu, span)
+        assert isclose(dense, basis_functions(q, uk, uu), atol=1e-12).all()
+
+def test_basis_functions_sparse_partition_of_unity():
+    Nu, _ = basis_functions_sparse(p, ck, u)
+    assert isclose(Nu.sum(axis=-1), 1.0, atol=1e-12).all()
+
+def test_basis_derivatives_sparse():
+    ders, span = basis_derivatives_sparse(p, ck, u, 2)
+    Nu, _ = basis_functions_sparse(p, ck, u)
+    dNu = basis_sparse_to_dense(n, ders[1], span)
+    d2Nu = basis_sparse_to_dense(n, ders[2], span)
+    assert isclose(ders[0], Nu, atol=1e-12).all()
+    assert isclose(dNu, basis_first_derivatives(p, ck, u), atol=1e-9).all()
+    assert isclose(d2Nu, basis_second_derivatives(p, ck, u), atol=1e-9).all()
+
+def test_basis_cache():
+    cache = BasisCache(maxsize=2)
+    ders, span = cache.basis_derivatives_sparse(p, ck, u, 2)
+    Nu, _ = cache.basis_functions_sparse(p, ck, u.copy())
+    assert cache.hits == 1 and cache.misses == 1
+    assert isclose(Nu, ders[0]).all()
+    cache.basis_functions_sparse(p, ck, uu.clip(0.0, 1.0))
+    cache.basis_functions_sparse(p, ck, linspace(0.0, 1.0, 5))
+    assert cache.size == 2
+    cache.basis_functions_sparse(p, ck, u)
+    assert cache.misses == 4
+
+def test_basis_cache_maxnum():
+    cache = BasisCache(maxnum=4)
+    Nu, _ = cache.basis_functions_sparse(p, ck, u)
+    assert cache.size == 0 and cache.misses == 1
+    assert isclose(Nu.sum(axis=-1), 1.0).all()
+
+def test_basis_cache_keeps_shape():
+    cache = BasisCache()
+    ders, span = cache.basis_derivatives_sparse(p, ck, 0.3, 1)
+    assert ders.shape == (2, p + 1) and span.shape == ()
+    ders, span = cache.basis_derivatives_sparse(p, ck, u.reshape(-1, 1), 1)
+    assert ders.shape == (2, u.size, 1, p + 1) and span.shape == (u.size, 1)
+    with cache.bypass():
+        cache.basis_functions_sparse(p, ck, uu.clip(0.0, 1.0))
+    assert cache.size == 2
+
+def test_surface_scalar_evaluation():
+    uc = linspace(0.0, 1.0, 4)
+    x, y = uc[:, None] + 0.0*uc, 0.0*uc[:, None] + uc
+    surface = NurbsSurface(Vector(x, y, x*(1.0 - y)))
+    pnt = surface.evaluate_points_at_uv(0.3, 0.6)
+    assert isinstance(pnt.x, float) and isclose(pnt.z, 0.3*0.4)
+    tangent_u, tangent_v = surface.evaluate_tangents_at_uv(0.3, 0.6)
+    assert isinstance(tangent_u.x, float) and isinstance(tangent_v.z, float)
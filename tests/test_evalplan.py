@@ -0,0 +1,56 @@
+from numpy import asarray, linspace
+
+from pygeom.geom3d import NurbsCurve, NurbsSurface, Vector
+from pygeom.tools.evalplan import NurbsCurvePlan, NurbsSurfacePlan
+
+ctlpnts = Vector(asarray([0.0, 1.0, 2.0, 3.0, 4.0, 5.0]),
+                 asarray([0.0, 1.0, 0.5, -0.5, 1.0, 0.0]),
+                 asarray([0.0, 0.2, 0.4, 0.2, 0.0, 0.1]))
+weights = asarray([1.0, 0.8, 1.2, 1.0, 0.9, 1.0])
+knots = asarray([0.0, 0.2, 0.5, 1.0])
+
+curve = NurbsCurve(ctlpnts, weights=weights, degree=3, knots=knots)
+u = curve.evaluate_t(8)
+
+ctlnet = Vector.stack([ctlpnts, ctlpnts*2.0, ctlpnts*3.0 + Vector(0.0, 0.0, 1.0)])
+surface = NurbsSurface(ctlnet, udegree=2, vdegree=3, vknots=knots)
+uv = linspace(0.0, 1.0, 7)
+
+def test_curve_plan_derivatives():
+    plan = NurbsCurvePlan.from_curve(curve, u, order=2)
+    ders = plan.evaluate_derivatives(curve)
+    refs = curve.evaluate_derivatives_at_t(u, 2)
+    for der, ref in zip(ders, refs):
+        assert der.all_close(ref, atol=1e-12)
+
+def test_curve_plan_operator():
+    plan = NurbsCurvePlan.from_curve(curve, u, order=1)
+    numer = plan.operator(0)@curve.wpoints
+    denom = plan.operator(0)@curve.weights
+    assert (numer/denom).all_close(curve.evaluate_points_at_t(u), atol=1e-12)
+    bspline = NurbsCurve(ctlpnts, degree=3, knots=knots)
+    assert (plan.operator(1)@ctlpnts).all_close(plan.apply(ctlpnts, 1), atol=1e-12)
+    assert (plan.operator(0)@ctlpnts).all_close(bspline.evaluate_points_at_t(u),
+                                                atol=1e-12)
+    assert plan.operator(0) is plan.operator(0)
+
+def test_curve_plan_reuse():
+    plan = NurbsCurvePlan.from_curve(curve, u)
+    other = curve.copy()
+    other.ctlpnts.z += 1.0
+    other.reset()
+    pnts = plan.evaluate_points(other)
+    assert pnts.all_close(other.evaluate_points_at_t(u), atol=1e-12)
+
+def test_surface_plan_grid():
+    plan = NurbsSurfacePlan.from_surface(surface, uv, uv, order=1)
+    tgtu, tgtv = plan.evaluate_tangents(surface)
+    refu, refv = surface.evaluate_tangents_at_uv(uv, uv)
+    assert tgtu.all_close(refu, atol=1e-12)
+    assert tgtv.all_close(refv, atol=1e-12)
+
+def test_surface_plan_mesh():
+    plan = NurbsSurfacePlan.from_surface(surface, uv, uv[::-1], grid=False)
+    pnts = plan.evaluate_points(surface)
+    refs = surface.evaluate_points_at_uv_mesh(uv, uv[::-1])
+    assert pnts.all_close(refs, atol=1e-12)
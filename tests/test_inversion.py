@@ -0,0 +1,65 @@
+from numpy import asarray, isclose, linspace, ones, random
+
+from pygeom.geom2d import NurbsCurve2D, Vector2D
+from pygeom.geom3d import NurbsSurface, Vector
+from pygeom.tools.inversion import nearest_samples
+
+rng = random.default_rng(0)
+
+def test_curve_project_points():
+    ctlpnts = Vector2D(asarray([0.0, 1.0, 2.0, 3.0]), asarray([0.0, 1.0, 1.0, 0.0]))
+    curve = NurbsCurve2D(ctlpnts, weights=asarray([1.0, 0.8, 1.2, 1.0]))
+    u = rng.random(500)
+    tangents = curve.evaluate_tangents_at_t(u)
+    pnts = curve.evaluate_points_at_t(u) + tangents.rotate_90deg()*0.05
+    uproj, foot, dist = curve.project_points(pnts)
+    assert isclose(uproj, u, atol=1e-9).all()
+    assert foot.is_close(curve.evaluate_points_at_t(u), atol=1e-9).all()
+    assert isclose(dist, 0.05).all()
+
+def test_surface_project_points():
+    uc = linspace(0.0, 1.0, 4)
+    x, y = uc[:, None] + 0.0*uc, 0.0*uc[:, None] + uc
+    weights = ones((4, 4))
+    weights[1, 2] = 1.5
+    surface = NurbsSurface(Vector(x, y, x*(1.0 - y)), weights=weights)
+    u = rng.random((20, 10))
+    v = rng.random((20, 10))
+    tangent_u, tangent_v = surface.evaluate_tangents_at_uv_mesh(u, v)
+    normals = tangent_u.cross(tangent_v).to_unit()
+    pnts = surface.evaluate_points_at_uv_mesh(u, v) + normals*0.05
+    uproj, vproj, foot, dist = surface.project_points(pnts)
+    assert uproj.shape == u.shape and foot.shape == u.shape
+    assert isclose(uproj, u, atol=1e-9).all()
+    assert isclose(vproj, v, atol=1e-9).all()
+    assert isclose(dist, 0.05).all()
+
+def test_curve_project_points_large_coordinates():
+    ctlpnts = Vector2D(asarray([0.0, 1.0, 2.0, 3.0]), asarray([0.0, 1.0, 1.0, 0.0]))
+    curve = NurbsCurve2D(ctlpnts*1e6 + Vector2D(5e6, 5e6))
+    calls = []
+    evaluate = curve.evaluate_derivatives_at_t
+    curve.evaluate_derivatives_at_t = lambda *args: calls.append(1) or evaluate(*args)
+    u = rng.random(100)
+    tangents = curve.evaluate_tangents_at_t(u)
+    pnts = curve.evaluate_points_at_t(u) + tangents.rotate_90deg()*1e4
+    uproj, _, dist = curve.project_points(pnts)
+    assert isclose(uproj, u, atol=1e-9).all()
+    assert isclose(dist, 1e4).all()
+    assert len(calls) < 15
+
+def test_sample_grid_nearest():
+    uc = linspace(0.0, 1.0, 4)
+    x, y = uc[:, None] + 0.0*uc, 0.0*uc[:, None] + uc
+    surface = NurbsSurface(Vector(x, y, x*(1.0 - y)))
+    pnts = Vector.from_xyz_array(rng.random((2000, 3))*3.0 - 1.0)
+    surface.project_points(pnts[:10])
+    grid = surface._sample_grid
+    assert grid is not None and grid.samples.size == 81
+    near = grid.samples[grid.nearest(pnts)]
+    brute = grid.samples[nearest_samples(pnts, grid.samples)]
+    assert ((near - pnts).return_magnitude() == (brute - pnts).return_magnitude()).all()
+    surface.project_points(pnts[:10])
+    assert surface._sample_grid is grid
+    surface.reset()
+    assert surface._sample_grid is None
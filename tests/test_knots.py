@@ -0,0 +1,43 @@
+from numpy import asarray, linspace
+
+from pygeom.geom2d import NurbsCurve2D, Vector2D
+from pygeom.geom3d import NurbsSurface, Vector
+
+ctlpnts = Vector2D(asarray([0.0, 1.0, 2.0, 3.0, 4.0, 5.0]),
+                   asarray([0.0, 2.0, -1.0, 3.0, 0.5, 1.0]))
+weights = asarray([1.0, 0.8, 1.5, 1.0, 0.7, 1.0])
+curve = NurbsCurve2D(ctlpnts, weights=weights, degree=3,
+                     knots=asarray([0.0, 0.4, 0.7, 1.0]))
+u = linspace(0.0, 1.0, 41)
+
+def test_curve_insert_knots():
+    refined = curve.insert_knots([0.1, 0.4, 0.55, 0.55])
+    assert refined.ctlpnts.size == curve.ctlpnts.size + 4
+    assert refined.evaluate_points_at_t(u).is_close(curve.evaluate_points_at_t(u)).all()
+    matrix = curve.knot_refinement_matrix([0.1, 0.4, 0.55, 0.55])
+    assert (matrix@curve.wpoints).is_close(refined.wpoints).all()
+
+def test_curve_elevate_degree():
+    elevated = curve.elevate_degree(2)
+    assert elevated.degree == curve.degree + 2
+    assert elevated.evaluate_points_at_t(u).is_close(curve.evaluate_points_at_t(u)).all()
+
+def test_curve_split_at_t():
+    curveone, curvetwo = curve.split_at_t(0.55)
+    pnts = curve.evaluate_points_at_t(u)
+    check = u <= 0.55
+    assert curveone.evaluate_points_at_t(u[check]).is_close(pnts[check]).all()
+    assert curvetwo.evaluate_points_at_t(u[~check]).is_close(pnts[~check]).all()
+
+def test_surface_refine_and_elevate():
+    uc = linspace(0.0, 1.0, 5)
+    vc = linspace(0.0, 1.0, 4)
+    x, y = uc[:, None] + 0.0*vc, 0.0*uc[:, None] + vc
+    surface = NurbsSurface(Vector(x, y, x*y), udegree=2, vdegree=3)
+    v = linspace(0.0, 1.0, 7)
+    pnts = surface.evaluate_points_at_uv(v, v)
+    refined = surface.insert_uknots([0.3, 0.6]).insert_vknots([0.5])
+    elevated = surface.elevate_udegree().elevate_vdegree()
+    assert refined.ctlpnts.shape == (7, 5)
+    assert refined.evaluate_points_at_uv(v, v).is_close(pnts).all()
+    assert elevated.evaluate_points_at_uv(v, v).is_close(pnts).all()
@@ -0,0 +1,39 @@
+from numpy import isclose, linspace, sqrt, zeros
+from pytest import raises
+
+from pygeom.geom2d import Vector2D
+from pygeom.geom3d import Vector
+from pygeom.tools.lazy import LazyArray, evaluate, lazy
+
+
+def test_lazy_vector_expression():
+    t = linspace(0.0, 1.0, 1001)
+    vec = Vector(t, t**2, 1.0 - t)
+    wgt = 1.0 + t
+    expect = (vec*wgt - vec.cross(vec*2.0 + Vector(1.0, 0.0, 0.0)))/wgt**2
+    lvec = lazy(vec)
+    result = (lvec*wgt - lvec.cross(lvec*2.0 + Vector(1.0, 0.0, 0.0)))/wgt**2
+    assert isinstance(result.x, LazyArray)
+    assert result.shape == (1001, )
+    assert evaluate(result, chunksize=64).is_close(expect, atol=1e-14).all()
+
+def test_lazy_array_ufuncs():
+    t = linspace(0.0, 2.0, 101)
+    vec = lazy(Vector2D(t, 2.0*t))
+    mag = vec.return_magnitude()
+    assert isclose(mag.evaluate(chunksize=16), sqrt(5.0)*t).all()
+    assert (evaluate(mag > 1.0) == (sqrt(5.0)*t > 1.0)).all()
+
+def test_lazy_vector_methods():
+    t = linspace(0.0, 1.0, 101)
+    vec = Vector(t, t**2, 1.0 - t)
+    lvec = lazy(vec)
+    assert isclose(evaluate(lvec.return_magnitude()), vec.return_magnitude()).all()
+    assert lvec.to_unit().is_close(vec.to_unit(), atol=1e-14).all()
+    unit, mag = lazy(Vector(t, 0.0*t, 0.0*t)).to_unit(return_magnitude=True)
+    assert unit.x[0] == 0.0 and (unit.x[1:] == 1.0).all()
+    assert (evaluate(mag) == t).all()
+    assert evaluate((lvec*t)[10:20:3]).is_close((vec*t)[10:20:3], atol=1e-14).all()
+    assert evaluate((lvec*2.0)[5]).is_close(vec[5]*2.0, atol=1e-14)
+    with raises(TypeError):
+        vec.return_magnitude(out=lazy(zeros(101)))
@@ -0,0 +1,50 @@
+from numpy import diag, eye, zeros
+from numpy.linalg import solve
+from numpy.random import default_rng
+
+from pygeom.geom3d import Vector
+from pygeom.tools.linsolve import SolverCache, VectorSolver, solver_cache
+
+rng = default_rng(2)
+num = 80
+amat = rng.normal(size=(num, num)) + num*eye(num)
+
+def test_vector_solver():
+    bvec = Vector.from_xyz_array(rng.normal(size=(num, 4, 3)))
+    solver = VectorSolver(amat)
+    xvec = bvec.solve(solver)
+    assert xvec.shape == (num, 4)
+    assert abs(xvec.x - solve(amat, bvec.x)).max() < 1e-12
+    assert abs(xvec.z - solve(amat, bvec.z)).max() < 1e-12
+
+def test_solver_cache():
+    cache = SolverCache(maxsize=2, minsize=8)
+    bmat = rng.normal(size=(num, 3))
+    xmat = solve(amat, bmat)
+    for _ in range(3):
+        assert abs(cache.solve(amat, bmat) - xmat).max() < 1e-12
+    assert cache.cache_info()['hits'] == 2 and cache.size == 1
+    cache.solve(amat + eye(num), bmat)
+    cache.solve(amat + 2*eye(num), bmat)
+    assert cache.size == 2 and cache.cache_info()['misses'] == 3
+
+def test_vector_solve_direct():
+    bvec = Vector.from_xyz_array(rng.normal(size=(num, 3)))
+    xmat = solve(amat, bvec.stack_xyz())
+    for _ in range(2):
+        xvec = bvec.solve(amat)
+        assert (xvec.stack_xyz() == xmat).all()
+    assert solver_cache.size == 0 and solver_cache.cache_info()['misses'] == 0
+
+def test_banded_solver():
+    lower, upper = 1, 2
+    band = rng.normal(size=(num, lower + upper + 1))
+    band[:, lower] += 8.0
+    dense = zeros((num, num))
+    for i in range(num):
+        for j in range(max(0, i - lower), min(num, i + upper + 1)):
+            dense[i, j] = band[i, lower + j - i]
+    bmat = rng.normal(size=(num, 2))
+    solver = VectorSolver.banded(band, lower, upper)
+    assert abs(solver.solve(bmat) - solve(dense, bmat)).max() < 1e-12
+    assert abs(solver.solve(diag(dense)) - solve(dense, diag(dense))).max() < 1e-12
@@ -0,0 +1,136 @@
+from numpy import arange, array, full, int64, ones, vstack, zeros
+from numpy.random import default_rng
+
+from pygeom.geom3d import Vector
+from pygeom.tools.mesh import Mesh, MeshGrids, MeshTrias
+from pygeom.tools.weld import weld_indices
+
+
+def test_mesh_add_many_matches_add():
+    rng = default_rng(3)
+    pnts = rng.random((50, 3))
+    trias = rng.integers(0, 50, (40, 3))
+    mesh1 = Mesh()
+    mesh2 = Mesh()
+    for mesh in (mesh1, mesh2):
+        mesh.grids.add_meta('group', int64, -1)
+        mesh.trias.add_meta('corners', int64, (0, 0, 0))
+    for i, pnt in enumerate(pnts):
+        mesh1.grids.add(*pnt, group=i % 4)
+    for tria in trias:
+        mesh1.trias.add(*tria, corners=tuple(tria))
+    mesh1.resolve_cache()
+    mesh2.grids.add(*pnts[0], group=0)
+    mesh2.grids.add_many(Vector.from_xyz_array(pnts[1:]), group=arange(1, 50) % 4)
+    mesh2.trias.add_many(trias, corners=trias)
+    mesh2.resolve_cache()
+    assert (mesh1.grids.vecs == mesh2.grids.vecs).all()
+    assert (mesh1.grids.meta['group'] == mesh2.grids.meta['group']).all()
+    assert (mesh1.trias.grids == mesh2.trias.grids).all()
+    assert (mesh1.trias.meta['corners'] == mesh2.trias.meta['corners']).all()
+
+
+def test_mesh_add_many_defaults_and_from_arrays():
+    grids = MeshGrids()
+    grids.add_meta('group', int64, 7)
+    grids.add_many(zeros((5, 3)))
+    grids.append_cache()
+    assert grids.meta['group'].shape == (5, 1)
+    assert (grids.meta['group'] == 7).all()
+    trias = MeshTrias.from_arrays(array([[0, 1, 2], [2, 3, 0]]), group=ones(2, dtype=int64))
+    assert trias.size == 2 and trias.meta['group'].shape == (2, 1)
+
+
+def test_mesh_append_cache_grows_in_place():
+    grids = MeshGrids()
+    grids.add_meta('group', int64, 0)
+    chunks = []
+    for i in range(200):
+        chunk = default_rng(i).random((3, 3))
+        chunks.append(chunk)
+        grids.add_many(chunk, group=full(3, i))
+        grids.append_cache()
+    assert grids._store.capacity < 2*grids.size
+    assert grids.vecs.base is grids._store._data
+    assert (grids.vecs == vstack(chunks)).all()
+    assert (grids.meta['group'].ravel() == arange(600)//3).all()
+    first = grids.vecs
+    grids.add(1.0, 2.0, 3.0)
+    grids.resolve_cache()
+    assert (first == vstack(chunks)).all()
+    assert grids.vecs.shape == (1, 3)
+
+
+def test_mesh_remove_duplicate_grids_with_tolerance():
+    rng = default_rng(5)
+    pnts = rng.random((1000, 3))
+    jitter = (rng.random((1000, 3)) - 0.5)*1e-7
+    mesh = Mesh()
+    mesh.grids.add_many(vstack((pnts, pnts + jitter)))
+    mesh.trias.add_many(arange(1000)[:, None] + array([0, 1000, 1000]))
+    mesh.resolve_cache()
+    mesh.remove_duplicate_grids(tol=1e-6)
+    assert mesh.grids.size == 1000
+    assert (abs(mesh.grids.vecs - pnts) == 0.0).all()
+    assert (mesh.trias.grids == arange(1000)[:, None]).all()
+
+
+def test_weld_indices_straddles_rounding_and_respects_meta():
+    pnts = array([[1.49999, 0.0], [1.50001, 0.0], [1.50003, 0.0], [3.0, 0.0]])
+    unind, invind = weld_indices(pnts, 2.5e-5)
+    assert (unind == [0, 3]).all() and (invind == [0, 0, 0, 1]).all()
+    unind, invind = weld_indices(pnts, 2.5e-5, (array([0, 0, 1, 0]), ))
+    assert (unind == [0, 2, 3]).all() and (invind == [0, 0, 1, 2]).all()
+
+
+def test_weld_indices_long_chain():
+    num = 20000
+    pnts = zeros((num, 3))
+    pnts[:, 0] = 0.9*default_rng(4).permutation(num)
+    unind, invind = weld_indices(pnts, 1.0)
+    assert (unind == [0]).all() and (invind == 0).all()
+    side = pnts[:, 0] > 0.9*(num//2)
+    unind, invind = weld_indices(pnts[:, :2], 1.0, (side, ))
+    assert unind.size == 2 and (side[unind] != side[0]).any()
+    assert (invind == (side != side[0])).all()
+
+
+def test_mesh_topology_adjacency():
+    mesh = Mesh()
+    mesh.grids.add_many(default_rng(0).random((6, 3)))
+    mesh.lines.add(4, 5)
+    mesh.trias.add_many(array([[0, 1, 2], [0, 2, 3]]))
+    mesh.quads.add(1, 4, 5, 2)
+    mesh.resolve_cache()
+    topology = mesh.topology
+    assert (topology.offsets == [0, 1, 3, 4]).all()
+    assert topology.num_edges == 8
+    assert sorted(topology.grid_elements(2)) == [1, 2, 3]
+    assert sorted(topology.element_neighbours(1)) == [2, 3]
+    assert sorted(topology.element_neighbours(3)) == [0, 1]
+    assert sorted(topology.grid_neighbours(0)) == [1, 2, 3]
+    assert topology.free_edges.shape == (5, 2)
+    degree = topology.grid_elems@ones(topology.num_elems, dtype=int64)
+    assert (degree == [2, 2, 3, 1, 2, 2]).all()
+
+
+def test_mesh_caches_follow_versions():
+    mesh = Mesh()
+    mesh.grids.add_many(array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0],
+                               [0.0, 1.0, 0.0], [0.0, 0.0, 0.0]]))
+    mesh.quads.add(0, 1, 2, 3)
+    mesh.quads.add(4, 1, 1, 2)
+    mesh.resolve_cache()
+    edges = mesh.edges
+    topology = mesh.topology
+    assert mesh.edges is edges and mesh.topology is topology
+    assert (mesh.bounds[1] == [1.0, 1.0, 0.0]).all()
+    mesh.grids[2] = MeshGrids.from_arrays(array([[2.0, 1.0, 0.0]]))
+    assert (mesh.bounds[1] == [2.0, 1.0, 0.0]).all()
+    assert mesh.topology is topology
+    version = mesh.version
+    mesh.collapse_quads_to_trias()
+    assert mesh.version != version
+    assert mesh.edges is not edges and mesh.edges.counts.size == 6
+    mesh.remove_duplicate_grids()
+    assert mesh.topology is not topology and mesh.topology.num_grids == 4
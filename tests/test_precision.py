@@ -0,0 +1,63 @@
+from numpy import asarray, float32, float64, linspace
+from pytest import raises
+
+from pygeom.geom3d import NurbsCurve, NurbsSurface, Vector
+from pygeom.geom3d.lines import Lines
+from pygeom.geom3d.tools import intersection_lines_and_triangles
+from pygeom.geom3d.triangles import Triangles
+from pygeom.tools.evalplan import NurbsCurvePlan
+from pygeom.tools.precision import float_dtype, get_float_dtype, set_float_dtype
+
+x = asarray([0.0, 1.0, 2.0, 3.0, 4.0])
+y = asarray([0.0, 1.0, 0.5, -0.5, 1.0])
+z = asarray([0.0, 0.2, 0.4, 0.2, 0.0])
+weights = asarray([1.0, 0.8, 1.2, 1.0, 0.9])
+
+def test_float_dtype_context():
+    with float_dtype('float32'):
+        assert get_float_dtype() == float32
+        assert Vector.zeros((3, )).dtype == float32
+    assert get_float_dtype() == float64
+    assert Vector.zeros((3, )).dtype == float64
+    with raises(ValueError):
+        set_float_dtype('int32')
+
+def test_float32_curve():
+    ctlpnts = Vector(x, y, z).astype(float32)
+    curve = NurbsCurve(ctlpnts, weights=weights.astype(float32), degree=3)
+    segcurve = NurbsCurve(ctlpnts, weights=weights.astype(float32), degree=3,
+                          segmented=True)
+    refcurve = NurbsCurve(Vector(x, y, z), weights=weights, degree=3)
+    u = linspace(0.0, 1.0, 21)
+    pnts = curve.evaluate_points_at_t(u)
+    assert pnts.dtype == float32
+    assert pnts.all_close(refcurve.evaluate_points_at_t(u), atol=1e-5)
+    ders = segcurve.evaluate_derivatives_at_t(u, 1)
+    assert ders[0].dtype == float32 and ders[1].dtype == float32
+
+def test_float32_surface():
+    ctlpnts = Vector.zeros((3, 3), dtype=float32)
+    ctlpnts.x[...] = asarray([0.0, 1.0, 2.0], dtype=float32)[:, None]
+    ctlpnts.y[...] = asarray([0.0, 1.0, 2.0], dtype=float32)[None, :]
+    surface = NurbsSurface(ctlpnts, udegree=2, vdegree=2)
+    assert surface.weights.dtype == float32
+    pnts = surface.evaluate_points(4, 4)
+    assert pnts.dtype == float32
+
+def test_float32_plan_and_triangles():
+    ctlpnts = Vector(x, y, z).astype(float32)
+    curve = NurbsCurve(ctlpnts, weights=weights.astype(float32), degree=3)
+    plan = NurbsCurvePlan.from_curve(curve, linspace(0.0, 1.0, 11))
+    assert plan.u.dtype == float32 and plan.operator().dtype == float32
+    assert plan.evaluate_points(curve).dtype == float32
+    with float_dtype('float32'):
+        assert NurbsCurvePlan(3, [0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0],
+                              [0.5]).u.dtype == float32
+    pnta = Vector(asarray([0.0]), asarray([0.0]), asarray([0.0])).astype(float32)
+    pntb = Vector(asarray([1.0]), asarray([0.0]), asarray([0.0])).astype(float32)
+    pntc = Vector(asarray([0.0]), asarray([1.0]), asarray([0.0])).astype(float32)
+    triangles = Triangles(pnta, pntb, pntc)
+    lines = Lines(Vector(asarray([0.2]), asarray([0.2]), asarray([-1.0])).astype(float32),
+                  Vector(asarray([0.2]), asarray([0.2]), asarray([1.0])).astype(float32))
+    pnts, inds = intersection_lines_and_triangles(lines, triangles)
+    assert pnts.dtype == float32 and inds.shape == (1, 2)
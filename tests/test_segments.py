@@ -0,0 +1,36 @@
+from numpy import asarray, linspace
+
+from pygeom.geom2d import BSplineCurve2D, NurbsCurve2D, Vector2D
+from pygeom.geom3d import NurbsCurve, Vector
+
+ctlpnts = Vector(asarray([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+                 asarray([0.0, 1.0, 0.5, -0.5, 1.0, 0.0, 0.5]),
+                 asarray([0.0, 0.2, 0.4, 0.2, 0.0, 0.1, 0.0]))
+weights = asarray([1.0, 0.8, 1.2, 1.0, 0.9, 1.0, 1.1])
+knots = asarray([0.0, 0.2, 0.5, 0.5, 1.0])
+
+curve = NurbsCurve(ctlpnts, weights=weights, degree=3, knots=knots)
+segcurve = NurbsCurve(ctlpnts, weights=weights, degree=3, knots=knots,
+                      segmented=True)
+u = linspace(0.0, 1.0, 41)
+
+def test_segmented_points():
+    pnts = segcurve.evaluate_points_at_t(u)
+    assert pnts.all_close(curve.evaluate_points_at_t(u), atol=1e-12)
+
+def test_segmented_derivatives():
+    ders = segcurve.evaluate_derivatives_at_t(u, 2)
+    refs = curve.evaluate_derivatives_at_t(u, 2)
+    for der, ref in zip(ders, refs):
+        assert der.all_close(ref, rtol=1e-9, atol=1e-9)
+
+def test_segment_count():
+    assert segcurve.segments.numseg == 3
+
+def test_segmented_copy():
+    copy = segcurve.copy()
+    assert copy.segmented and not curve.copy().segmented
+    assert copy.evaluate_points_at_t(u).all_close(curve.evaluate_points_at_t(u), atol=1e-12)
+    ctlpnts2d = Vector2D(ctlpnts.x, ctlpnts.y)
+    assert NurbsCurve2D(ctlpnts2d, degree=3, segmented=True).copy().segmented
+    assert BSplineCurve2D(ctlpnts2d, degree=3, segmented=True).copy().segmented
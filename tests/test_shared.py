@@ -0,0 +1,25 @@
+from pickle import dumps, loads
+
+from numpy import arange, shares_memory
+
+from pygeom.geom3d import NurbsCurve, Vector
+from pygeom.tools.shared import release, share
+
+vec = Vector(arange(6.0), arange(6.0) + 1.0, arange(6.0) + 2.0)
+
+def test_vector_pickle_out_of_band():
+    buffers = []
+    data = dumps(vec, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    pvec = loads(data, buffers=buffers)
+    assert pvec.interleaved and pvec.is_close(vec).all()
+
+def test_shared_object():
+    curve = NurbsCurve(vec, degree=3)
+    handle = loads(dumps(share(curve)))
+    scurve = handle.load()
+    assert scurve.ctlpnts.is_close(vec).all()
+    assert shares_memory(scurve.ctlpnts.x, handle.load().ctlpnts.x)
+    del scurve
+    handle.unlink()
+    release(handle.name)
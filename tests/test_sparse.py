@@ -0,0 +1,49 @@
+from numpy import asarray, concatenate, linspace, zeros
+from numpy.random import default_rng
+from pytest import raises
+
+from pygeom.geom2d import Tensor2D
+from pygeom.geom3d import NurbsCurve, Vector
+from pygeom.tools.basis import basis_functions_sparse, basis_sparse_to_csr
+from pygeom.tools.sparse import CSRMatrix
+
+rng = default_rng(3)
+arr = rng.normal(size=(6, 5))
+arr[arr < 0.5] = 0.0
+mat = CSRMatrix.from_dense(arr)
+
+def test_csr_products():
+    vec = Vector(*rng.normal(size=(3, 5)))
+    assert abs((mat@vec).y - arr@vec.y).max() < 1e-12
+    assert abs(vec.rmatmul(mat).z - arr@vec.z).max() < 1e-12
+    lvec = Vector(*rng.normal(size=(3, 4, 6)))
+    assert abs((lvec@mat).x - lvec.x@arr).max() < 1e-12
+    mvec = Vector(mat, 2.0*mat, -mat)
+    assert abs(mvec.matdot(vec) - (arr@vec.x + 2.0*arr@vec.y - arr@vec.z)).max() < 1e-12
+    tens = Tensor2D(*rng.normal(size=(4, 3, 6)))
+    assert abs((tens@mat).yy - tens.yy@arr).max() < 1e-12
+    assert abs(mat.T.toarray() - arr.T).max() == 0.0
+
+def test_basis_csr():
+    ctlpnts = Vector(*rng.normal(size=(3, 7)))
+    curve = NurbsCurve(ctlpnts, degree=3)
+    knots = concatenate(([0.0]*3, curve.knots, [1.0]*3))
+    u = linspace(0.0, 1.0, 25)
+    Nu, span = basis_functions_sparse(3, knots, u)
+    basis = basis_sparse_to_csr(7, Nu, span)
+    assert basis.nnz <= 4*u.size
+    assert (basis@ctlpnts).all_close(curve.evaluate_points_at_t(u), atol=1e-12)
+
+def test_csr_from_coo_empty():
+    empty = CSRMatrix.from_coo(zeros(0, dtype=int), zeros(0, dtype=int), zeros(0), (3, 4))
+    assert empty.nnz == 0 and (empty.indptr == 0).all()
+    assert (empty.toarray() == 0.0).all() and empty.T.shape == (4, 3)
+    assert (empty@linspace(0.0, 1.0, 4) == 0.0).all()
+
+def test_csr_scalar_products():
+    assert abs((mat*2.0).toarray() - 2.0*arr).max() == 0.0
+    assert abs((asarray(3.0)*mat).toarray() - 3.0*arr).max() == 0.0
+    with raises(TypeError):
+        mat*arr
+    with raises(TypeError):
+        arr*mat
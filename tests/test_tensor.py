@@ -0,0 +1,53 @@
+from numpy import diag, diff, einsum, eye, stack
+from numpy.linalg import det, eigh, inv, qr, solve
+from numpy.random import default_rng
+
+from pygeom.geom2d import Tensor2D, Vector2D
+from pygeom.geom3d import Tensor, Vector
+
+rng = default_rng(1)
+arr = rng.normal(size=(50, 3, 3))
+tensor = Tensor.from_array(arr)
+
+def test_tensor_det_inverse_solve():
+    assert abs(tensor.det() - det(arr)).max() < 1e-12
+    assert abs(tensor.inverse().as_array() - inv(arr)).max() < 1e-9
+    rhs = rng.normal(size=(50, 3))
+    vec = tensor.solve(Vector.from_xyz_array(rhs))
+    assert abs(vec.stack_xyz() - solve(arr, rhs[..., None])[..., 0]).max() < 1e-9
+    assert abs((tensor@tensor.inverse()).as_array() - eye(3)).max() < 1e-9
+
+def test_tensor_eigh():
+    sym = arr + arr.transpose((0, 2, 1))
+    sym[0] = diag([1.0, 1.0, 2.0])
+    sym[1] = 3.0*eye(3)
+    sym[2] = 0.0
+    evals, evecs = Tensor.from_array(sym).eigh()
+    assert abs(evals.stack_xyz() - eigh(sym)[0]).max() < 1e-12
+    vecs = evecs.as_array()
+    resid = einsum('nij,nkj->nki', sym, vecs) - evals.stack_xyz()[..., None]*vecs
+    assert abs(resid).max() < 1e-12
+    assert abs(einsum('nij,nkj->nik', vecs, vecs) - eye(3)).max() < 1e-12
+
+def test_tensor_eigh_near_repeated():
+    rot = qr(rng.normal(size=(200, 3, 3)))[0]
+    vals = stack([rng.permutation([1.0, 1.0 + 1e-9, 2.0]) for _ in range(200)])
+    sym = einsum('nij,nj,nkj->nik', rot, vals, rot)
+    sym = (sym + sym.transpose((0, 2, 1)))/2
+    evals, evecs = Tensor.from_array(sym).eigh()
+    evals = evals.stack_xyz()
+    assert (diff(evals, axis=-1) >= 0.0).all()
+    assert abs(evals - eigh(sym)[0]).max() < 1e-12
+    vecs = evecs.as_array()
+    resid = einsum('nij,nkj->nki', sym, vecs) - evals[..., None]*vecs
+    assert abs(resid).max() < 1e-12
+    assert abs(einsum('nij,nkj->nik', vecs, vecs) - eye(3)).max() < 1e-12
+
+def test_tensor2d_inverse_solve():
+    arr2 = rng.normal(size=(20, 2, 2))
+    tensor2d = Tensor2D.from_array(arr2)
+    assert abs(tensor2d.det() - det(arr2)).max() < 1e-12
+    assert abs(tensor2d.inverse().as_array() - inv(arr2)).max() < 1e-9
+    rhs = rng.normal(size=(20, 2))
+    vec = tensor2d.solve(Vector2D.from_xy_array(rhs))
+    assert abs(vec.as_xy_array() - solve(arr2, rhs[..., None])[..., 0]).max() < 1e-9
@@ -0,0 +1,76 @@
+from numpy import asarray, concatenate, cos, linspace, ones, pi, sin, sort, sqrt, unique
+
+from pygeom.geom2d import NurbsCurve2D, RationalBezierCurve2D, Vector2D
+from pygeom.geom3d import (BezierCurve, NurbsCurve, NurbsSurface, ParamSurface,
+                           RationalBezierSurface, Vector)
+from pygeom.geom3d.beziersurface import BezierSurface
+
+
+def test_curve_tessellate_chord_height():
+    ctlpnts = Vector2D(asarray([1.0, 1.0, 0.0]), asarray([0.0, 1.0, 1.0]))
+    weights = asarray([1.0, sqrt(0.5), 1.0])
+    curve = NurbsCurve2D(ctlpnts, weights=weights, degree=2)
+    pnts = curve.evaluate_points_adaptive(1e-4)
+    assert (abs(pnts.return_magnitude() - 1.0) < 1e-12).all()
+    chord = (pnts[1:] + pnts[:-1])/2
+    assert (1.0 - chord.return_magnitude() < 1e-4).all()
+    angle = pnts.return_angle()
+    assert ((angle[1:] - angle[:-1]) > 0.0).all()
+    coarse = curve.evaluate_points_at_t(curve.evaluate_t_adaptive(1.0, angtol=0.1))
+    angle = coarse.return_angle()
+    assert ((angle[1:] - angle[:-1]) <= 0.2).all()
+
+def test_surface_tessellate_balanced_mesh():
+    uc = linspace(0.0, 1.0, 4)
+    x, y = uc[:, None] + 0.0*uc, 0.0*uc[:, None] + uc
+    weights = ones((4, 4))
+    weights[1, 2] = 3.0
+    surface = NurbsSurface(Vector(x, y, x*(1.0 - y) + 0.5*x**2*y), weights=weights)
+    mesh = surface.evaluate_mesh_adaptive(1e-3)
+    assert mesh.trias.grids.shape[0] > 0 and mesh.quads.grids.shape[0] > 0
+    edges = [mesh.quads.grids[:, [k, (k + 1) % 4]] for k in range(4)]
+    edges += [mesh.trias.grids[:, [k, (k + 1) % 3]] for k in range(3)]
+    edges = sort(concatenate(edges), axis=1)
+    _, counts = unique(edges, axis=0, return_counts=True)
+    assert counts.max() == 2
+    vecs = mesh.grids.vecs
+    single = unique(edges, axis=0)[counts == 1]
+    onedge = (vecs[single, 0] % 1.0 == 0.0).all(axis=1) | \
+             (vecs[single, 1] % 1.0 == 0.0).all(axis=1)
+    assert onedge.all()
+
+def test_param_surface_tessellate_sphere():
+    surface = ParamSurface(lambda u, v: Vector(cos(pi*u)*cos(pi*v/2),
+                                               sin(pi*u)*cos(pi*v/2),
+                                               sin(pi*v/2)))
+    mesh = surface.evaluate_mesh_adaptive(1e-3, numu=3, numv=3)
+    radius = (mesh.grids.vecs**2).sum(axis=1)**0.5
+    assert (abs(radius - 1.0) < 1e-12).all()
+
+def test_bezier_curve_tessellate():
+    ctlpnts = Vector2D(asarray([1.0, 1.0, 0.0]), asarray([0.0, 1.0, 1.0]))
+    curve = RationalBezierCurve2D(ctlpnts, asarray([1.0, sqrt(0.5), 1.0]))
+    pnts = curve.evaluate_points_adaptive(1e-4)
+    assert (abs(pnts.return_magnitude() - 1.0) < 1e-12).all()
+    assert (1.0 - ((pnts[1:] + pnts[:-1])/2).return_magnitude() < 1e-4).all()
+    ctlpnts = Vector(asarray([0.0, 1.0, 2.0, 3.0]), asarray([0.0, 2.0, -2.0, 0.0]),
+                     asarray([0.0, 1.0, 1.0, 0.0]))
+    t = BezierCurve(ctlpnts).evaluate_t_adaptive(1e-3, angtol=0.1, num=5)
+    expect = NurbsCurve(ctlpnts, degree=3).evaluate_t_adaptive(1e-3, angtol=0.1)
+    assert t.size > 5 and (t == expect).all()
+
+def test_bezier_surface_tessellate():
+    uc = linspace(0.0, 1.0, 3)
+    vc = linspace(0.0, 1.0, 4)
+    x, y = uc[:, None] + 0.0*vc, 0.0*uc[:, None] + vc
+    ctlpnts = Vector(x, y, x*(1.0 - y) + 0.5*x**2*y)
+    weights = ones((3, 4))
+    weights[1, 2] = 3.0
+    for surface, nurbs in ((BezierSurface(ctlpnts), NurbsSurface(ctlpnts)),
+                           (RationalBezierSurface(ctlpnts, weights),
+                            NurbsSurface(ctlpnts, weights=weights))):
+        mesh = surface.evaluate_mesh_adaptive(1e-3, numu=3, numv=3)
+        expect = nurbs.evaluate_mesh_adaptive(1e-3)
+        assert (mesh.quads.grids == expect.quads.grids).all()
+        assert (mesh.trias.grids == expect.trias.grids).all()
+        assert abs(mesh.grids.vecs - expect.grids.vecs).max() < 1e-12
@@ -1,4 +1,5 @@
-from numpy import isclose, sqrt
+from numpy import (add, arange, concatenate, empty, isclose, searchsorted,
+                   shares_memory, sqrt, take, where, zeros)
 
 from pygeom.geom3d import Vector
 
@@ -61,3 +62,72 @@ def test_vector_equality():
 
 def test_vector_inequality():
     assert vec1 != vec2
+
+def test_vector_xyz_array():
+    xyz = arange(24.0).reshape((4, 2, 3))
+    vec = Vector.from_xyz_array(xyz)
+    assert vec.interleaved and shares_memory(vec.x, xyz)
+    assert vec.as_xyz_array().base is not None
+    assert (vec.as_xyz_array() == xyz).all()
+    assert vec[1:3].interleaved and vec.ravel().interleaved
+    assert vec[vec.x > 6.0].interleaved
+    vec[0] = Vector(-1.0, -2.0, -3.0)
+    assert (xyz[0] == [-1.0, -2.0, -3.0]).all()
+    assert not Vector(xyz[..., 0].copy(), vec.y, vec.z).interleaved
+    pnt = vec[1, 0]
+    pnt += Vector(10.0, 10.0, 10.0)
+    assert (xyz[1, 0] == [6.0, 7.0, 8.0]).all()
+    flat = arange(12.0)
+    assert not Vector(flat[:-2], flat[1:-1], flat[2:]).interleaved
+
+def test_vector_inplace_and_out():
+    vec = Vector(arange(4.0), arange(4.0) + 1.0, zeros(4))
+    xarr = vec.x
+    vec += Vector(1.0, 1.0, 1.0)
+    vec *= 2.0
+    vec -= Vector(2.0, 2.0, 2.0)
+    vec /= 2.0
+    assert vec.x is xarr
+    assert vec.is_close(Vector(arange(4.0), arange(4.0) + 1.0, zeros(4)), atol=1e-12).all()
+    out = empty(4)
+    assert vec.dot(vec, out=out) is out
+    assert isclose(vec.return_magnitude(out=out), vec.return_magnitude()).all()
+    unit = Vector(empty(4), empty(4), empty(4))
+    assert vec.to_unit(out=unit) is unit
+    assert unit.is_close(vec.to_unit(), atol=1e-12).all()
+    other = Vector(zeros(4), zeros(4), arange(4.0))
+    cross = vec.cross(other)
+    assert vec.cross(other, out=unit).is_close(cross, atol=1e-12).all()
+    vec.cross(other, out=vec)
+    assert vec.is_close(cross, atol=1e-12).all()
+    vec = Vector(arange(4.0), arange(4.0) + 1.0, zeros(4))
+    cross = vec.cross(other)
+    vec.cross(other, out=Vector(vec.x, vec.y, vec.z))
+    assert vec.is_close(cross, atol=1e-12).all()
+    vec = Vector(arange(4.0), arange(4.0) + 1.0, zeros(4))
+    other.cross(vec, out=vec[:])
+    assert vec.is_close(-cross, atol=1e-12).all()
+
+def test_vector_numpy_protocols():
+    vec = Vector(arange(4.0), arange(4.0) + 1.0, zeros(4))
+    assert sqrt(vec).is_close(Vector(sqrt(vec.x), sqrt(vec.y), 0.0*vec.z)).all()
+    out = Vector.zeros(4)
+    assert add(vec, vec, out=out) is out
+    assert out.is_close(vec*2.0).all()
+    assert (arange(4.0) + vec).is_close(Vector(2*vec.x, vec.y + vec.x, vec.x)).all()
+    assert add.reduce(vec).is_close(vec.sum()).all()
+    assert concatenate((vec, vec)).shape == (8, )
+    assert take(vec, [3, 0]).is_close(vec[[3, 0]]).all()
+    pick = where(vec.x > 1.5, vec, Vector(-1.0, -1.0, -1.0))
+    assert (pick.x == [-1.0, -1.0, 2.0, 3.0]).all()
+    bins = searchsorted([0.5, 2.5], vec)
+    assert (bins.x == [0, 1, 1, 2]).all() and (bins.y == [1, 1, 2, 2]).all()
+
+def test_vector_save_load(tmp_path):
+    vec = Vector(arange(6.0), arange(6.0) + 1.0, arange(6.0) + 2.0)
+    file = tmp_path / 'vec.npy'
+    vec.save(file)
+    mvec = Vector.load(file, mmap_mode='r')
+    assert mvec.interleaved and not mvec.x.flags.writeable
+    assert mvec[2:4].is_close(vec[2:4]).all()
+    assert Vector.load(file).is_close(vec).all()
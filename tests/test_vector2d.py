@@ -1,4 +1,4 @@
-from numpy import isclose, sqrt
+from numpy import arange, isclose, shares_memory, sqrt
 
 from pygeom.geom2d import Vector2D
 
@@ -57,3 +57,30 @@ def test_vector_equality():
 
 def test_vector_inequality():
     assert vec1 != Vector2D(x1, y1 + 1)
+
+def test_vector_xy_array():
+    xy = arange(12.0).reshape((6, 2))
+    vec = Vector2D.from_xy_array(xy)
+    assert vec.interleaved and shares_memory(vec.y, xy)
+    assert (vec.reshape((2, 3)).as_xy_array() == xy.reshape((2, 3, 2))).all()
+    assert not (vec*2.0).interleaved
+    pnt = vec[2]
+    pnt += Vector2D(10.0, 10.0)
+    assert (xy[2] == [4.0, 5.0]).all()
+    flat = arange(12.0)
+    assert not Vector2D(flat[:-1], flat[1:]).interleaved
+
+def test_vector_save_load(tmp_path):
+    vec = Vector2D(arange(6.0), arange(6.0) + 1.0)
+    file = tmp_path / 'vec.npy'
+    vec.save(file)
+    mvec = Vector2D.load(file, mmap_mode='r')
+    assert mvec.interleaved
+    assert (mvec[2:4].as_xy_array() == vec[2:4].as_xy_array()).all()
+
+def test_vector_cross_out():
+    vec = Vector2D(arange(4.0), arange(4.0) + 1.0)
+    other = Vector2D(arange(4.0)[::-1], arange(4.0)*2.0)
+    cross = vec.cross(other)
+    assert vec.cross(other, out=vec.y) is vec.y
+    assert (vec.y == cross).all()